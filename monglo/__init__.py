@@ -38,8 +38,13 @@ from .operations.aggregations import AggregationOperations
 
 # Operations exports
 from .operations.crud import CRUDOperations
-from .operations.export import ExportFormat, ExportOperations, export_collection
-from .operations.pagination import PaginationHandler, PaginationStrategy
+from .operations.export import ExportFormat, ExportOperations, export_collection, stream_export
+from .operations.pagination import (
+    CursorPaginationMeta,
+    PaginationHandler,
+    PaginationMeta,
+    PaginationStrategy,
+)
 
 # Serializers exports
 from .serializers import DocumentSerializer, JSONSerializer, TableSerializer
@@ -81,9 +86,12 @@ __all__ = [
     "CRUDOperations",
     "PaginationHandler",
     "PaginationStrategy",
+    "PaginationMeta",
+    "CursorPaginationMeta",
     "ExportOperations",
     "ExportFormat",
     "export_collection",
+    "stream_export",
     "AggregationOperations",
     # Views
     "BaseView",
@@ -0,0 +1,10 @@
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+# Bounded so patterns taken from user input can't grow the cache without limit
+@lru_cache(maxsize=1024)
+def get(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    return re.compile(pattern, flags)
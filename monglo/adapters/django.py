@@ -19,7 +19,7 @@ def create_django_urls(engine: MongloEngine, prefix: str = "api/admin"):
             collections = []
             
             for name, admin in engine.registry._collections.items():
-                count = await admin.collection.count_documents({})
+                count = await admin.collection.estimated_document_count()
                 collections.append({
                     "name": name,
                     "display_name": admin.display_name,
@@ -21,7 +21,7 @@ def create_starlette_routes(
         collections = []
         
         for name, admin in engine.registry._collections.items():
-            count = await admin.collection.count_documents({})
+            count = await admin.collection.estimated_document_count()
             collections.append({
                 "name": name,
                 "display_name": admin.display_name,
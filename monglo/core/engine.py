@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Literal
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
@@ -9,6 +10,9 @@ from .introspection import SchemaIntrospector
 from .registry import CollectionAdmin, CollectionRegistry
 from .relationships import RelationshipDetector
 
+# Concurrent pings initialize() sends so the pool already holds open connections
+POOL_PREWARM_CONNECTIONS = 4
+
 class MongloEngine:
 
     def __init__(
@@ -18,9 +22,11 @@ class MongloEngine:
         auto_discover: bool = False,
         relationship_detection: Literal["auto", "manual", "off"] = "auto",
         excluded_collections: list[str] | None = None,
+        prewarm_connections: int = POOL_PREWARM_CONNECTIONS,
     ) -> None:
         self.database = database
         self.auto_discover = auto_discover
+        self._prewarm_connections = prewarm_connections
         self._relationship_detection = relationship_detection
         self._excluded_collections = set(excluded_collections or [])
 
@@ -34,6 +40,13 @@ class MongloEngine:
         if self._initialized:
             return
 
+        # Pay connection setup and TLS handshakes at startup rather than on the
+        # first requests; pass prewarm_connections=0 to skip it (e.g. serverless)
+        if self._prewarm_connections > 0:
+            await asyncio.gather(
+                *(self.database.command("ping") for _ in range(self._prewarm_connections))
+            )
+
         # Auto-discover collections if enabled
         if self.auto_discover:
             await self._discover_collections()
@@ -50,6 +63,12 @@ class MongloEngine:
 
         self._initialized = True
 
+    async def close(self) -> None:
+        # Flush and stop the background writers of audit loggers on this database
+        from ..operations.audit import AuditLogger
+
+        await AuditLogger.close_all(self.database)
+
     async def register_collection(
         self, name: str, *, config: CollectionConfig | None = None
     ) -> CollectionAdmin:
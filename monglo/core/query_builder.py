@@ -1,10 +1,14 @@
 
 import re
+from collections.abc import Sequence
 from typing import Any
 
-from bson import ObjectId
+from bson import ObjectId, Regex
 from bson import errors as bson_errors
 
+# Default sort spec; immutable, so build_sort can hand the same one to every caller
+_DEFAULT_SORT: tuple[tuple[str, int], ...] = (("_id", 1),)
+
 class QueryBuilder:
 
     @staticmethod
@@ -51,21 +55,32 @@ class QueryBuilder:
         return query
 
     @staticmethod
-    def build_search_query(search: str, fields: list[str]) -> dict[str, Any]:
-        if not search or not fields:
+    def build_search_query(
+        search: str, fields: list[str], use_text_index: bool = False
+    ) -> dict[str, Any]:
+        if not search:
+            return {}
+
+        # A text index answers the search with an index lookup instead of N regex scans
+        if use_text_index:
+            return {"$text": {"$search": search}}
+
+        if not fields:
             return {}
 
-        # Escape special regex characters
-        escaped_search = re.escape(search)
+        # Escape special regex characters; one pattern is shared by every branch
+        pattern = Regex(re.escape(search), "i")
 
-        or_conditions = [{field: {"$regex": escaped_search, "$options": "i"}} for field in fields]
+        or_conditions = [{field: pattern} for field in fields]
 
         return {"$or": or_conditions}
 
     @staticmethod
-    def build_sort(sort: list[tuple[str, int]] | None = None) -> list[tuple[str, int]]:
+    def build_sort(
+        sort: Sequence[tuple[str, int]] | None = None,
+    ) -> Sequence[tuple[str, int]]:
         if not sort:
-            return [("_id", 1)]  # Default sort by _id
+            return _DEFAULT_SORT  # Default sort by _id
 
         return sort
 
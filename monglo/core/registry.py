@@ -6,21 +6,29 @@ from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
 from .config import CollectionConfig
 from .relationships import Relationship
 
-@dataclass
+@dataclass(slots=True)
 class CollectionAdmin:
 
     name: str
     database: AsyncIOMotorDatabase
     config: CollectionConfig
     relationships: list[Relationship] = field(default_factory=list)
+    _collection: AsyncIOMotorCollection | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _display_name: str | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def collection(self) -> AsyncIOMotorCollection:
-        return self.database[self.name]
+        if self._collection is None:
+            self._collection = self.database[self.name]
+        return self._collection
 
     @property
     def display_name(self) -> str:
-        return self.config.display_name or self.name.replace("_", " ").title()
+        if self._display_name is None:
+            self._display_name = self.config.display_name or self.name.replace("_", " ").title()
+        return self._display_name
 
     def get_relationship(self, field: str) -> Relationship | None:
         for rel in self.relationships:
@@ -30,6 +38,8 @@ class CollectionAdmin:
 
 class CollectionRegistry:
 
+    __slots__ = ("_collections", "_database")
+
     def __init__(self, database: AsyncIOMotorDatabase) -> None:
         self._collections: dict[str, CollectionAdmin] = {}
         self._database = database
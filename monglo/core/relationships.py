@@ -1,11 +1,34 @@
 
+import asyncio
+import time
+import weakref
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
+from dataclasses import field as dc_field
 from enum import Enum
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any
 
 from bson import DBRef, ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+# Max reference values per $in query; larger sets are split and fetched concurrently
+IN_QUERY_CHUNK_SIZE = 500
+
+# Seconds a database's collection names stay cached for every detector in the process
+COLLECTION_CACHE_TTL = 60.0
+
+# database -> (collection names, time.monotonic() when fetched); weakly keyed so
+# entries go away with the client that owns the database
+_COLLECTION_CACHE: weakref.WeakKeyDictionary[
+    AsyncIOMotorDatabase, tuple[set[str], float]
+] = weakref.WeakKeyDictionary()
+_PENDING_COLLECTION_NAMES: weakref.WeakKeyDictionary[
+    AsyncIOMotorDatabase, asyncio.Future[set[str]]
+] = weakref.WeakKeyDictionary()
+
 class RelationshipType(Enum):
 
     ONE_TO_ONE = "one_to_one"
@@ -13,26 +36,60 @@ class RelationshipType(Enum):
     MANY_TO_MANY = "many_to_many"
     EMBEDDED = "embedded"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Relationship:
 
     source_collection: str
     source_field: str
     target_collection: str
     target_field: str = "_id"
-    type: RelationshipType = RelationshipType.ONE_TO_ONE
-    reverse_name: str | None = None
+    # Identity is the source/target pair; the fields below don't affect eq/hash
+    type: RelationshipType = dc_field(default=RelationshipType.ONE_TO_ONE, compare=False)
+    reverse_name: str | None = dc_field(default=None, compare=False)
+    projection: dict[str, int] | None = dc_field(
+        default=None, compare=False
+    )  # Fields to fetch from the target collection
+    _hash: int = dc_field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Hash once; sets and dicts of relationships then compare ints before strings
+        object.__setattr__(
+            self,
+            "_hash",
+            hash(
+                (
+                    self.source_collection,
+                    self.source_field,
+                    self.target_collection,
+                    self.target_field,
+                )
+            ),
+        )
 
     def __hash__(self) -> int:
-        return hash(
-            (self.source_collection, self.source_field, self.target_collection, self.target_field)
+        return self._hash
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Rebuild through __init__ so _hash matches the unpickling process's str hashing
+        return (
+            self.__class__,
+            (
+                self.source_collection,
+                self.source_field,
+                self.target_collection,
+                self.target_field,
+                self.type,
+                self.reverse_name,
+                self.projection,
+            ),
         )
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Relationship):
             return NotImplemented
         return (
-            self.source_collection == other.source_collection
+            self._hash == other._hash
+            and self.source_collection == other.source_collection
             and self.source_field == other.source_field
             and self.target_collection == other.target_collection
             and self.target_field == other.target_field
@@ -52,7 +109,7 @@ class RelationshipDetector:
     ) -> list[Relationship]:
         # Populate collection cache
         if not self._collection_cache:
-            self._collection_cache = set(await self.db.list_collection_names())
+            self._collection_cache = await self._get_collection_names()
 
         relationships: list[Relationship] = []
 
@@ -77,6 +134,32 @@ class RelationshipDetector:
 
         return relationships
 
+    async def _get_collection_names(self) -> set[str]:
+        cached = _COLLECTION_CACHE.get(self.db)
+        if cached is not None and time.monotonic() - cached[1] < COLLECTION_CACHE_TTL:
+            return cached[0]
+
+        # Concurrent detect() calls share one in-flight list_collection_names
+        # A future from another event loop can't be awaited here, so it is replaced
+        pending = _PENDING_COLLECTION_NAMES.get(self.db)
+        if pending is None or pending.get_loop() is not asyncio.get_running_loop():
+            pending = asyncio.ensure_future(self._fetch_collection_names())
+            _PENDING_COLLECTION_NAMES[self.db] = pending
+            pending.add_done_callback(self._forget_pending)
+
+        # Shield so one cancelled caller doesn't cancel the fetch for the others
+        return await asyncio.shield(pending)
+
+    def _forget_pending(self, future: asyncio.Future[set[str]]) -> None:
+        if _PENDING_COLLECTION_NAMES.get(self.db) is future:
+            del _PENDING_COLLECTION_NAMES[self.db]
+
+    async def _fetch_collection_names(self) -> set[str]:
+        now = time.monotonic()
+        names = set(await self.db.list_collection_names())
+        _COLLECTION_CACHE[self.db] = (names, now)
+        return names
+
     def _detect_in_document(
         self, collection_name: str, document: dict[str, Any]
     ) -> list[Relationship]:
@@ -84,7 +167,7 @@ class RelationshipDetector:
 
         for field, value in document.items():
             # Skip _id field
-            if field == "_id":
+            if field in _SKIPPED_FIELDS:
                 continue
 
             # Strategy 1: Naming convention (user_id → users)
@@ -107,66 +190,95 @@ class RelationshipDetector:
                     )
                     continue
 
-            # Strategy 2: ObjectId type detection
-            if isinstance(value, ObjectId):
-                # Try to find which collection this ID might belong to
-                # For now, use naming convention as fallback
-                if not field.endswith("_id"):
-                    # Could be author, creator, etc.
-                    target = self._pluralize(field)
-                    if target in self._collection_cache:
-                        relationships.append(
-                            Relationship(
-                                source_collection=collection_name,
-                                source_field=field,
-                                target_collection=target,
-                                target_field="_id",
-                                type=RelationshipType.ONE_TO_ONE,
-                            )
-                        )
+            # Strategies 2-6 depend on the value type; dispatch once instead of an isinstance chain
+            handler = _value_handler(type(value))
+            if handler is not None:
+                handler(self, collection_name, field, value, relationships)
 
-            # Strategy 3: Array of ObjectIds
-            elif isinstance(value, list) and value and isinstance(value[0], ObjectId):
-                target = self._guess_collection_from_field(field)
-                if target in self._collection_cache:
-                    relationships.append(
-                        Relationship(
-                            source_collection=collection_name,
-                            source_field=field,
-                            target_collection=target,
-                            target_field="_id",
-                            type=RelationshipType.ONE_TO_MANY,
-                        )
-                    )
+        return relationships
 
-            # Strategy 4: DBRef detection
-            elif isinstance(value, DBRef):
+    def _detect_object_id(
+        self,
+        collection_name: str,
+        field: str,
+        value: ObjectId,
+        relationships: list[Relationship],
+    ) -> None:
+        # Strategy 2: ObjectId type detection
+        # Try to find which collection this ID might belong to
+        # For now, use naming convention as fallback
+        if not field.endswith("_id"):
+            # Could be author, creator, etc.
+            target = self._pluralize(field)
+            if target in self._collection_cache:
                 relationships.append(
                     Relationship(
                         source_collection=collection_name,
                         source_field=field,
-                        target_collection=value.collection,
+                        target_collection=target,
                         target_field="_id",
                         type=RelationshipType.ONE_TO_ONE,
                     )
                 )
-            
-            # Strategy 5: Nested arrays with embedded documents (e.g., order.items[].product_id)
-            elif isinstance(value, list) and value and isinstance(value[0], dict):
-                # Look for *_id fields in embedded documents
-                nested_rels = self._detect_nested_relationships(
-                    collection_name, field, value[0]
-                )
-                relationships.extend(nested_rels)
-            
-            # Strategy 6: Nested objects with relationships
-            elif isinstance(value, dict) and not isinstance(value, (DBRef,)):
-                nested_rels = self._detect_nested_relationships(
-                    collection_name, field, value
+
+    def _detect_list(
+        self,
+        collection_name: str,
+        field: str,
+        value: list[Any],
+        relationships: list[Relationship],
+    ) -> None:
+        if not value:
+            return
+
+        # Strategy 3: Array of ObjectIds
+        if isinstance(value[0], ObjectId):
+            target = self._guess_collection_from_field(field)
+            if target in self._collection_cache:
+                relationships.append(
+                    Relationship(
+                        source_collection=collection_name,
+                        source_field=field,
+                        target_collection=target,
+                        target_field="_id",
+                        type=RelationshipType.ONE_TO_MANY,
+                    )
                 )
-                relationships.extend(nested_rels)
 
-        return relationships
+        # Strategy 5: Nested arrays with embedded documents (e.g., order.items[].product_id)
+        elif isinstance(value[0], dict):
+            # Look for *_id fields in embedded documents
+            relationships.extend(
+                self._detect_nested_relationships(collection_name, field, value[0])
+            )
+
+    def _detect_dbref(
+        self,
+        collection_name: str,
+        field: str,
+        value: DBRef,
+        relationships: list[Relationship],
+    ) -> None:
+        # Strategy 4: DBRef detection
+        relationships.append(
+            Relationship(
+                source_collection=collection_name,
+                source_field=field,
+                target_collection=value.collection,
+                target_field="_id",
+                type=RelationshipType.ONE_TO_ONE,
+            )
+        )
+
+    def _detect_dict(
+        self,
+        collection_name: str,
+        field: str,
+        value: dict[str, Any],
+        relationships: list[Relationship],
+    ) -> None:
+        # Strategy 6: Nested objects with relationships
+        relationships.extend(self._detect_nested_relationships(collection_name, field, value))
     
     def _detect_nested_relationships(
         self, collection_name: str, parent_field: str, nested_doc: dict[str, Any]
@@ -214,25 +326,139 @@ class RelationshipDetector:
         return relationships
 
     def _guess_collection_from_field(self, field: str) -> str:
-        # Handle _ids (plural) - BUT don't use the _ids suffix as already plural
-        # Extract the base word and pluralize it properly
-        if field.endswith("_ids"):
-            base = field[:-4]  # Remove "_ids": category_ids → category
-            return self._pluralize(base)  # category → categories
-        # Handle _id (singular) - need to pluralize
-        elif field.endswith("_id"):
-            base = field[:-3]  # Remove "_id": user_id → user
-            return self._pluralize(base)  # user → users
-        else:
-            return self._pluralize(field)
+        return _guess_collection_from_field(field)
 
     def _pluralize(self, word: str) -> str:
-        if word.endswith("y") and len(word) > 1 and word[-2] not in "aeiou":
-            return f"{word[:-1]}ies"  # category → categories
-        elif word.endswith(("s", "ss", "x", "z", "ch", "sh")):
-            return f"{word}es"  # class → classes, box → boxes
-        else:
-            return f"{word}s"  # user → users
+        return _pluralize(word)
+
+_SKIPPED_FIELDS = frozenset({"_id"})
+
+# Detection handler per value type, checked in order; DBRef comes before dict
+_BASE_VALUE_HANDLERS: tuple[tuple[type, Callable[..., None]], ...] = (
+    (ObjectId, RelationshipDetector._detect_object_id),
+    (list, RelationshipDetector._detect_list),
+    (DBRef, RelationshipDetector._detect_dbref),
+    (dict, RelationshipDetector._detect_dict),
+)
+
+# Exact type -> handler (or None), filled lazily so each type pays the issubclass scan once
+_VALUE_HANDLERS: dict[type, Callable[..., None] | None] = dict(_BASE_VALUE_HANDLERS)
+
+def _value_handler(value_type: type) -> Callable[..., None] | None:
+    try:
+        return _VALUE_HANDLERS[value_type]
+    except KeyError:
+        handler = next(
+            (h for base, h in _BASE_VALUE_HANDLERS if issubclass(value_type, base)), None
+        )
+        _VALUE_HANDLERS[value_type] = handler
+        return handler
+
+@lru_cache(maxsize=1024)
+def _guess_collection_from_field(field: str) -> str:
+    # Handle _ids (plural) - BUT don't use the _ids suffix as already plural
+    # Extract the base word and pluralize it properly
+    if field.endswith("_ids"):
+        base = field[:-4]  # Remove "_ids": category_ids → category
+        return _pluralize(base)  # category → categories
+    # Handle _id (singular) - need to pluralize
+    elif field.endswith("_id"):
+        base = field[:-3]  # Remove "_id": user_id → user
+        return _pluralize(base)  # user → users
+    else:
+        return _pluralize(field)
+
+@lru_cache(maxsize=1024)
+def _pluralize(word: str) -> str:
+    if word.endswith("y") and len(word) > 1 and word[-2] not in "aeiou":
+        return f"{word[:-1]}ies"  # category → categories
+    elif word.endswith(("s", "ss", "x", "z", "ch", "sh")):
+        return f"{word}es"  # class → classes, box → boxes
+    else:
+        return f"{word}s"  # user → users
+
+def _index_by_source_field(relationships: list[Relationship]) -> dict[str, list[int]]:
+    # Positions of the relationships reading each source field
+    index: defaultdict[str, list[int]] = defaultdict(list)
+    for position, rel in enumerate(relationships):
+        index[rel.source_field].append(position)
+    return index
+
+def _merge_projections(projections: list[dict[str, int] | None]) -> dict[str, int] | None:
+    first = projections[0]
+    if all(projection == first for projection in projections):
+        return first
+
+    merged: dict[str, int] = {}
+    for projection in projections:
+        # A full fetch or an exclusion projection needs every field
+        if not projection or not all(v for k, v in projection.items() if k != "_id"):
+            return None
+        merged.update((k, 1) for k, v in projection.items() if v)
+    return merged
+
+def _ref_key(value: Any) -> Any:
+    # Hashable stand-in for a reference value; embedded documents and arrays compare by
+    # content in field order, as the server compares them
+    if isinstance(value, dict):
+        return (dict, tuple((key, _ref_key(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (list, tuple(map(_ref_key, value)))
+    return value
+
+def _projection_tree(paths: list[str]) -> dict[str, Any]:
+    # Dotted projection paths as nested dicts; True marks a projected leaf
+    tree: dict[str, Any] = {}
+    for path in paths:
+        node = tree
+        *parents, leaf = path.split(".")
+        for key in parents:
+            node = node.setdefault(key, {})
+        node[leaf] = True
+    return tree
+
+def _include(value: Any, tree: dict[str, Any]) -> Any:
+    if isinstance(value, list):
+        # Like the server, subfield projections apply to each embedded document
+        return [_include(item, tree) for item in value if isinstance(item, (dict, list))]
+    included = {}
+    for key, item in value.items():
+        subtree = tree.get(key)
+        if subtree is True:
+            included[key] = item
+        elif subtree is not None and isinstance(item, (dict, list)):
+            included[key] = _include(item, subtree)
+    return included
+
+def _exclude(value: Any, tree: dict[str, Any]) -> Any:
+    if isinstance(value, list):
+        return [_exclude(item, tree) if isinstance(item, (dict, list)) else item for item in value]
+    remaining = {}
+    for key, item in value.items():
+        subtree = tree.get(key)
+        if subtree is None or not isinstance(item, (dict, list)):
+            if subtree is not True:
+                remaining[key] = item
+        elif subtree is not True:
+            remaining[key] = _exclude(item, subtree)
+    return remaining
+
+def _projector(
+    projection: dict[str, int] | None,
+) -> Callable[[dict[str, Any]], dict[str, Any]] | None:
+    # Applies a projection client-side to a document fetched with a wider one
+    if not projection:
+        return None
+
+    included = [k for k, v in projection.items() if v and k != "_id"]
+    if included:
+        tree = _projection_tree(included)
+        if projection.get("_id", 1):
+            tree["_id"] = True
+        return lambda document: _include(document, tree)
+
+    tree = _projection_tree([k for k, v in projection.items() if not v])
+    return lambda document: _exclude(document, tree)
 
 class RelationshipResolver:
 
@@ -240,98 +466,199 @@ class RelationshipResolver:
         self.db = database
 
     async def resolve(
-        self, document: dict[str, Any], relationships: list[Relationship], depth: int = 1
+        self,
+        document: dict[str, Any],
+        relationships: list[Relationship],
+        depth: int = 1,
+        *,
+        inplace: bool = False,
+        max_related: int = 100,
     ) -> dict[str, Any]:
+        if max_related < 1:
+            # The server reads limit(0) as no limit at all
+            raise ValueError(f"max_related must be at least 1, got {max_related}")
         if depth <= 0:
             return document
 
-        resolved = document.copy()
+        # Only _relationships is added, so callers that own the document can skip the copy
+        resolved = document if inplace else document.copy()
         resolved["_relationships"] = {}
 
-        for rel in relationships:
-            if rel.source_field not in document:
-                continue
+        # Build one query per relationship, then run them concurrently
+        fetched_fields: list[str] = []
+        queries: list[Awaitable[Any]] = []
 
-            ref_value = document[rel.source_field]
-
-            # Handle one-to-one and one-to-many relationships
-            if rel.type in [RelationshipType.ONE_TO_ONE, RelationshipType.ONE_TO_MANY]:
-                if isinstance(ref_value, list):
-                    # One-to-many: fetch multiple documents
-                    related_docs = (
-                        await self.db[rel.target_collection]
-                        .find({rel.target_field: {"$in": ref_value}})
-                        .to_list(100)
-                    )  # Limit to 100 related docs
-                    resolved["_relationships"][rel.source_field] = related_docs
-                else:
-                    # One-to-one: fetch single document
-                    related_doc = await self.db[rel.target_collection].find_one(
-                        {rel.target_field: ref_value}
-                    )
-                    resolved["_relationships"][rel.source_field] = related_doc
+        relationships_by_field = _index_by_source_field(relationships)
+
+        # Only visit relationships whose source field is present in the document
+        for field, ref_value in document.items():
+            for position in relationships_by_field.get(field, ()):
+                rel = relationships[position]
+
+                # Handle one-to-one and one-to-many relationships
+                if rel.type in [RelationshipType.ONE_TO_ONE, RelationshipType.ONE_TO_MANY]:
+                    if isinstance(ref_value, list) and not ref_value:
+                        # Nothing to fetch for an empty reference array
+                        resolved["_relationships"][field] = []
+                        continue
+                    fetched_fields.append(field)
+                    queries.append(self._fetch_related(rel, ref_value, max_related))
+
+                elif rel.type == RelationshipType.EMBEDDED:
+                    # Embedded documents are already in the document
+                    resolved["_relationships"][field] = ref_value
+
+        results = await asyncio.gather(*queries)
 
-            elif rel.type == RelationshipType.EMBEDDED:
-                # Embedded documents are already in the document
-                resolved["_relationships"][rel.source_field] = ref_value
+        for source_field, related in zip(fetched_fields, results):
+            resolved["_relationships"][source_field] = related
 
         return resolved
 
+    def _fetch_related(
+        self, rel: Relationship, ref_value: Any, max_related: int
+    ) -> Awaitable[Any]:
+        collection = self.db[rel.target_collection]
+        projection = self._projection(rel)
+
+        if isinstance(ref_value, list):
+            # One-to-many: target_field need not be unique, so a reference can match several
+            # documents and only max_related bounds the result
+            return collection.find(
+                {rel.target_field: {"$in": ref_value}}, projection=projection, limit=max_related
+            ).to_list(max_related)
+
+        # One-to-one: fetch single document
+        return collection.find_one({rel.target_field: ref_value}, projection=projection)
+
+    @staticmethod
+    def _projection(rel: Relationship) -> dict[str, int] | None:
+        # Related docs are keyed by target_field, so the projection must always return it
+        projection = rel.projection
+        if not projection:
+            return projection
+
+        target = rel.target_field
+        if any(v for k, v in projection.items() if k != "_id") or target == "_id":
+            # Inclusion projection, or _id, which may be included alongside exclusions
+            if projection.get(target) != 1:
+                projection = {**projection, target: 1}
+        elif target in projection:
+            # Exclusion projection: stop excluding the key field
+            projection = {k: v for k, v in projection.items() if k != target} or None
+        return projection
+
+    async def _fetch_in(
+        self,
+        target_collection: str,
+        target_field: str,
+        ref_values: list[Any],
+        projection: dict[str, int] | None,
+    ) -> list[dict[str, Any]]:
+        collection = self.db[target_collection]
+
+        # Keep each $in list small enough to stay index-friendly
+        chunks = [
+            ref_values[start : start + IN_QUERY_CHUNK_SIZE]
+            for start in range(0, len(ref_values), IN_QUERY_CHUNK_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(
+                collection.find({target_field: {"$in": chunk}}, projection=projection).to_list(
+                    None
+                )
+                for chunk in chunks
+            )
+        )
+
+        return [doc for docs in results for doc in docs]
+
     async def resolve_batch(
-        self, documents: list[dict[str, Any]], relationships: list[Relationship], depth: int = 1
+        self,
+        documents: list[dict[str, Any]],
+        relationships: list[Relationship],
+        depth: int = 1,
+        *,
+        inplace: bool = False,
     ) -> list[dict[str, Any]]:
         if depth <= 0 or not documents:
             return documents
 
-        resolved_docs = [doc.copy() for doc in documents]
+        resolved_docs = documents if inplace else [doc.copy() for doc in documents]
 
         for doc in resolved_docs:
             doc["_relationships"] = {}
 
-        # Group relationships by target collection for batch loading
-        for rel in relationships:
-            # Collect all reference values from all documents
-            ref_values: list[Any] = []
-            doc_indices: list[int] = []
+        # Phase 1: collect the distinct reference values per relationship from all documents
+        relationships_by_field = _index_by_source_field(relationships)
 
-            for idx, doc in enumerate(documents):
-                if rel.source_field in doc:
-                    ref_val = doc[rel.source_field]
+        # Keyed by _ref_key so embedded documents and arrays are deduplicated too
+        ref_values: list[dict[Any, Any]] = [{} for _ in relationships]
+        doc_indices: list[list[int]] = [[] for _ in relationships]
+
+        for idx, doc in enumerate(documents):
+            for field, ref_val in doc.items():
+                for position in relationships_by_field.get(field, ()):
                     if isinstance(ref_val, list):
-                        ref_values.extend(ref_val)
+                        ref_values[position].update(zip(map(_ref_key, ref_val), ref_val))
                     else:
-                        ref_values.append(ref_val)
-                    doc_indices.append(idx)
+                        ref_values[position][_ref_key(ref_val)] = ref_val
+                    doc_indices[position].append(idx)
+
+        # Relationships reading the same target (e.g. created_by and updated_by -> users)
+        # share a single query over the union of their reference values
+        groups: defaultdict[tuple[str, str], list[int]] = defaultdict(list)
+        for position, rel in enumerate(relationships):
+            if ref_values[position]:
+                groups[(rel.target_collection, rel.target_field)].append(position)
+
+        queries: list[Awaitable[list[dict[str, Any]]]] = []
+        # Relationship position -> function trimming shared results to its own projection
+        trims: dict[int, Callable[[dict[str, Any]], dict[str, Any]]] = {}
+        for (target_collection, target_field), positions in groups.items():
+            group_ref_values: dict[Any, Any] = {}
+            for position in positions:
+                group_ref_values.update(ref_values[position])
+            projections = [self._projection(relationships[position]) for position in positions]
+            projection = _merge_projections(projections)
+            for position, own in zip(positions, projections):
+                trim = _projector(own) if own != projection else None
+                if trim is not None:
+                    trims[position] = trim
+            queries.append(
+                self._fetch_in(
+                    target_collection, target_field, list(group_ref_values.values()), projection
+                )
+            )
 
-            if not ref_values:
-                continue
+        # Phase 2: the target queries are independent, so issue them concurrently
+        results = await asyncio.gather(*queries)
 
-            related_docs = (
-                await self.db[rel.target_collection]
-                .find({rel.target_field: {"$in": ref_values}})
-                .to_list(1000)
-            )  # Limit to prevent memory issues
+        # Phase 3: assign related documents back to original documents
+        for ((_, target_field), positions), related_docs in zip(groups.items(), results):
+            keys = map(_ref_key, map(itemgetter(target_field), related_docs))
+            related_map = dict(zip(keys, related_docs))
 
-            related_map = {doc[rel.target_field]: doc for doc in related_docs}
+            for position in positions:
+                rel = relationships[position]
+                rel_map = related_map
+                trim = trims.get(position)
+                if trim is not None:
+                    rel_map = {key: trim(doc) for key, doc in related_map.items()}
 
-            # Assign related documents back to original documents
-            for idx in doc_indices:
-                source_doc = documents[idx]
-                if rel.source_field not in source_doc:
-                    continue
+                for idx in doc_indices[position]:
+                    source_doc = documents[idx]
+                    ref_val = source_doc[rel.source_field]
 
-                ref_val = source_doc[rel.source_field]
-
-                if isinstance(ref_val, list):
-                    # One-to-many
-                    resolved_docs[idx]["_relationships"][rel.source_field] = [
-                        related_map[val] for val in ref_val if val in related_map
-                    ]
-                else:
-                    # One-to-one
-                    if ref_val in related_map:
-                        resolved_docs[idx]["_relationships"][rel.source_field] = related_map[
-                            ref_val
+                    if isinstance(ref_val, list):
+                        # One-to-many
+                        resolved_docs[idx]["_relationships"][rel.source_field] = [
+                            rel_map[key] for key in map(_ref_key, ref_val) if key in rel_map
                         ]
+                    else:
+                        # One-to-one
+                        key = _ref_key(ref_val)
+                        if key in rel_map:
+                            resolved_docs[idx]["_relationships"][rel.source_field] = rel_map[key]
 
         return resolved_docs
@@ -2,10 +2,21 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from types import MappingProxyType
 from typing import Any
 
+def _read_only(value: Any) -> Any:
+    # Read-only view of a cached widget config, handed to every caller
+    if isinstance(value, dict):
+        return MappingProxyType({key: _read_only(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(map(_read_only, value))
+    return value
+
 class BaseField(ABC):
 
+    __slots__ = ("required", "default", "label", "help_text", "readonly")
+
     def __init__(
         self,
         *,
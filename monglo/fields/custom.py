@@ -1,12 +1,25 @@
 
 from __future__ import annotations
 
+import json
+import re
 from typing import Any, Callable
 
 from .base import BaseField
 
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$')
+_COLOR_RE = re.compile(r'^#[0-9A-Fa-f]{6}$')
+
+def _accept_any(value: Any) -> bool:
+    return True  # Default: accept any value
+
+def _as_is(value: Any) -> Any:
+    return value  # Default: return as-is
+
 class CustomField(BaseField):
     
+    __slots__ = ("_custom_validator", "_custom_serializer", "_widget_config")
+    
     def __init__(
         self,
         validator: Callable[[Any], bool] | None = None,
@@ -15,29 +28,36 @@ class CustomField(BaseField):
         **kwargs
     ):
         super().__init__(**kwargs)
-        self._custom_validator = validator
-        self._custom_serializer = serializer
+        # Defaults are real callables, so validate/serialize never branch per call
+        self._custom_validator = validator or _accept_any
+        self._custom_serializer = serializer or _as_is
         self._widget_config = widget_config or {}
     
     def validate(self, value: Any) -> bool:
-        if self._custom_validator:
-            return self._custom_validator(value)
-        return True  # Default: accept any value
+        return self._custom_validator(value)
     
     def serialize(self, value: Any) -> Any:
-        if self._custom_serializer:
-            return self._custom_serializer(value)
-        return value  # Default: return as-is
+        return self._custom_serializer(value)
     
     def get_widget_config(self) -> dict[str, Any]:
         return self._widget_config
 
 class EnumField(CustomField):
     
+    __slots__ = ("choices",)
+    
     def __init__(self, choices: list[str], **kwargs):
         self.choices = choices
+        choices_set = frozenset(choices)
+        
+        def validate_choice(value: Any) -> bool:
+            try:
+                return value in choices_set
+            except TypeError:  # Unhashable values can never be a choice
+                return False
+        
         super().__init__(
-            validator=lambda v: v in choices,
+            validator=validate_choice,
             widget_config={
                 "type": "select",
                 "choices": [{"value": c, "label": c.title()} for c in choices]
@@ -47,25 +67,13 @@ class EnumField(CustomField):
 
 class URLField(CustomField):
     
+    __slots__ = ("require_https",)
+    
     def __init__(self, require_https: bool = False, **kwargs):
         self.require_https = require_https
         
-        def validate_url(value: str) -> bool:
-            import re
-            if not isinstance(value, str):
-                return False
-            
-            pattern = r'^https?://[^\s/$.?#].[^\s]*$'
-            if not re.match(pattern, value):
-                return False
-            
-            if self.require_https and not value.startswith('https://'):
-                return False
-            
-            return True
-        
         super().__init__(
-            validator=validate_url,
+            validator=_validate_url_https if require_https else _validate_url_any,
             widget_config={
                 "type": "url",
                 "placeholder": "https://example.com"
@@ -73,14 +81,23 @@ class URLField(CustomField):
             **kwargs
         )
 
+def _validate_url_any(value: str) -> bool:
+    if not isinstance(value, str):
+        return False
+    return bool(_URL_RE.match(value))
+
+def _validate_url_https(value: str) -> bool:
+    return _validate_url_any(value) and value.startswith('https://')
+
 class ColorField(CustomField):
     
+    __slots__ = ()
+    
     def __init__(self, **kwargs):
         def validate_color(value: str) -> bool:
-            import re
             if not isinstance(value, str):
                 return False
-            return bool(re.match(r'^#[0-9A-Fa-f]{6}$', value))
+            return bool(_COLOR_RE.match(value))
         
         super().__init__(
             validator=validate_color,
@@ -93,6 +110,8 @@ class ColorField(CustomField):
 
 class JSONField(CustomField):
     
+    __slots__ = ("schema",)
+    
     def __init__(self, schema: dict | None = None, **kwargs):
         self.schema = schema
         
@@ -104,7 +123,6 @@ class JSONField(CustomField):
             # Try parsing if string
             if isinstance(value, str):
                 try:
-                    import json
                     json.loads(value)
                     return True
                 except:
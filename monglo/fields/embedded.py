@@ -1,12 +1,91 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Callable
 
-from .base import BaseField
+from .base import BaseField, _read_only
+
+_MISSING = object()
+
+class _Schema(dict):
+    # Counts in-place edits, so an EmbeddedField can tell its generated validator,
+    # serializers and widget config are stale without comparing entries
+    __slots__ = ("version",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+def _counting(name: str) -> Callable[..., Any]:
+    method = getattr(dict, name)
+
+    def mutate(self: _Schema, *args: Any, **kwargs: Any) -> Any:
+        self.version += 1
+        return method(self, *args, **kwargs)
+
+    mutate.__name__ = name
+    return mutate
+
+for _name in (
+    "__setitem__", "__delitem__", "__ior__", "clear", "pop", "popitem", "setdefault", "update"
+):
+    setattr(_Schema, _name, _counting(_name))
+
+def _compile_validator(field: EmbeddedField | ArrayField) -> Callable[[Any], bool]:
+    """Generate a flat validator for one Embedded/Array field level.
+
+    The checks for this level are emitted inline; each schema entry or array
+    item is checked through the child's bound ``validate``, so nested containers
+    keep their own compiled validators and a change to a child never leaves its
+    parents stale. The generated code depends only on the level's shape and is
+    shared between structurally identical fields.
+    """
+    if isinstance(field, ArrayField):
+        item_type = field.item_type
+        shape = ("array", field.min_items, field.max_items, item_type is not None)
+        checks = () if item_type is None else (item_type.validate,)
+    else:
+        shape = ("embedded", tuple(field.schema))
+        checks = tuple(child.validate for child in field.schema.values())
+    return _validator_factory(shape)(_MISSING, *checks)
+
+@lru_cache(maxsize=1024)
+def _validator_factory(shape: tuple) -> Callable[..., Callable[[Any], bool]]:
+    # Keyed on names and bounds only; field objects are bound per call of the factory
+    lines = []
+    if shape[0] == "embedded":
+        params = [f"f{i}" for i in range(len(shape[1]))]
+        lines.append("if not isinstance(value, dict): return False")
+        for check, field_name in zip(params, shape[1]):
+            lines.append(f"item = value.get({field_name!r}, _MISSING)")
+            lines.append(f"if item is not _MISSING and not {check}(item): return False")
+    else:
+        _, min_items, max_items, has_items = shape
+        params = ["f0"] if has_items else []
+        lines.append("if not isinstance(value, list): return False")
+        if min_items is not None:
+            lines.append(f"if len(value) < {min_items!r}: return False")
+        if max_items is not None:
+            lines.append(f"if len(value) > {max_items!r}: return False")
+        if has_items:
+            lines.append("if not all(map(f0, value)): return False")
+    lines.append("return True")
+
+    source = "\n".join(
+        [f"def make({', '.join(['_MISSING', *params])}):", "    def validate(value):"]
+        + [f"        {line}" for line in lines]
+        + ["    return validate"]
+    )
+    namespace: dict[str, Any] = {}
+    exec(compile(source, f"<monglo {shape[0]} validator>", "exec"), namespace)
+    return namespace["make"]
 
 class EmbeddedField(BaseField):
     
+    __slots__ = ("schema", "_validate_fast", "_schema_version", "_serializers", "_widget_cache")
+    
     def __init__(
         self,
         schema: dict[str, BaseField] | None = None,
@@ -15,18 +94,31 @@ class EmbeddedField(BaseField):
         super().__init__(**kwargs)
         self.schema = schema or {}
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Reassigning the schema drops the generated validator, serializers and widget
+        # config; the schema is held as a _Schema so edits through field.schema do too
+        if name == "schema":
+            if not isinstance(value, _Schema):
+                value = _Schema(value)
+            self._clear_caches(value.version)
+        object.__setattr__(self, name, value)
+    
+    def _clear_caches(self, version: int) -> None:
+        object.__setattr__(self, "_validate_fast", None)
+        object.__setattr__(self, "_serializers", None)
+        object.__setattr__(self, "_widget_cache", None)
+        object.__setattr__(self, "_schema_version", version)
+    
+    def _check_schema(self) -> None:
+        if self._schema_version != self.schema.version:
+            self._clear_caches(self.schema.version)
+    
     def validate(self, value: Any) -> bool:
-        if not isinstance(value, dict):
-            return False
-        
-        # If schema provided, validate each field
-        if self.schema:
-            for field_name, field_def in self.schema.items():
-                if field_name in value:
-                    if not field_def.validate(value[field_name]):
-                        return False
-        
-        return True
+        # Built lazily on first call
+        self._check_schema()
+        if self._validate_fast is None:
+            self._validate_fast = _compile_validator(self)
+        return self._validate_fast(value)
     
     def serialize(self, value: dict | None) -> dict | None:
         if value is None:
@@ -37,17 +129,31 @@ class EmbeddedField(BaseField):
         
         # Serialize each nested field if schema provided
         if self.schema:
+            self._check_schema()
+            if self._serializers is None:
+                # Fields without a serialize method pass their value through
+                self._serializers = {
+                    name: getattr(field, "serialize", None)
+                    for name, field in self.schema.items()
+                }
+            get_serializer = self._serializers.get
+            
             result = {}
             for field_name, field_value in value.items():
-                if field_name in self.schema:
-                    result[field_name] = self.schema[field_name].serialize(field_value)
-                else:
-                    result[field_name] = field_value
+                serialize = get_serializer(field_name)
+                result[field_name] = serialize(field_value) if serialize else field_value
             return result
         
         return value
     
-    def get_widget_config(self) -> dict[str, Any]:
+    def get_widget_config(self) -> Mapping[str, Any]:
+        # The nested walk happens once per version of the schema
+        self._check_schema()
+        if self._widget_cache is None:
+            self._widget_cache = _read_only(self._build_widget_config())
+        return self._widget_cache
+    
+    def _build_widget_config(self) -> dict[str, Any]:
         return {
             "type": "embedded",
             "schema": {
@@ -58,6 +164,8 @@ class EmbeddedField(BaseField):
 
 class ArrayField(BaseField):
     
+    __slots__ = ("item_type", "min_items", "max_items", "_validate_fast", "_widget_cache")
+    
     def __init__(
         self,
         item_type: BaseField | None = None,
@@ -70,22 +178,17 @@ class ArrayField(BaseField):
         self.min_items = min_items
         self.max_items = max_items
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Changing the item type or bounds drops the generated validator and widget config
+        if name in ("item_type", "min_items", "max_items"):
+            object.__setattr__(self, "_validate_fast", None)
+            object.__setattr__(self, "_widget_cache", None)
+        object.__setattr__(self, name, value)
+    
     def validate(self, value: Any) -> bool:
-        if not isinstance(value, list):
-            return False
-        
-        if self.min_items is not None and len(value) < self.min_items:
-            return False
-        
-        if self.max_items is not None and len(value) > self.max_items:
-            return False
-        
-        if self.item_type:
-            for item in value:
-                if not self.item_type.validate(item):
-                    return False
-        
-        return True
+        if self._validate_fast is None:
+            self._validate_fast = _compile_validator(self)
+        return self._validate_fast(value)
     
     def serialize(self, value: list | None) -> list | None:
         if value is None:
@@ -96,11 +199,16 @@ class ArrayField(BaseField):
         
         # Serialize each item if item_type provided
         if self.item_type:
-            return [self.item_type.serialize(item) for item in value]
+            return list(map(self.item_type.serialize, value))
         
         return value
     
-    def get_widget_config(self) -> dict[str, Any]:
+    def get_widget_config(self) -> Mapping[str, Any]:
+        if self._widget_cache is None:
+            self._widget_cache = _read_only(self._build_widget_config())
+        return self._widget_cache
+    
+    def _build_widget_config(self) -> dict[str, Any]:
         config = {
             "type": "array",
             "min_items": self.min_items,
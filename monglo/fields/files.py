@@ -1,13 +1,28 @@
 
 from __future__ import annotations
 
-from typing import Any, BinaryIO
+import re
+from collections.abc import Mapping
+from typing import Any, AsyncIterator, BinaryIO
 from io import BytesIO
 
-from .base import BaseField
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorGridFSBucket
+
+from .. import _regex_cache
+from .base import BaseField, _read_only
+
+def _compile_extension_match(extensions: list[str]):
+    # One case-insensitive search covering every allowed extension
+    if not extensions:
+        return None
+    alternatives = "|".join(re.escape(ext.lstrip(".")) for ext in extensions)
+    return _regex_cache.get(rf"\.(?:{alternatives})\Z", re.IGNORECASE).search
 
 class FileField(BaseField):
     
+    __slots__ = ("allowed_extensions", "max_size_mb", "_extension_match", "_widget_cache")
+    
     def __init__(
         self,
         allowed_extensions: list[str] | None = None,
@@ -18,6 +33,14 @@ class FileField(BaseField):
         self.allowed_extensions = allowed_extensions or []
         self.max_size_mb = max_size_mb
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Any public option change invalidates the cached widget config
+        if not name.startswith("_"):
+            object.__setattr__(self, "_widget_cache", None)
+        if name == "allowed_extensions":
+            object.__setattr__(self, "_extension_match", _compile_extension_match(value))
+        object.__setattr__(self, name, value)
+    
     def validate(self, value: Any) -> bool:
         # Value should be a file-like object or file metadata
         if value is None:
@@ -25,13 +48,19 @@ class FileField(BaseField):
         
         if isinstance(value, dict):
             if "filename" in value and "file_id" in value:
-                return True
+                return self._has_allowed_extension(value["filename"])
         
         if hasattr(value, 'read'):
-            return True
+            return self._has_allowed_extension(getattr(value, "filename", None))
         
         return False
     
+    def _has_allowed_extension(self, filename: Any) -> bool:
+        # Unnamed streams cannot be checked and are accepted
+        if self._extension_match is None or not isinstance(filename, str):
+            return True
+        return self._extension_match(filename) is not None
+    
     def serialize(self, value: Any) -> dict | None:
         if value is None:
             return None
@@ -45,7 +74,12 @@ class FileField(BaseField):
             "uploaded": True
         }
     
-    def get_widget_config(self) -> dict[str, Any]:
+    def get_widget_config(self) -> Mapping[str, Any]:
+        if self._widget_cache is None:
+            self._widget_cache = _read_only(self._build_widget_config())
+        return self._widget_cache
+    
+    def _build_widget_config(self) -> dict[str, Any]:
         return {
             "type": "file",
             "allowed_extensions": self.allowed_extensions,
@@ -55,6 +89,8 @@ class FileField(BaseField):
 
 class ImageField(FileField):
     
+    __slots__ = ("max_width", "max_height")
+    
     def __init__(
         self,
         max_width: int | None = None,
@@ -69,8 +105,8 @@ class ImageField(FileField):
         self.max_width = max_width
         self.max_height = max_height
     
-    def get_widget_config(self) -> dict[str, Any]:
-        config = super().get_widget_config()
+    def _build_widget_config(self) -> dict[str, Any]:
+        config = super()._build_widget_config()
         config.update({
             "type": "image",
             "max_width": self.max_width,
@@ -82,46 +118,53 @@ class ImageField(FileField):
 class GridFSHelper:
     
     def __init__(self, database):
-        from motor.motor_asyncio import AsyncIOMotorGridFSBucket
         self.fs = AsyncIOMotorGridFSBucket(database)
+        self._open = self.fs.open_download_stream
     
     async def upload_file(
         self,
-        file_data: bytes | BinaryIO,
+        file_data: bytes | bytearray | memoryview | BinaryIO,
         filename: str,
         content_type: str | None = None,
-        metadata: dict | None = None
+        metadata: dict | None = None,
+        chunk_size_bytes: int | None = None
     ) -> str:
-        if isinstance(file_data, bytes):
+        # GridFS needs a file-like object for anything but bytes
+        if isinstance(file_data, (bytearray, memoryview)):
             file_data = BytesIO(file_data)
         
+        # A content_type passed in metadata takes precedence
+        meta = dict(metadata) if metadata else {}
+        meta.setdefault("content_type", content_type)
+        
+        options = {"metadata": meta}
+        if chunk_size_bytes is not None:
+            options["chunk_size_bytes"] = chunk_size_bytes
+        
         # Upload to GridFS
-        file_id = await self.fs.upload_from_stream(
-            filename,
-            file_data,
-            metadata={
-                "content_type": content_type,
-                **(metadata or {})
-            }
-        )
+        file_id = await self.fs.upload_from_stream(filename, file_data, **options)
         
         return str(file_id)
     
     async def download_file(self, file_id: str) -> bytes:
-        from bson import ObjectId
+        return b"".join([chunk async for chunk in self.stream_file(file_id)])
+    
+    async def stream_file(
+        self,
+        file_id: str,
+        chunk_size: int = 256 * 1024
+    ) -> AsyncIterator[bytes]:
+        # Holds at most one chunk in memory; suitable for streaming HTTP responses
+        grid_out = await self._open(ObjectId(file_id))
         
-        grid_out = await self.fs.open_download_stream(ObjectId(file_id))
-        data = await grid_out.read()
-        return data
+        while chunk := await grid_out.read(chunk_size):
+            yield chunk
     
     async def delete_file(self, file_id: str) -> None:
-        from bson import ObjectId
         await self.fs.delete(ObjectId(file_id))
     
     async def get_file_metadata(self, file_id: str) -> dict:
-        from bson import ObjectId
-        
-        grid_out = await self.fs.open_download_stream(ObjectId(file_id))
+        grid_out = await self._open(ObjectId(file_id))
         
         return {
             "file_id": str(file_id),
@@ -8,6 +8,8 @@ from .base import BaseField
 
 class StringField(BaseField):
 
+    __slots__ = ("min_length", "max_length")
+
     def __init__(
         self, *, min_length: int | None = None, max_length: int | None = None, **kwargs
     ) -> None:
@@ -32,6 +34,8 @@ class StringField(BaseField):
 
 class NumberField(BaseField):
 
+    __slots__ = ("min_value", "max_value")
+
     def __init__(
         self,
         *,
@@ -68,6 +72,8 @@ class NumberField(BaseField):
 
 class BooleanField(BaseField):
 
+    __slots__ = ()
+
     def validate(self, value: Any) -> bool:
         if isinstance(value, bool):
             return value
@@ -85,6 +91,8 @@ class BooleanField(BaseField):
 
 class DateField(BaseField):
 
+    __slots__ = ()
+
     def validate(self, value: Any) -> date:
         if isinstance(value, datetime):
             return value.date()
@@ -105,6 +113,8 @@ class DateField(BaseField):
 
 class DateTimeField(BaseField):
 
+    __slots__ = ()
+
     def validate(self, value: Any) -> datetime:
         if isinstance(value, datetime):
             return value
@@ -1,24 +1,28 @@
 
 from __future__ import annotations
 
+import re
 from typing import Any
 
 from bson import DBRef, ObjectId
-from bson.errors import InvalidId
 
 from .base import BaseField
 
+# Structural check for ObjectId hex strings; anything that passes is accepted by ObjectId()
+_HEX24 = re.compile(r'[0-9a-fA-F]{24}\Z').match
+
 class ObjectIdField(BaseField):
 
+    __slots__ = ()
+
     def validate(self, value: Any) -> ObjectId:
         if isinstance(value, ObjectId):
             return value
 
         if isinstance(value, str):
-            try:
-                return ObjectId(value)
-            except InvalidId:
-                raise ValueError(f"Invalid ObjectId: {value}") from None
+            if not _HEX24(value):
+                raise ValueError(f"Invalid ObjectId: {value}")
+            return ObjectId(value)
 
         raise ValueError("Value must be an ObjectId or valid ObjectId string")
 
@@ -27,6 +31,8 @@ class ObjectIdField(BaseField):
 
 class DBRefField(BaseField):
 
+    __slots__ = ("collection", "database")
+
     def __init__(self, *, collection: str, database: str | None = None, **kwargs) -> None:
         super().__init__(**kwargs)
         self.collection = collection
@@ -40,11 +46,9 @@ class DBRefField(BaseField):
             return DBRef(self.collection, value, self.database)
 
         if isinstance(value, str):
-            try:
-                oid = ObjectId(value)
-                return DBRef(self.collection, oid, self.database)
-            except InvalidId:
-                raise ValueError(f"Invalid ObjectId for DBRef: {value}") from None
+            if not _HEX24(value):
+                raise ValueError(f"Invalid ObjectId for DBRef: {value}")
+            return DBRef(self.collection, ObjectId(value), self.database)
 
         raise ValueError("Value must be DBRef, ObjectId, or ObjectId string")
 
@@ -3,8 +3,11 @@ __all__ = [
     "CRUDOperations",
     "PaginationHandler",
     "PaginationStrategy",
+    "PaginationMeta",
+    "CursorPaginationMeta",
     "ExportOperations",
     "ExportFormat",
     "export_collection",
+    "stream_export",
     "AggregationOperations",
 ]
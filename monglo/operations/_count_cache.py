@@ -0,0 +1,114 @@
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any
+
+import bson
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+# Seconds a count is reused across page requests with the same filter
+COUNT_CACHE_TTL = 5.0
+# Maximum number of cached (collection, query) counts
+COUNT_CACHE_SIZE = 1024
+
+# (collection full name, query BSON) -> (count, expires_at), in LRU order
+_COUNT_CACHE: OrderedDict[tuple[str, bytes], tuple[int, float]] = OrderedDict()
+_PENDING_COUNTS: dict[tuple[str, bytes], asyncio.Future[int]] = {}
+# Bumped on invalidation so counts started before a write are not cached;
+# the None entry covers invalidation of every collection
+_GENERATIONS: dict[str | None, int] = {}
+
+def _generation(name: str) -> tuple[int, int]:
+    return (_GENERATIONS.get(None, 0), _GENERATIONS.get(name, 0))
+
+def _cache_key(
+    collection: AsyncIOMotorCollection, query: dict[str, Any], estimated: bool = False
+) -> tuple[str, bytes]:
+    # Never valid BSON, so estimates can't collide with an exact count of {}
+    if estimated:
+        return (collection.full_name, b"")
+    return (collection.full_name, bson.encode(dict(sorted(query.items()))))
+
+def peek_count(
+    collection: AsyncIOMotorCollection, query: dict[str, Any], estimated: bool = False
+) -> int | None:
+    # Cached count if still fresh, without querying the server
+    key = _cache_key(collection, query, estimated)
+
+    cached = _COUNT_CACHE.get(key)
+    if cached is not None:
+        if cached[1] > time.monotonic():
+            _COUNT_CACHE.move_to_end(key)
+            return cached[0]
+        del _COUNT_CACHE[key]
+
+    return None
+
+async def cached_count(
+    collection: AsyncIOMotorCollection,
+    query: dict[str, Any],
+    ttl: float = COUNT_CACHE_TTL,
+    max_time_ms: int | None = None,
+    *,
+    estimated: bool = False
+) -> int:
+    # estimated reads collection metadata instead of counting; only for an empty query
+    if estimated and query:
+        raise ValueError("Estimated counts cannot apply a query")
+
+    cached = peek_count(collection, query, estimated)
+    if cached is not None:
+        return cached
+
+    key = _cache_key(collection, query, estimated)
+
+    # Concurrent page requests with the same filter share one count
+    pending = _PENDING_COUNTS.get(key)
+    if pending is None:
+        pending = asyncio.ensure_future(_fetch_count(collection, query, key, ttl, max_time_ms))
+        _PENDING_COUNTS[key] = pending
+        pending.add_done_callback(
+            lambda done: _PENDING_COUNTS.pop(key) if _PENDING_COUNTS.get(key) is done else None
+        )
+
+    # Shield so one cancelled caller doesn't cancel the count for the others
+    return await asyncio.shield(pending)
+
+async def _fetch_count(
+    collection: AsyncIOMotorCollection,
+    query: dict[str, Any],
+    key: tuple[str, bytes],
+    ttl: float,
+    max_time_ms: int | None
+) -> int:
+    generation = _generation(key[0])
+    if not key[1]:
+        total = await collection.estimated_document_count()
+    elif max_time_ms is None:
+        total = await collection.count_documents(query)
+    else:
+        total = await collection.count_documents(query, maxTimeMS=max_time_ms)
+
+    if _generation(key[0]) == generation:
+        _COUNT_CACHE[key] = (total, time.monotonic() + ttl)
+        if len(_COUNT_CACHE) > COUNT_CACHE_SIZE:
+            _COUNT_CACHE.popitem(last=False)
+
+    return total
+
+def invalidate_counts(collection: AsyncIOMotorCollection | None = None) -> None:
+    if collection is None:
+        _GENERATIONS[None] = _GENERATIONS.get(None, 0) + 1
+        _COUNT_CACHE.clear()
+        _PENDING_COUNTS.clear()
+        return
+
+    name = collection.full_name
+    _GENERATIONS[name] = _GENERATIONS.get(name, 0) + 1
+    for key in [key for key in _COUNT_CACHE if key[0] == name]:
+        del _COUNT_CACHE[key]
+    for key in [key for key in _PENDING_COUNTS if key[0] == name]:
+        del _PENDING_COUNTS[key]
@@ -0,0 +1,63 @@
+
+# Fully annotated and free of dynamic features so it can be compiled with
+# mypyc (mypyc monglo/operations/_serializer.py); without a built extension
+# this plain module is imported instead.
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any, Callable
+
+from bson import ObjectId
+
+# Exact-type converters for export; subclasses go through serialize_value
+_DISPATCH: dict[type, Callable[[Any], Any]] = {
+    ObjectId: str,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    bytes: bytes.hex,  # Convert binary to hex string
+}
+# Values exported unchanged
+_PASSTHROUGH: frozenset[type] = frozenset({str, int, float, bool, type(None)})
+
+def serialize_value(value: Any) -> Any:
+    if isinstance(value, ObjectId):
+        return str(value)
+    elif isinstance(value, (datetime, date)):
+        return value.isoformat()
+    elif isinstance(value, dict):
+        return {key: serialize_value(item) for key, item in value.items()}
+    elif isinstance(value, list):
+        return [serialize_value(item) for item in value]
+    elif isinstance(value, bytes):
+        return value.hex()
+    else:
+        return value
+
+def serialize_document(doc: dict[str, Any]) -> dict[str, Any]:
+    # Iterative walk with exact-type dispatch; same output as serialize_value
+    root: dict[str, Any] = {}
+    stack: list[tuple[Any, Any]] = [(doc, root)]
+
+    while stack:
+        source, target = stack.pop()
+        entries: Any = enumerate(source) if type(source) is list else source.items()
+
+        key: Any
+        value: Any
+        for key, value in entries:
+            kind: type = type(value)
+            if kind in _PASSTHROUGH:
+                target[key] = value
+            elif kind is dict:
+                nested_dict: dict[str, Any] = {}
+                target[key] = nested_dict
+                stack.append((value, nested_dict))
+            elif kind is list:
+                nested_list: list[Any] = [None] * len(value)
+                target[key] = nested_list
+                stack.append((value, nested_list))
+            else:
+                convert = _DISPATCH.get(kind)
+                target[key] = convert(value) if convert is not None else serialize_value(value)
+
+    return root
@@ -1,20 +1,120 @@
 
-from typing import Any
+import copy
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Awaitable, Callable
 
+import bson
+from bson.errors import InvalidDocument
 from motor.motor_asyncio import AsyncIOMotorCollection
 
+# Seconds a dashboard aggregation result is served from the local cache
+AGGREGATION_CACHE_TTL = 5.0
+# Maximum number of cached aggregation results shared by all instances
+AGGREGATION_CACHE_SIZE = 128
+
+# $dateToString formats for get_date_histogram intervals
+_INTERVAL_FORMATS = {"day": "%Y-%m-%d", "week": "%Y-W%V", "month": "%Y-%m", "year": "%Y"}
+# Stages shared by every date histogram pipeline; never mutated
+_HISTOGRAM_TAIL = (
+    {"$sort": {"_id": 1}},
+    {"$project": {"_id": 0, "date": "$_id", "count": 1}},
+)
+
+# Cache key part for a query that can't be encoded; such calls skip the cache
+_UNCACHEABLE = object()
+
+def _query_key(query: dict[str, Any] | None) -> Any:
+    # BSON bytes are a type-tagged encoding: true and 1 stay distinct, and Regex,
+    # ObjectId and datetime values are encoded as the server receives them
+    if not query:
+        return b""
+    try:
+        return bson.encode(query)
+    except (InvalidDocument, OverflowError, TypeError):
+        return _UNCACHEABLE
+
 class AggregationOperations:
 
-    def __init__(self, collection: AsyncIOMotorCollection) -> None:
-        self.collection = collection
+    # (client id, database, collection, *call args) -> (expires_at, result), in LRU
+    # order; callers get deep copies, so cached results are never shared or mutated
+    _cache: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
 
-    async def aggregate(self, pipeline: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        cursor = self.collection.aggregate(pipeline)
+    def __init__(
+        self, collection: AsyncIOMotorCollection, *, cache_ttl: float = AGGREGATION_CACHE_TTL
+    ) -> None:
+        self.collection = collection
+        self.cache_ttl = cache_ttl
+
+    @classmethod
+    def invalidate_cache(cls, collection: str | None = None) -> None:
+        if collection is None:
+            cls._cache.clear()
+            return
+
+        for key in [key for key in cls._cache if key[2] == collection]:
+            del cls._cache[key]
+
+    async def _cached_aggregate(
+        self, key: tuple, compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        if self.cache_ttl <= 0 or _UNCACHEABLE in key:
+            return await compute()
+
+        cache = self._cache
+        database = self.collection.database
+        # Same-named databases on different clients must not share results
+        key = (id(database.client), database.name, self.collection.name, *key)
+        now = time.monotonic()
+
+        entry = cache.get(key)
+        if entry is not None:
+            if entry[0] > now:
+                cache.move_to_end(key)
+                return copy.deepcopy(entry[1])
+            del cache[key]
+
+        result = await compute()
+
+        cache[key] = (now + self.cache_ttl, result)
+        if len(cache) > AGGREGATION_CACHE_SIZE:
+            cache.popitem(last=False)
+
+        return copy.deepcopy(result)
+
+    async def aggregate(
+        self, pipeline: list[dict[str, Any]], *, allow_disk_use: bool = False
+    ) -> list[dict[str, Any]]:
+        if allow_disk_use:
+            cursor = self.collection.aggregate(pipeline, allowDiskUse=True)
+        else:
+            cursor = self.collection.aggregate(pipeline)
         return await cursor.to_list(None)
 
+    async def aggregate_iter(
+        self,
+        pipeline: list[dict[str, Any]],
+        *,
+        batch_size: int = 1000,
+        allow_disk_use: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        # Streams results one server batch at a time instead of buffering the full set
+        if allow_disk_use:
+            cursor = self.collection.aggregate(pipeline, batchSize=batch_size, allowDiskUse=True)
+        else:
+            cursor = self.collection.aggregate(pipeline, batchSize=batch_size)
+        async for doc in cursor:
+            yield doc
+
     async def get_field_stats(
         self, field: str, *, query: dict[str, Any] | None = None
     ) -> dict[str, Any]:
+        return await self._cached_aggregate(
+            ("field_stats", field, _query_key(query)),
+            lambda: self._field_stats(field, query),
+        )
+
+    async def _field_stats(self, field: str, query: dict[str, Any] | None) -> dict[str, Any]:
         pipeline: list[dict[str, Any]] = []
 
         if query:
@@ -51,33 +151,52 @@ class AggregationOperations:
         avg_field: str | None = None,
         query: dict[str, Any] | None = None,
         limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        return await self._cached_aggregate(
+            ("group_by", field, count, sum_field, avg_field, _query_key(query), limit),
+            lambda: self._group_by(field, count, sum_field, avg_field, query, limit),
+        )
+
+    async def _group_by(
+        self,
+        field: str,
+        count: bool,
+        sum_field: str | None,
+        avg_field: str | None,
+        query: dict[str, Any] | None,
+        limit: int | None,
     ) -> list[dict[str, Any]]:
         pipeline: list[dict[str, Any]] = []
 
         if query:
             pipeline.append({"$match": query})
 
-        group_stage: dict[str, Any] = {"_id": f"${field}"}
+        if count and not sum_field and not avg_field:
+            # Counts only (e.g. get_top_values): one fused group-and-sort stage
+            pipeline.append({"$sortByCount": f"${field}"})
+        else:
+            group_stage: dict[str, Any] = {"_id": f"${field}"}
 
-        if count:
-            group_stage["count"] = {"$sum": 1}
+            if count:
+                group_stage["count"] = {"$sum": 1}
 
-        if sum_field:
-            group_stage["total"] = {"$sum": f"${sum_field}"}
+            if sum_field:
+                group_stage["total"] = {"$sum": f"${sum_field}"}
 
-        if avg_field:
-            group_stage["average"] = {"$avg": f"${avg_field}"}
+            if avg_field:
+                group_stage["average"] = {"$avg": f"${avg_field}"}
 
-        pipeline.append({"$group": group_stage})
+            pipeline.append({"$group": group_stage})
 
-        if count:
-            pipeline.append({"$sort": {"count": -1}})
+            if count:
+                pipeline.append({"$sort": {"count": -1}})
 
         # Limit results
         if limit:
             pipeline.append({"$limit": limit})
 
-        results = await self.aggregate(pipeline)
+        # Unbounded cardinality can exceed the in-memory group/sort limit
+        results = await self.aggregate(pipeline, allow_disk_use=True)
 
         # Rename _id to the field name for clarity
         for result in results:
@@ -88,44 +207,72 @@ class AggregationOperations:
     async def get_distinct_counts(
         self, field: str, *, query: dict[str, Any] | None = None
     ) -> dict[str, Any]:
-        distinct = await self.collection.distinct(field, query or {})
+        return await self._cached_aggregate(
+            ("distinct_counts", field, _query_key(query)),
+            lambda: self._distinct_counts(field, query),
+        )
 
-        total = await self.collection.count_documents(query or {})
+    async def _distinct_counts(self, field: str, query: dict[str, Any] | None) -> dict[str, Any]:
+        # Unwinding first matches distinct(), which counts array elements individually
+        distinct_values = [{"$unwind": f"${field}"}, {"$group": {"_id": f"${field}"}}]
+
+        # One scan for the total, the distinct count and a bounded sample
+        results = await self.aggregate(
+            [
+                {"$match": query or {}},
+                {
+                    "$facet": {
+                        "distinct": [*distinct_values, {"$count": "n"}],
+                        "sample": [*distinct_values, {"$limit": 10}],
+                        "total": [{"$count": "n"}],
+                    }
+                },
+            ]
+        )
+
+        facets = results[0]
+        distinct_count = facets["distinct"][0]["n"] if facets["distinct"] else 0
+        total = facets["total"][0]["n"] if facets["total"] else 0
 
         return {
             "field": field,
-            "distinct_count": len(distinct),
+            "distinct_count": distinct_count,
             "total_documents": total,
-            "cardinality_ratio": len(distinct) / total if total > 0 else 0,
-            "sample_values": distinct[:10] if len(distinct) <= 100 else [],
+            "cardinality_ratio": distinct_count / total if total > 0 else 0,
+            "sample_values": (
+                [doc["_id"] for doc in facets["sample"]] if distinct_count <= 100 else []
+            ),
         }
 
     async def get_date_histogram(
         self, date_field: str, *, interval: str = "day", query: dict[str, Any] | None = None
     ) -> list[dict[str, Any]]:
-        interval_formats = {"day": "%Y-%m-%d", "week": "%Y-W%V", "month": "%Y-%m", "year": "%Y"}
+        return await self._cached_aggregate(
+            ("date_histogram", date_field, interval, _query_key(query)),
+            lambda: self._date_histogram(date_field, interval, query),
+        )
 
-        format_str = interval_formats.get(interval, "%Y-%m-%d")
+    async def _date_histogram(
+        self, date_field: str, interval: str, query: dict[str, Any] | None
+    ) -> list[dict[str, Any]]:
+        format_str = _INTERVAL_FORMATS.get(interval, "%Y-%m-%d")
 
         pipeline: list[dict[str, Any]] = []
 
         if query:
             pipeline.append({"$match": query})
 
-        pipeline.extend(
-            [
-                {
-                    "$group": {
-                        "_id": {"$dateToString": {"format": format_str, "date": f"${date_field}"}},
-                        "count": {"$sum": 1},
-                    }
-                },
-                {"$sort": {"_id": 1}},
-                {"$project": {"_id": 0, "date": "$_id", "count": 1}},
-            ]
+        pipeline.append(
+            {
+                "$group": {
+                    "_id": {"$dateToString": {"format": format_str, "date": f"${date_field}"}},
+                    "count": {"$sum": 1},
+                }
+            }
         )
+        pipeline.extend(_HISTOGRAM_TAIL)
 
-        return await self.aggregate(pipeline)
+        return await self.aggregate(pipeline, allow_disk_use=True)
 
     async def get_top_values(
         self, field: str, *, limit: int = 10, query: dict[str, Any] | None = None
@@ -1,21 +1,66 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
+import logging
+import weakref
+from datetime import datetime, timezone
 from typing import Any, TYPE_CHECKING
 
+from pymongo import IndexModel, WriteConcern
+
+from .aggregations import AggregationOperations
+
 if TYPE_CHECKING:
     from motor.motor_asyncio import AsyncIOMotorDatabase
 
+_log = logging.getLogger(__name__)
+
+# Maximum number of entries written by a single insert_many
+AUDIT_BATCH_SIZE = 500
+# Seconds the writer waits for more entries before flushing a partial batch
+AUDIT_FLUSH_INTERVAL = 0.1
+# Document snapshots left out of history listings unless explicitly requested
+_PAYLOAD_PROJECTION = {"before": 0, "after": 0, "data": 0}
+# Indexes backing the history queries and the global recent-activity view
+_AUDIT_INDEXES = [
+    IndexModel([("collection", 1), ("document_id", 1), ("timestamp", -1)]),
+    IndexModel([("user.id", 1), ("timestamp", -1)]),
+    IndexModel([("timestamp", -1)]),
+]
+
 class AuditLogger:
     
+    # Loggers with a background writer; MongloEngine.close() flushes and stops them
+    _writers: weakref.WeakSet[AuditLogger] = weakref.WeakSet()
+    # (client id, database, collection) whose indexes exist in this process; same-named
+    # databases on different clients are indexed separately
+    _indexed_dbs: set[tuple[int, str, str]] = set()
+    
     def __init__(
         self,
         database: AsyncIOMotorDatabase,
-        collection_name: str = "monglo_audit_log"
+        collection_name: str = "monglo_audit_log",
+        batch_size: int = AUDIT_BATCH_SIZE,
+        flush_interval: float = AUDIT_FLUSH_INTERVAL,
+        strict_mode: bool = False
     ):
         self.db = database
         self.collection = database[collection_name]
+        self.strict_mode = strict_mode
+        # Fire-and-forget handle; the driver returns once a batch is on the socket
+        self._unacknowledged = self.collection.with_options(write_concern=WriteConcern(w=0))
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        
+        # Created on first log call so the logger can be built outside a running loop,
+        # and recreated when the logger is used from another loop
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue | None = None
+        self._flush_task: asyncio.Task | None = None
+        self._flush_error: BaseException | None = None
+        # Pending flushes; while any wait, batches are written acknowledged
+        self._flush_waiters = 0
     
     async def log_create(
         self,
@@ -90,60 +135,208 @@ class AuditLogger:
         **kwargs
     ) -> None:
         log_entry = {
-            "timestamp": datetime.utcnow(),
+            "timestamp": datetime.now(timezone.utc),
             "action": action,
             "collection": collection,
-            "user": {
-                "id": user.get("id") if user else "anonymous",
-                "role": user.get("role") if user else None
-            } if user else None,
+            "user": {"id": user.get("id"), "role": user.get("role")} if user else None,
             **kwargs
         }
         
-        await self.collection.insert_one(log_entry)
+        # Writes make cached dashboard aggregations for this collection stale
+        AggregationOperations.invalidate_cache(collection)
+        
+        if self.strict_mode:
+            # Written before the operation returns, so a failed entry fails the caller
+            await self._insert_batch([log_entry])
+        else:
+            self._enqueue(log_entry)
+    
+    def _enqueue(self, log_entry: dict[str, Any]) -> None:
+        self._writer_queue().put_nowait(log_entry)
+        self._start_writer()
+    
+    def _writer_queue(self) -> asyncio.Queue:
+        # Queues and tasks belong to one loop; entries not yet written move to a new
+        # queue on the running loop and the old writer is stopped
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            stale, task = self._queue, self._flush_task
+            if task is not None and not task.done() and not task.get_loop().is_closed():
+                task.get_loop().call_soon_threadsafe(task.cancel)
+            
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._flush_task = None
+            while stale is not None and not stale.empty():
+                self._queue.put_nowait(stale.get_nowait())
+        return self._queue
+    
+    def _start_writer(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop(self._queue))
+            AuditLogger._writers.add(self)
+    
+    async def _flush_loop(self, queue: asyncio.Queue) -> None:
+        while True:
+            batch = [await queue.get()]
+            
+            # Give concurrent writers a moment to fill the batch unless a flush is waiting
+            if queue.qsize() < self.batch_size - 1 and not self._flush_waiters:
+                try:
+                    await asyncio.sleep(self.flush_interval)
+                except asyncio.CancelledError:
+                    # Not sent yet; hand it back for the writer that replaces this one
+                    queue.put_nowait(batch[0])
+                    queue.task_done()
+                    raise
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            try:
+                await self._insert_batch(batch, acknowledged=self._flush_waiters > 0)
+            except Exception as e:
+                _log.warning("Failed to write %d audit log entries", len(batch), exc_info=True)
+                self._flush_error = e
+            finally:
+                for _ in batch:
+                    queue.task_done()
+    
+    async def _insert_batch(
+        self, batch: list[dict[str, Any]], *, acknowledged: bool = False
+    ) -> None:
+        if self.strict_mode or acknowledged:
+            # Acknowledged writes for deployments that must confirm every audit entry,
+            # and for entries a flush is waiting on
+            await self.collection.insert_many(batch, ordered=False)
+        else:
+            await self._unacknowledged.insert_many(batch, ordered=False)
+    
+    async def flush(self) -> None:
+        """Wait until every queued audit entry has been written.
+        
+        Entries still queued are written with an acknowledged write, so reads issued
+        afterwards see them. Batches the background writer had already sent
+        unacknowledged carry no such guarantee. Raises the last write error seen by
+        the background writer, if any.
+        """
+        await self._drain()
+        
+        if self._flush_error is not None:
+            error, self._flush_error = self._flush_error, None
+            raise error
+    
+    async def _drain(self) -> None:
+        if self._queue is None:
+            return
+        
+        queue = self._writer_queue()
+        if not queue.empty():
+            self._start_writer()
+        
+        self._flush_waiters += 1
+        try:
+            await queue.join()
+        finally:
+            self._flush_waiters -= 1
+    
+    async def close(self) -> None:
+        """Flush pending entries and stop the background writer."""
+        try:
+            await self.flush()
+        finally:
+            if self._flush_task is not None:
+                self._flush_task.cancel()
+                try:
+                    await self._flush_task
+                except asyncio.CancelledError:
+                    pass
+                self._flush_task = None
+            AuditLogger._writers.discard(self)
+    
+    @classmethod
+    async def close_all(cls, database: AsyncIOMotorDatabase | None = None) -> None:
+        """Close every logger with a background writer, optionally only for one database."""
+        errors = []
+        for logger in list(cls._writers):
+            if database is not None and logger.db != database:
+                continue
+            try:
+                await logger.close()
+            except Exception as e:
+                errors.append(e)
+        
+        if errors:
+            raise errors[0]
     
     def _calculate_changes(
         self,
         before: dict[str, Any],
         after: dict[str, Any]
     ) -> dict[str, dict[str, Any]]:
-        changes = {}
+        # Unchanged documents are common on re-saves; one C-level comparison settles them
+        if before is after or before == after:
+            return {}
         
-        # Find changed fields
-        all_keys = set(before.keys()) | set(after.keys())
+        # Changed and added fields
+        changes = {
+            key: {"old": before.get(key), "new": new_value}
+            for key, new_value in after.items()
+            if before.get(key) != new_value
+        }
         
-        for key in all_keys:
-            old_value = before.get(key)
-            new_value = after.get(key)
-            
-            if old_value != new_value:
-                changes[key] = {
-                    "old": old_value,
-                    "new": new_value
-                }
+        # Removed fields
+        for key in before.keys() - after.keys():
+            if before[key] is not None:
+                changes[key] = {"old": before[key], "new": None}
         
         return changes
     
+    async def _ensure_indexes(self) -> None:
+        # Lets the history queries walk an index instead of sorting in memory
+        key = (id(self.db.client), self.db.name, self.collection.name)
+        if key in AuditLogger._indexed_dbs:
+            return
+        
+        await self.collection.create_indexes(_AUDIT_INDEXES)
+        AuditLogger._indexed_dbs.add(key)
+    
     async def get_document_history(
         self,
         collection: str,
         document_id: str,
-        limit: int = 50
+        limit: int = 50,
+        include_payload: bool = False
     ) -> list[dict[str, Any]]:
-        cursor = self.collection.find({
-            "collection": collection,
-            "document_id": document_id
-        }).sort("timestamp", -1).limit(limit)
+        # Background write errors were logged when they happened and are left for
+        # flush(); they belong to other entries, not to this read
+        await self._drain()
+        await self._ensure_indexes()
+        
+        cursor = self.collection.find(
+            {"collection": collection, "document_id": document_id},
+            None if include_payload else _PAYLOAD_PROJECTION
+        ).sort("timestamp", -1).limit(limit)
         
         return await cursor.to_list(length=limit)
     
     async def get_user_activity(
         self,
         user_id: str,
-        limit: int = 100
+        limit: int = 100,
+        include_payload: bool = False
     ) -> list[dict[str, Any]]:
-        cursor = self.collection.find({
-            "user.id": user_id
-        }).sort("timestamp", -1).limit(limit)
+        await self._drain()
+        await self._ensure_indexes()
+        
+        cursor = self.collection.find(
+            {"user.id": user_id},
+            None if include_payload else _PAYLOAD_PROJECTION
+        ).sort("timestamp", -1).limit(limit)
         
         return await cursor.to_list(length=limit)
+    
+    async def get_entry(self, entry_id: Any) -> dict[str, Any] | None:
+        # Full entry, including the snapshots omitted from history listings
+        await self._drain()
+        
+        return await self.collection.find_one({"_id": entry_id})
@@ -1,14 +1,50 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import time
+from collections.abc import Sequence
+from functools import lru_cache
 from typing import Any
 
 from bson import ObjectId
 from bson.errors import InvalidId
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import DeleteOne, InsertOne, ReplaceOne, ReturnDocument, UpdateOne
 
 from ..core.query_builder import QueryBuilder
 from ..core.registry import CollectionAdmin
+from ._count_cache import cached_count, invalidate_counts
+from .aggregations import AggregationOperations
+from .pagination import _total_pages
+
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+# Seconds an exists() answer is reused across CRUDOperations instances
+EXISTS_CACHE_TTL = 1.0
+# Maximum number of cached answers per collection
+EXISTS_CACHE_SIZE = 1024
+
+# Collection full name -> {ObjectId: (exists, expires_at)}; a collection's entry is
+# dropped by every write through CRUDOperations
+_EXISTS_CACHE: dict[str, dict[ObjectId, tuple[bool, float]]] = {}
+
+def _fast_object_id(value: str | ObjectId) -> ObjectId | None:
+    if isinstance(value, ObjectId):
+        return value
+    if isinstance(value, str) and len(value) == 24 and _HEX_DIGITS.issuperset(value):
+        return ObjectId(value)
+    return None
+
+@lru_cache(maxsize=256)
+def _cached_search_query(search: str, fields: tuple[str, ...]) -> dict[str, Any]:
+    # Never handed out; see _search_query
+    return QueryBuilder.build_search_query(search, list(fields))
+
+def _search_query(search: str, fields: tuple[str, ...]) -> dict[str, Any]:
+    # The query can reach callers unchanged through combine_queries, so each call gets
+    # its own copy and mutations never leak into later searches
+    return copy.deepcopy(_cached_search_query(search, fields))
 
 class CRUDOperations:
 
@@ -16,6 +52,17 @@ class CRUDOperations:
         self.admin = admin
         self.collection: AsyncIOMotorCollection = admin.collection
 
+        # Listing settings are read once rather than walked on every list() call
+        config = admin.config
+        self._max_per_page = config.pagination_config.get("max_per_page", 100)
+        self._default_sort = config.table_view.default_sort
+        self._search_fields = tuple(config.search_fields or ())
+
+    def _invalidate(self) -> None:
+        invalidate_counts(self.collection)
+        AggregationOperations.invalidate_cache(self.collection.name)
+        _EXISTS_CACHE.pop(self.collection.full_name, None)
+
     async def list(
         self,
         *,
@@ -25,6 +72,7 @@ class CRUDOperations:
         sort: list[tuple[str, int]] | None = None,
         search: str | None = None,
         projection: dict[str, int] | None = None,
+        fuse: bool = False,
     ) -> dict[str, Any]:
         query_parts = []
 
@@ -33,31 +81,37 @@ class CRUDOperations:
             if filter_query:
                 query_parts.append(filter_query)
 
-        if search and self.admin.config.search_fields:
-            search_query = QueryBuilder.build_search_query(search, self.admin.config.search_fields)
+        if search and self._search_fields:
+            search_query = _search_query(search, self._search_fields)
             if search_query:
                 query_parts.append(search_query)
 
         final_query = QueryBuilder.combine_queries(*query_parts)
 
-        total = await self.collection.count_documents(final_query)
-
         skip, limit = QueryBuilder.build_pagination_query(
             page=page,
             per_page=per_page,
-            max_per_page=self.admin.config.pagination_config.get("max_per_page", 100),
+            max_per_page=self._max_per_page,
         )
 
-        sort_spec = QueryBuilder.build_sort(sort or self.admin.config.table_view.default_sort)
+        sort_spec = QueryBuilder.build_sort(sort or self._default_sort)
 
-        cursor = self.collection.find(final_query, projection or {})
+        if fuse:
+            # Count and page in one round trip; the page must fit in a 16MB result document
+            items, total = await self._list_fused(final_query, sort_spec, skip, limit, projection)
+        else:
+            cursor = self.collection.find(final_query, projection or {})
 
-        if sort_spec:
-            cursor = cursor.sort(sort_spec)
+            if sort_spec:
+                cursor = cursor.sort(sort_spec)
 
-        items = await cursor.skip(skip).limit(limit).to_list(limit)
+            # Count and page are independent, so their round trips overlap
+            total, items = await asyncio.gather(
+                cached_count(self.collection, final_query),
+                cursor.skip(skip).limit(limit).to_list(limit),
+            )
 
-        total_pages = (total + per_page - 1) // per_page if per_page > 0 else 1
+        total_pages = _total_pages(total, per_page)
 
         return {
             "items": items,
@@ -69,6 +123,31 @@ class CRUDOperations:
             "has_prev": page > 1,
         }
 
+    async def _list_fused(
+        self,
+        query: dict[str, Any],
+        sort_spec: Sequence[tuple[str, int]],
+        skip: int,
+        limit: int,
+        projection: dict[str, int] | None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        items_pipeline: list[dict[str, Any]] = []
+        if sort_spec:
+            items_pipeline.append({"$sort": dict(sort_spec)})
+        items_pipeline.extend([{"$skip": skip}, {"$limit": limit}])
+        if projection:
+            items_pipeline.append({"$project": projection})
+
+        pipeline = [
+            {"$match": query},
+            {"$facet": {"items": items_pipeline, "meta": [{"$count": "total"}]}},
+        ]
+        result = await self.collection.aggregate(pipeline).to_list(1)
+
+        facets = result[0]
+        total = facets["meta"][0]["total"] if facets["meta"] else 0
+        return facets["items"], total
+
     async def get(self, id: str | ObjectId) -> dict[str, Any]:
         if isinstance(id, str):
             try:
@@ -83,7 +162,7 @@ class CRUDOperations:
 
         return document
 
-    async def create(self, data: dict[str, Any]) -> dict[str, Any]:
+    async def create(self, data: dict[str, Any], *, refetch: bool = False) -> dict[str, Any]:
         if not data:
             raise ValueError("Document data cannot be empty")
 
@@ -95,9 +174,14 @@ class CRUDOperations:
                 raise ValueError(f"Invalid _id: {data['_id']}") from e
 
         result = await self.collection.insert_one(data)
+        self._invalidate()
+
+        # Without server-side defaults the stored document is exactly what was sent
+        if refetch:
+            return await self.collection.find_one({"_id": result.inserted_id})
 
-        created = await self.collection.find_one({"_id": result.inserted_id})
-        return created
+        data["_id"] = result.inserted_id
+        return data
 
     async def update(
         self, id: str | ObjectId, data: dict[str, Any], *, partial: bool = True
@@ -116,15 +200,20 @@ class CRUDOperations:
             data = data.copy()
             del data["_id"]
 
+        # Write and read back the new version in one round trip
         if partial:
-            result = await self.collection.update_one({"_id": id}, {"$set": data})
+            updated = await self.collection.find_one_and_update(
+                {"_id": id}, {"$set": data}, return_document=ReturnDocument.AFTER
+            )
         else:
-            result = await self.collection.replace_one({"_id": id}, data)
+            updated = await self.collection.find_one_and_replace(
+                {"_id": id}, data, return_document=ReturnDocument.AFTER
+            )
 
-        if result.matched_count == 0:
+        if updated is None:
             raise KeyError(f"Document with _id={id} not found in {self.admin.name}")
+        self._invalidate()
 
-        updated = await self.collection.find_one({"_id": id})
         return updated
 
     async def delete(self, id: str | ObjectId) -> bool:
@@ -135,27 +224,23 @@ class CRUDOperations:
                 raise ValueError(f"Invalid ObjectId: {id}") from e
 
         result = await self.collection.delete_one({"_id": id})
+        self._invalidate()
         return result.deleted_count > 0
 
-    async def bulk_delete(self, ids: list[str | ObjectId]) -> dict[str, Any]:
-        object_ids = []
-        for id in ids:
-            if isinstance(id, str):
-                try:
-                    object_ids.append(ObjectId(id))
-                except InvalidId:
-                    continue  # Skip invalid IDs
-            else:
-                object_ids.append(id)
-
-    async def bulk_create(self, documents: list[dict]) -> list[dict]:
+    async def bulk_create(self, documents: list[dict], *, chunk: int = 1000) -> list[dict]:
         if not documents:
             return []
         
-        result = await self.collection.insert_many(documents)
-        
-        for doc, inserted_id in zip(documents, result.inserted_ids):
-            doc["_id"] = inserted_id
+        # One unordered insert_many per chunk keeps each wire message bounded
+        try:
+            for start in range(0, len(documents), chunk):
+                batch = documents[start:start + chunk]
+                result = await self.collection.insert_many(batch, ordered=False)
+                
+                for doc, inserted_id in zip(batch, result.inserted_ids):
+                    doc["_id"] = inserted_id
+        finally:
+            self._invalidate()
         
         return documents
     
@@ -163,40 +248,82 @@ class CRUDOperations:
         self,
         updates: list[dict[str, Any]]
     ) -> dict[str, Any]:
-        from pymongo import UpdateOne
-        
         requests = [
             UpdateOne(op["filter"], op["update"])
             for op in updates
         ]
         
         result = await self.collection.bulk_write(requests)
+        self._invalidate()
+        
+        return {
+            "matched": result.matched_count,
+            "modified": result.modified_count,
+            "upserted": result.upserted_count
+        }
+    
+    async def bulk_write(
+        self, operations: list[InsertOne | UpdateOne | ReplaceOne | DeleteOne]
+    ) -> dict[str, int]:
+        if not operations:
+            return {"inserted": 0, "matched": 0, "modified": 0, "deleted": 0, "upserted": 0}
+        
+        try:
+            result = await self.collection.bulk_write(operations, ordered=False)
+        finally:
+            self._invalidate()
         
         return {
+            "inserted": result.inserted_count,
             "matched": result.matched_count,
             "modified": result.modified_count,
+            "deleted": result.deleted_count,
             "upserted": result.upserted_count
         }
     
-    async def bulk_delete(self, ids: list[str]) -> int:
+    async def bulk_delete(self, ids: list[str | ObjectId]) -> int:
         if not ids:
             return 0
         
-        object_ids = [self._to_object_id(id_str) for id_str in ids]
+        # Every ID is checked before anything is deleted; a structural check avoids a
+        # try/except per ID
+        object_ids = list(map(_fast_object_id, ids))
+        if None in object_ids:
+            invalid = [id for id, oid in zip(ids, object_ids) if oid is None]
+            raise ValueError(f"Invalid ObjectId: {', '.join(map(str, invalid))}")
         
         result = await self.collection.delete_many({
             "_id": {"$in": object_ids}
         })
+        self._invalidate()
         
         return result.deleted_count
 
     async def count(self, filters: dict[str, Any] | None = None) -> int:
         query = QueryBuilder.build_filter(filters) if filters else {}
+        # Unfiltered totals come from collection metadata instead of a scan; on
+        # sharded clusters this may briefly include orphaned or in-flight documents
+        if not query:
+            return await self.collection.estimated_document_count()
         return await self.collection.count_documents(query)
 
-    async def exists(self, id: str | ObjectId) -> bool:
-        try:
-            await self.get(id)
-            return True
-        except (ValueError, KeyError):
-            return False
+    async def exists(self, id: Any) -> bool:
+        oid = _fast_object_id(id)
+        if oid is None:
+            # Int or other string _ids are looked up as given, without the cache
+            return await self.collection.find_one({"_id": id}, {"_id": 1}) is not None
+
+        now = time.monotonic()
+        cache = _EXISTS_CACHE.setdefault(self.collection.full_name, {})
+        cached = cache.get(oid)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
+        # Only the _id comes back, not the document body
+        found = await self.collection.find_one({"_id": oid}, {"_id": 1}) is not None
+        # A write during the query replaced this collection's dict, so the answer
+        # lands in the orphaned one and is never served
+        if len(cache) >= EXISTS_CACHE_SIZE:
+            cache.clear()
+        cache[oid] = (found, now + EXISTS_CACHE_TTL)
+        return found
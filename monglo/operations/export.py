@@ -3,22 +3,83 @@ from __future__ import annotations
 
 import csv
 import json
-from datetime import date, datetime
+import re
+import warnings
 from io import StringIO
-from typing import Any, Literal
-
-from bson import ObjectId
+from typing import Any, AsyncIterator, Literal
+
+from ..serializers.json import _has_non_finite
+from ._serializer import serialize_document, serialize_value
+
+try:
+    import orjson
+except ImportError:  # Optional: pip install monglo[export]
+    orjson = None
+
+# Documents fetched and encoded per chunk when streaming an export
+EXPORT_BATCH_SIZE = 1000
+# Characters that make csv.QUOTE_MINIMAL quote a field
+_CSV_SPECIAL = re.compile(r'[,"\r\n]').search
+
+def _orjson_default(value: Any) -> Any:
+    # orjson encodes dict/list/datetime/date natively; everything else mirrors default=str
+    if isinstance(value, bytes):
+        return value.hex()
+    return str(value)
+
+def _orjson_encode(value: Any, option: int = 0) -> bytes | None:
+    # None when the stdlib must encode instead: orjson rejects integers wider than
+    # 64 bits and writes NaN/Infinity as null
+    try:
+        encoded = orjson.dumps(
+            value, default=_orjson_default, option=option | orjson.OPT_NON_STR_KEYS
+        )
+    except orjson.JSONEncodeError:
+        return None
+    # Only scan for NaN/Infinity when the output could hold one
+    if b"null" in encoded and _has_non_finite(value):
+        return None
+    return encoded
+
+def _csv_field(value: Any) -> str:
+    # Same text csv.writer emits for one field under QUOTE_MINIMAL
+    if value is None:
+        return ""
+    text = value if type(value) is str else str(value)
+    if _CSV_SPECIAL(text):
+        return '"' + text.replace('"', '""') + '"'
+    return text
 
 class ExportOperations:
 
     def to_json(
-        self, documents: list[dict[str, Any]], *, pretty: bool = False, ensure_ascii: bool = False
+        self,
+        documents: list[dict[str, Any]],
+        *,
+        pretty: bool = False,
+        ensure_ascii: bool = False,
+        compact: bool = False,
     ) -> str:
+        # Compact output has no space after separators. Only that format is handed to
+        # orjson, which encodes BSON documents without a pre-serialization pass but
+        # always emits UTF-8, so escaped output stays on the stdlib encoder
+        if compact and orjson is not None and not ensure_ascii:
+            encoded = _orjson_encode(documents, orjson.OPT_INDENT_2 if pretty else 0)
+            if encoded is not None:
+                return encoded.decode()
+
         # Serialize documents
-        serialized = [self._serialize_document(doc) for doc in documents]
+        serialized = [self._serialize_fast(doc) for doc in documents]
 
         indent = 2 if pretty else None
-        return json.dumps(serialized, indent=indent, ensure_ascii=ensure_ascii, default=str)
+        separators = (",", ":") if compact and not pretty else None
+        return json.dumps(
+            serialized,
+            indent=indent,
+            separators=separators,
+            ensure_ascii=ensure_ascii,
+            default=str,
+        )
 
     def to_csv(
         self,
@@ -26,6 +87,7 @@ class ExportOperations:
         *,
         fields: list[str] | None = None,
         include_headers: bool = True,
+        fast_mode: bool = True,
     ) -> str:
         if not documents:
             return ""
@@ -34,6 +96,15 @@ class ExportOperations:
         if fields is None:
             fields = list(documents[0].keys())
 
+        # csv.writer quotes a lone empty field, so single-column exports keep using it
+        if fast_mode and len(fields) > 1:
+            lines = [",".join(map(_csv_field, fields))] if include_headers else []
+            for doc in documents:
+                serialized = self._serialize_fast(doc)
+                lines.append(",".join([_csv_field(serialized.get(field, "")) for field in fields]))
+            lines.append("")
+            return "\r\n".join(lines)
+
         output = StringIO()
         writer = csv.DictWriter(output, fieldnames=fields)
 
@@ -43,41 +114,39 @@ class ExportOperations:
         # Write rows
         for doc in documents:
             # Serialize and filter fields
-            serialized = self._serialize_document(doc)
+            serialized = self._serialize_fast(doc)
             row = {field: serialized.get(field, "") for field in fields}
             writer.writerow(row)
 
         return output.getvalue()
 
-    def to_ndjson(self, documents: list[dict[str, Any]]) -> str:
+    def to_ndjson(self, documents: list[dict[str, Any]], *, compact: bool = False) -> str:
+        # The default keeps ASCII-escaped lines with spaced separators; compact lines
+        # are unescaped UTF-8 without spaces, the format orjson produces
+        options: dict[str, Any] = {}
+        if compact:
+            options = {"separators": (",", ":"), "ensure_ascii": False}
+
+        use_orjson = compact and orjson is not None
         lines = []
         for doc in documents:
-            serialized = self._serialize_document(doc)
-            lines.append(json.dumps(serialized, default=str))
+            encoded = _orjson_encode(doc) if use_orjson else None
+            if encoded is not None:
+                lines.append(encoded.decode())
+                continue
+            serialized = self._serialize_fast(doc)
+            lines.append(json.dumps(serialized, default=str, **options))
 
         return "\n".join(lines)
 
-    def _serialize_document(self, doc: dict[str, Any]) -> dict[str, Any]:
-        serialized = {}
-
-        for key, value in doc.items():
-            serialized[key] = self._serialize_value(value)
+    def _serialize_fast(self, doc: dict[str, Any]) -> dict[str, Any]:
+        return serialize_document(doc)
 
-        return serialized
+    def _serialize_document(self, doc: dict[str, Any]) -> dict[str, Any]:
+        return {key: serialize_value(value) for key, value in doc.items()}
 
     def _serialize_value(self, value: Any) -> Any:
-        if isinstance(value, ObjectId):
-            return str(value)
-        elif isinstance(value, (datetime, date)):
-            return value.isoformat()
-        elif isinstance(value, dict):
-            return self._serialize_document(value)
-        elif isinstance(value, list):
-            return [self._serialize_value(v) for v in value]
-        elif isinstance(value, bytes):
-            return value.hex()  # Convert binary to hex string
-        else:
-            return value
+        return serialize_value(value)
 
 class ExportFormat:
 
@@ -85,30 +154,82 @@ class ExportFormat:
     CSV = "csv"
     NDJSON = "ndjson"
 
-async def export_collection(
+async def stream_export(
     collection,
     *,
     format: Literal["json", "csv", "ndjson"] = "json",
     query: dict[str, Any] | None = None,
     fields: list[str] | None = None,
     limit: int | None = None,
-    **kwargs,
-) -> str:
-    cursor = collection.find(query or {})
+    batch_size: int = EXPORT_BATCH_SIZE,
+    pretty: bool = False,
+    ensure_ascii: bool = False,
+    compact: bool = False,
+    include_headers: bool = True,
+    **writer_options: Any,
+) -> AsyncIterator[str]:
+    """Yield an export in chunks of at most ``batch_size`` documents.
+
+    Concatenating the chunks gives the complete export, so callers can write
+    them straight to a file or a streaming HTTP response. Other keyword
+    arguments are passed to the format's ``ExportOperations`` writer.
+    """
+    if format not in ("json", "csv", "ndjson"):
+        raise ValueError(f"Unsupported export format: {format}")
+
+    if format == "ndjson" and writer_options:
+        # NDJSON exports used to drop extra keywords silently
+        warnings.warn(
+            f"Ignoring options not supported by NDJSON export: {', '.join(writer_options)}; "
+            "passing them will raise TypeError in a future release",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        writer_options = {}
+
+    cursor = collection.find(query or {}).batch_size(batch_size)
 
     if limit:
         cursor = cursor.limit(limit)
 
-    documents = await cursor.to_list(limit or 0)
-
-    # Export
     exporter = ExportOperations()
+    first = True
 
     if format == "json":
-        return exporter.to_json(documents, **kwargs)
-    elif format == "csv":
-        return exporter.to_csv(documents, fields=fields, **kwargs)
-    elif format == "ndjson":
-        return exporter.to_ndjson(documents)
-    else:
-        raise ValueError(f"Unsupported export format: {format}")
+        yield "["
+
+    while batch := await cursor.to_list(batch_size):
+        if format == "json":
+            # Drop each batch's enclosing brackets; the stream supplies one pair
+            chunk = exporter.to_json(
+                batch, pretty=pretty, ensure_ascii=ensure_ascii, compact=compact, **writer_options
+            )[1:-1]
+            yield chunk if first else "," + chunk
+        elif format == "csv":
+            if fields is None:
+                fields = list(batch[0].keys())
+            yield exporter.to_csv(
+                batch, fields=fields, include_headers=include_headers and first, **writer_options
+            )
+        else:
+            chunk = exporter.to_ndjson(batch, compact=compact)
+            yield chunk if first else "\n" + chunk
+
+        first = False
+
+    if format == "json":
+        yield "]"
+
+async def export_collection(
+    collection,
+    *,
+    format: Literal["json", "csv", "ndjson"] = "json",
+    query: dict[str, Any] | None = None,
+    fields: list[str] | None = None,
+    limit: int | None = None,
+    **kwargs,
+) -> str:
+    chunks = stream_export(
+        collection, format=format, query=query, fields=fields, limit=limit, **kwargs
+    )
+    return "".join([chunk async for chunk in chunks])
@@ -1,15 +1,114 @@
 
 from __future__ import annotations
 
-from typing import Any, Literal
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Literal, NamedTuple
 
+import bson
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.errors import ExecutionTimeout
+
+from ._count_cache import cached_count, peek_count
+
+# Pages past this one are fetched from the nearest known anchor instead of skip()
+ANCHOR_PAGE_THRESHOLD = 10
+# Number of (query, sort, per_page) combinations whose page anchors are remembered
+_ANCHOR_CACHE_SIZE = 256
+# Server-side time limit for an exact count before falling back
+EXACT_COUNT_MAX_TIME_MS = 5000
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+class PaginationMeta(NamedTuple):
+    total: int | None
+    total_exact: bool
+    page: int
+    per_page: int
+    total_pages: int | None
+    has_next: bool
+    has_prev: bool
+    strategy: str = "offset"
+
+class CursorPaginationMeta(NamedTuple):
+    per_page: int
+    has_next: bool
+    next_cursor: Any
+    sort_field: str
+    strategy: str = "cursor"
+
+def _query_key(query: dict[str, Any]) -> bytes:
+    return hashlib.blake2b(bson.encode(query), digest_size=16).digest()
+
+def _cursor_value(cursor: str | ObjectId) -> Any:
+    # Opaque cursors that aren't ObjectId hex are compared as plain strings
+    if type(cursor) is str and len(cursor) == 24 and _HEX_DIGITS.issuperset(cursor):
+        return ObjectId(cursor)
+    return cursor
+
+def _total_pages(total: int, per_page: int) -> int:
+    if per_page <= 0:
+        return 1
+    # Ceiling division via floor division of the negation
+    return -(-total // per_page)
+
+@lru_cache(maxsize=64)
+def _sort_spec(field: str, direction: int) -> list[tuple[str, int]]:
+    # Shared between calls; treat as immutable
+    return [(field, direction)]
 
 class PaginationHandler:
 
     def __init__(self, collection: AsyncIOMotorCollection) -> None:
         self.collection = collection
+        # (query hash, sort direction, per_page) -> {page: last _id on that page}. Never
+        # invalidated: after inserts or deletes before an anchor, deep pages start from
+        # where that page used to end, so pages may shift until the handler is replaced
+        self._anchor_cache: OrderedDict[tuple, dict[int, Any]] = OrderedDict()
+
+    def _nearest_anchor(self, key: tuple, page: int) -> tuple[int, Any] | None:
+        anchors = self._anchor_cache.get(key)
+        if not anchors:
+            return None
+
+        self._anchor_cache.move_to_end(key)
+        anchor_page = max((p for p in anchors if p < page), default=None)
+        if anchor_page is None:
+            return None
+        return anchor_page, anchors[anchor_page]
+
+    def _remember_anchor(self, key: tuple, page: int, items: list[dict[str, Any]]) -> None:
+        if not items or "_id" not in items[-1]:
+            return
+
+        anchors = self._anchor_cache.get(key)
+        if anchors is None:
+            anchors = self._anchor_cache[key] = {}
+            if len(self._anchor_cache) > _ANCHOR_CACHE_SIZE:
+                self._anchor_cache.popitem(last=False)
+        anchors[page] = items[-1]["_id"]
+
+    async def _count(self, query: dict[str, Any], exact: bool) -> tuple[int | None, bool]:
+        # Returns (total, total_exact); total is None when no cheap figure exists
+        if exact:
+            try:
+                total = await cached_count(
+                    self.collection, query, max_time_ms=EXACT_COUNT_MAX_TIME_MS
+                )
+                return total, True
+            except ExecutionTimeout:
+                pass
+        else:
+            total = peek_count(self.collection, query)
+            if total is not None:
+                return total, True
+
+        # Collection metadata only describes the unfiltered collection
+        if not query:
+            return await self.collection.estimated_document_count(), False
+
+        return None, False
 
     async def paginate_offset(
         self,
@@ -19,31 +118,76 @@ class PaginationHandler:
         per_page: int = 20,
         sort: list[tuple[str, int]] | None = None,
         projection: dict[str, int] | None = None,
+        exact_count: bool | None = None,
+        struct_response: bool = False,
     ) -> dict[str, Any]:
         page = max(1, page)
         per_page = max(1, min(per_page, 100))
 
         skip = (page - 1) * per_page
 
-        total = await self.collection.count_documents(query)
+        # Only the first page pays for an exact count unless the caller asks otherwise
+        if exact_count is None:
+            exact_count = page == 1
+        total, total_exact = await self._count(query, exact_count)
+
+        # Anchors are only sound for a unique sort key, so only an _id sort uses them
+        anchor_key = None
+        if sort and len(sort) == 1 and sort[0][0] == "_id":
+            anchor_key = (_query_key(query), sort[0][1], per_page)
+
+        anchor = None
+        if anchor_key is not None and page > ANCHOR_PAGE_THRESHOLD:
+            anchor = self._nearest_anchor(anchor_key, page)
 
-        cursor = self.collection.find(query, projection or {})
+        if anchor is not None:
+            # Seek past the anchor on the _id index rather than walking skipped documents
+            anchor_page, anchor_id = anchor
+            bound = {"$gt" if sort[0][1] >= 0 else "$lt": anchor_id}
+            anchor_skip = (page - anchor_page - 1) * per_page
 
-        if sort:
-            cursor = cursor.sort(sort)
+            # The server skips the pages between the anchor and the target
+            cursor = self.collection.find({"$and": [query, {"_id": bound}]}, projection or {})
+            cursor = cursor.sort(sort).skip(anchor_skip)
+            docs = await cursor.limit(per_page + 1).to_list(per_page + 1)
+            items = docs[:per_page]
+            more = len(docs) > per_page
+        else:
+            cursor = self.collection.find(query, projection or {})
 
-        items = await cursor.skip(skip).limit(per_page).to_list(per_page)
+            if sort:
+                cursor = cursor.sort(sort)
 
-        total_pages = (total + per_page - 1) // per_page if per_page > 0 else 1
+            docs = await cursor.skip(skip).limit(per_page + 1).to_list(per_page + 1)
+            items = docs[:per_page]
+            more = len(docs) > per_page
+
+        if anchor_key is not None and len(items) == per_page:
+            self._remember_anchor(anchor_key, page, items)
+
+        if total is None:
+            total_pages = None
+            has_next = more
+        else:
+            total_pages = _total_pages(total, per_page)
+            has_next = page < total_pages
+
+        # NamedTuples encode as JSON arrays, so dict metadata stays the default
+        if struct_response:
+            meta = PaginationMeta(
+                total, total_exact, page, per_page, total_pages, has_next, page > 1
+            )
+            return {"items": items, "pagination": meta}
 
         return {
             "items": items,
             "pagination": {
                 "total": total,
+                "total_exact": total_exact,
                 "page": page,
                 "per_page": per_page,
                 "total_pages": total_pages,
-                "has_next": page < total_pages,
+                "has_next": has_next,
                 "has_prev": page > 1,
                 "strategy": "offset",
             },
@@ -53,21 +197,19 @@ class PaginationHandler:
         self,
         query: dict[str, Any],
         *,
-        cursor: str | None = None,
+        cursor: str | ObjectId | None = None,
         per_page: int = 20,
         sort_field: str = "_id",
         sort_direction: int = 1,
         projection: dict[str, int] | None = None,
+        struct_response: bool = False,
     ) -> dict[str, Any]:
         per_page = max(1, min(per_page, 100))
 
         cursor_query = query.copy()
 
         if cursor:
-            try:
-                cursor_value = ObjectId(cursor)
-            except Exception:
-                cursor_value = cursor
+            cursor_value = _cursor_value(cursor)
 
             if sort_direction >= 0:
                 cursor_query[sort_field] = {"$gt": cursor_value}
@@ -75,7 +217,7 @@ class PaginationHandler:
                 cursor_query[sort_field] = {"$lt": cursor_value}
 
         cursor_obj = self.collection.find(cursor_query, projection or {})
-        cursor_obj = cursor_obj.sort(sort_field, sort_direction)
+        cursor_obj = cursor_obj.sort(_sort_spec(sort_field, sort_direction))
         items = await cursor_obj.limit(per_page + 1).to_list(per_page + 1)
 
         has_next = len(items) > per_page
@@ -91,6 +233,10 @@ class PaginationHandler:
             else:
                 next_cursor = next_cursor_value
 
+        if struct_response:
+            meta = CursorPaginationMeta(per_page, has_next, next_cursor, sort_field)
+            return {"items": items, "pagination": meta}
+
         return {
             "items": items,
             "pagination": {
@@ -103,8 +249,12 @@ class PaginationHandler:
         }
 
     async def get_page_info(self, query: dict[str, Any], per_page: int = 20) -> dict[str, int]:
-        total = await self.collection.count_documents(query)
-        total_pages = (total + per_page - 1) // per_page if per_page > 0 else 1
+        if query:
+            total = await cached_count(self.collection, query)
+        else:
+            # Metadata read instead of a scan; may be slightly stale on sharded clusters
+            total = await self.collection.estimated_document_count()
+        total_pages = _total_pages(total, per_page)
 
         return {"total": total, "per_page": per_page, "total_pages": total_pages}
 
@@ -1,13 +1,83 @@
 
+import asyncio
+import re
+from functools import lru_cache
 from typing import Any
 
+from bson.regex import Regex
 from motor.motor_asyncio import AsyncIOMotorCollection
 
+from .pagination import _total_pages
+
+_TEXT_SCORE = {"$meta": "textScore"}
+# Upper bound on documents per server round trip when fetching a search page
+SEARCH_BATCH_SIZE = 1000
+
+@lru_cache(maxsize=512)
+def _bson_regex(pattern: str, options: str) -> Regex:
+    # Shared between calls and $or branches; treat as immutable
+    return Regex(pattern, options)
+
 class SearchOperations:
 
-    def __init__(self, collection: AsyncIOMotorCollection, search_fields: list[str] | None = None):
+    def __init__(
+        self,
+        collection: AsyncIOMotorCollection,
+        search_fields: list[str] | None = None,
+        *,
+        use_text_index: bool | None = False,
+        prefix_only: bool = False,
+        projection: dict[str, Any] | None = None,
+    ):
         self.collection = collection
         self.search_fields = search_fields or []
+        # False keeps substring $regex matching; True always uses $text, which matches
+        # whole stemmed words; None uses $text only if the collection has a text index
+        self.use_text_index = use_text_index
+        # Result of text index detection; None until detected or after a refresh
+        self._text_indexed: bool | None = None
+        # Match only at the start of a field, which an index on the field can serve
+        self.prefix_only = prefix_only
+        # Fields returned by search(); None returns whole documents
+        self.projection = projection
+
+    async def _has_text_index(self) -> bool:
+        if self.use_text_index is not None:
+            return self.use_text_index
+
+        if self._text_indexed is None:
+            await self.refresh_text_index()
+        return self._text_indexed
+
+    async def refresh_text_index(self) -> bool:
+        # Re-detects the text index, e.g. after one was created or dropped elsewhere
+        info = await self.collection.index_information()
+        self._text_indexed = any(
+            kind == "text" for index in info.values() for _, kind in index["key"]
+        )
+        return self._text_indexed
+
+    async def _build_filter(self, query: str, case_sensitive: bool) -> tuple[dict[str, Any], bool]:
+        # Returns (filter, uses_text_index)
+        if await self._has_text_index():
+            return {"$text": {"$search": query, "$caseSensitive": case_sensitive}}, True
+
+        if self.prefix_only:
+            # Anchored, escaped and without a trailing .*, so the index range can be
+            # bounded; only case-sensitive patterns get tight bounds, since collations
+            # don't apply to $regex
+            query = "^" + re.escape(query)
+
+        regex = _bson_regex(query, "" if case_sensitive else "i")
+        return {"$or": [{field: regex} for field in self.search_fields]}, False
+
+    async def create_text_index(self, weights: dict[str, int] | None = None) -> str:
+        # A collection allows a single text index, covering every search field
+        name = await self.collection.create_index(
+            [(field, "text") for field in self.search_fields], weights=weights or {}
+        )
+        self._text_indexed = True
+        return name
 
     async def search(
         self, query: str, *, case_sensitive: bool = False, limit: int = 100, skip: int = 0
@@ -15,51 +85,122 @@ class SearchOperations:
         if not query or not self.search_fields:
             return []
 
-        options = "" if case_sensitive else "i"
-        conditions = [
-            {field: {"$regex": query, "$options": options}} for field in self.search_fields
-        ]
+        query_filter, text = await self._build_filter(query, case_sensitive)
 
-        cursor = self.collection.find({"$or": conditions}).skip(skip).limit(limit)
+        if text:
+            # Best matches first, ranked by the server's relevance score
+            projection = {**(self.projection or {}), "score": _TEXT_SCORE}
+            cursor = self.collection.find(query_filter, projection)
+            cursor = cursor.sort([("score", _TEXT_SCORE)])
+        else:
+            cursor = self.collection.find(query_filter, self.projection)
+
+        # Ship the whole page in one batch instead of the default 101 + getMore
+        cursor = cursor.skip(skip).limit(limit).batch_size(min(limit, SEARCH_BATCH_SIZE))
         return await cursor.to_list(limit)
 
     async def search_with_highlight(
         self, query: str, *, limit: int = 100, skip: int = 0
     ) -> list[dict[str, Any]]:
-        results = await self.search(query, limit=limit, skip=skip)
+        if not query or not self.search_fields:
+            return []
 
-        query_lower = query.lower()
-        for doc in results:
-            doc["_matched_fields"] = [
-                field
-                for field in self.search_fields
-                if field in doc and query_lower in str(doc[field]).lower()
-            ]
+        query_filter, text = await self._build_filter(query, False)
+        pipeline: list[dict[str, Any]] = [{"$match": query_filter}]
+        if text:
+            pipeline.append({"$sort": {"score": _TEXT_SCORE}})
+        pipeline.append({"$skip": skip})
+        if limit:
+            pipeline.append({"$limit": limit})
+
+        # Flag matching fields on the server, for the returned page only; values
+        # that can't convert to a string (arrays, subdocuments) never match
+        pattern = re.escape(query)
+        flagged = [
+            {
+                "$cond": [
+                    {
+                        "$regexMatch": {
+                            "input": {
+                                "$convert": {
+                                    "input": f"${field}",
+                                    "to": "string",
+                                    "onError": "",
+                                    "onNull": "",
+                                }
+                            },
+                            "regex": pattern,
+                            "options": "i",
+                        }
+                    },
+                    field,
+                    None,
+                ]
+            }
+            for field in self.search_fields
+        ]
+        added: dict[str, Any] = {
+            "_matched_fields": {
+                "$filter": {"input": flagged, "as": "field", "cond": {"$ne": ["$$field", None]}}
+            }
+        }
+        if text:
+            added["score"] = _TEXT_SCORE
+        pipeline.append({"$addFields": added})
 
-        return results
+        return await self.collection.aggregate(pipeline).to_list(limit)
 
     async def search_count(self, query: str, *, case_sensitive: bool = False) -> int:
         if not query or not self.search_fields:
             return 0
 
-        options = "" if case_sensitive else "i"
-        conditions = [
-            {field: {"$regex": query, "$options": options}} for field in self.search_fields
-        ]
-
-        return await self.collection.count_documents({"$or": conditions})
+        query_filter, _ = await self._build_filter(query, case_sensitive)
+        return await self.collection.count_documents(query_filter)
 
     async def search_paginated(
-        self, query: str, *, page: int = 1, per_page: int = 20, case_sensitive: bool = False
+        self,
+        query: str,
+        *,
+        page: int = 1,
+        per_page: int = 20,
+        case_sensitive: bool = False,
+        fuse: bool = False,
     ) -> dict[str, Any]:
         skip = (page - 1) * per_page
-        items = await self.search(query, case_sensitive=case_sensitive, limit=per_page, skip=skip)
-        total = await self.search_count(query, case_sensitive=case_sensitive)
+        items: list[dict[str, Any]] = []
+        total = 0
+
+        if query and self.search_fields and not fuse:
+            # Detect the text index once, then overlap the independent page and count
+            await self._has_text_index()
+            items, total = await asyncio.gather(
+                self.search(query, case_sensitive=case_sensitive, limit=per_page, skip=skip),
+                self.search_count(query, case_sensitive=case_sensitive),
+            )
+        elif query and self.search_fields:
+            query_filter, text = await self._build_filter(query, case_sensitive)
+
+            # One round trip; the match predicate is evaluated once for both facets, but
+            # the page must fit in a single 16MB result document
+            pipeline: list[dict[str, Any]] = [{"$match": query_filter}]
+            items_pipeline: list[dict[str, Any]] = []
+            if text:
+                pipeline.append({"$addFields": {"score": _TEXT_SCORE}})
+                items_pipeline.append({"$sort": {"score": -1}})
+            items_pipeline += [{"$skip": skip}, {"$limit": per_page}]
+            pipeline.append(
+                {"$facet": {"items": items_pipeline, "total": [{"$count": "n"}]}}
+            )
+
+            result = await self.collection.aggregate(pipeline).to_list(1)
+            if result:
+                items = result[0]["items"]
+                total = result[0]["total"][0]["n"] if result[0]["total"] else 0
 
         return {
             "items": items,
             "total": total,
             "page": page,
             "per_page": per_page,
-            "pages": (total + per_page - 1) // per_page,
+            "pages": _total_pages(total, per_page),
         }
@@ -1,11 +1,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import re
 from typing import Any, Callable, TYPE_CHECKING
 
+from pymongo.errors import PyMongoError
+
 if TYPE_CHECKING:
     from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorClientSession
 
+# Server error codes worth retrying
+_TRANSIENT_CODES = frozenset({
+    112,  # WriteConflict
+    117,  # CappedPositionLost
+    262,  # ExceededTimeLimit
+    11600, # InterruptedAtShutdown
+    11602, # InterruptedDueToReplStateChange
+})
+# Error message wording that marks a retryable failure
+_TRANSIENT_MESSAGE = re.compile(r"transient|temporary|timeout|interrupted", re.IGNORECASE)
+# Exponential backoff in seconds before each retry attempt
+_BACKOFFS = tuple(0.1 * (1 << attempt) for attempt in range(16))
+
 class TransactionManager:
     
     def __init__(self, client: AsyncIOMotorClient):
@@ -38,8 +55,6 @@ class TransactionManager:
         operation: Callable,
         max_retries: int = 3
     ) -> Any:
-        from pymongo.errors import PyMongoError
-        
         last_error = None
         
         for attempt in range(max_retries):
@@ -54,29 +69,12 @@ class TransactionManager:
                     raise
                 
                 # Wait before retry (exponential backoff)
-                import asyncio
-                await asyncio.sleep(0.1 * (2 ** attempt))
+                await asyncio.sleep(_BACKOFFS[min(attempt, len(_BACKOFFS) - 1)])
         
         raise last_error
     
     def _is_transient_error(self, error: Exception) -> bool:
-        error_codes = [
-            112,  # WriteConflict
-            117,  # CappedPositionLost  
-            262,  # ExceededTimeLimit
-            11600, # InterruptedAtShutdown
-            11602, # InterruptedDueToReplStateChange
-        ]
-        
-        if hasattr(error, 'code') and error.code in error_codes:
+        if getattr(error, 'code', None) in _TRANSIENT_CODES:
             return True
         
-        error_msg = str(error).lower()
-        transient_keywords = [
-            'transient',
-            'temporary',
-            'timeout',
-            'interrupted'
-        ]
-        
-        return any(keyword in error_msg for keyword in transient_keywords)
+        return _TRANSIENT_MESSAGE.search(str(error)) is not None
@@ -1,61 +1,91 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..core.registry import CollectionAdmin
     from ..fields.base import BaseField
 
+def _holds_value(document: dict[str, Any], path: str, value: Any) -> bool:
+    # Mirrors the equality match the query used, including dotted paths and arrays
+    return _path_holds(document, path.split("."), value)
+
+def _path_holds(current: Any, keys: list[str], value: Any) -> bool:
+    for position, key in enumerate(keys):
+        if isinstance(current, list):
+            # A path through an array matches if any element (or the indexed one) does
+            rest = keys[position:]
+            if key.isdigit() and int(key) < len(current):
+                if _path_holds(current[int(key)], keys[position + 1:], value):
+                    return True
+            return any(_path_holds(item, rest, value) for item in current if isinstance(item, dict))
+        if not isinstance(current, dict) or key not in current:
+            return False
+        current = current[key]
+    return current == value or (isinstance(current, list) and value in current)
+
 class DataValidator:
     
     def __init__(self, collection_admin: CollectionAdmin):
         self.collection_admin = collection_admin
         self.config = collection_admin.config
+        
+        # Configs are fixed once registered, so the optional settings are resolved here
+        self._required = tuple(getattr(self.config, 'required_fields', None) or ())
+        fields = getattr(self.config, 'fields', None)
+        self._validators = tuple(
+            (field_name, field_def.validate)
+            for field_name, field_def in (fields.items() if isinstance(fields, dict) else ())
+            if hasattr(field_def, 'validate')
+        )
+        self._unique = tuple(getattr(self.config, 'unique_fields', None) or ())
     
     async def validate(self, data: dict[str, Any], is_update: bool = False) -> list[dict[str, str]]:
+        # Custom validation rules hit the database; yield once so their query is in
+        # flight while the local checks run
+        custom_rules = asyncio.ensure_future(self._validate_custom_rules(data))
+        await asyncio.sleep(0)
         errors = []
         
-        if not is_update:
-            errors.extend(self._validate_required_fields(data))
-        
-        errors.extend(self._validate_field_values(data))
+        try:
+            if not is_update:
+                errors.extend(self._validate_required_fields(data))
+            
+            errors.extend(self._validate_field_values(data))
+        except BaseException:
+            custom_rules.cancel()
+            raise
         
-        # Custom validation rules
-        errors.extend(await self._validate_custom_rules(data))
+        errors.extend(await custom_rules)
         
         return errors
     
     def _validate_required_fields(self, data: dict[str, Any]) -> list[dict[str, str]]:
         errors = []
         
-        if hasattr(self.config, 'required_fields'):
-            for field in self.config.required_fields:
-                if field not in data or data[field] is None:
-                    errors.append({
-                        "field": field,
-                        "error": "required",
-                        "message": f"Field '{field}' is required"
-                    })
+        for field in self._required:
+            if field not in data or data[field] is None:
+                errors.append({
+                    "field": field,
+                    "error": "required",
+                    "message": f"Field '{field}' is required"
+                })
         
         return errors
     
     def _validate_field_values(self, data: dict[str, Any]) -> list[dict[str, str]]:
         errors = []
         
-        if hasattr(self.config, 'fields'):
-            for field_name, field_def in self.config.fields.items():
-                if field_name in data:
-                    value = data[field_name]
-                    
-                    # Use field's validate method if available
-                    if hasattr(field_def, 'validate'):
-                        if not field_def.validate(value):
-                            errors.append({
-                                "field": field_name,
-                                "error": "invalid_value",
-                                "message": f"Invalid value for field '{field_name}'"
-                            })
+        # Only fields whose definition has a validate method are checked
+        for field_name, validate in self._validators:
+            if field_name in data and not validate(data[field_name]):
+                errors.append({
+                    "field": field_name,
+                    "error": "invalid_value",
+                    "message": f"Invalid value for field '{field_name}'"
+                })
         
         return errors
     
@@ -70,19 +100,30 @@ class DataValidator:
     async def _validate_unique_constraints(self, data: dict[str, Any]) -> list[dict[str, str]]:
         errors = []
         
-        if hasattr(self.config, 'unique_fields'):
-            for field in self.config.unique_fields:
-                if field in data:
-                    existing = await self.collection_admin.collection.find_one({
-                        field: data[field]
-                    })
-                    
-                    if existing:
-                        errors.append({
-                            "field": field,
-                            "error": "duplicate",
-                            "message": f"Value for '{field}' already exists"
-                        })
+        fields = [field for field in self._unique if field in data]
+        if not fields:
+            return errors
+        
+        # One query for every unique field. Not limited: existing duplicates of one
+        # field could otherwise fill the limit and hide a conflict on another
+        cursor = self.collection_admin.collection.find(
+            {"$or": [{field: data[field]} for field in fields]},
+            {field: 1 for field in fields},
+        )
+        
+        duplicates = set()
+        async for existing in cursor:
+            for field in fields:
+                if _holds_value(existing, field, data[field]):
+                    duplicates.add(field)
+        
+        for field in fields:
+            if field in duplicates:
+                errors.append({
+                    "field": field,
+                    "error": "duplicate",
+                    "message": f"Value for '{field}' already exists"
+                })
         
         return errors
     
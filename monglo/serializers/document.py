@@ -2,12 +2,51 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Any
+from typing import Any, Callable
 
-from bson import DBRef, ObjectId
+from bson import Binary, DBRef, ObjectId
+
+def _date(value: date) -> dict[str, str]:
+    return {"$date": value.isoformat()}
+
+def _binary(value: bytes) -> dict[str, str]:
+    return {"$binary": value.hex()}
+
+# Exact-type converters; subclasses go through the isinstance chain
+_DISPATCH: dict[type, Callable[[Any], Any]] = {
+    ObjectId: lambda value: {"$oid": str(value)},
+    datetime: _date,
+    date: _date,
+    DBRef: lambda value: {"$ref": value.collection, "$id": str(value.id)},
+    bytes: _binary,
+    Binary: _binary,
+}
+# Values serialized unchanged
+_PASSTHROUGH = frozenset({str, int, float, bool, type(None)})
 
 class DocumentSerializer:
 
+    __slots__ = ("_schema", "_fields")
+
+    def __init__(self) -> None:
+        # Last schema seen and its key -> (type, nullable, frequency) table; holding
+        # the schema keeps its identity valid, and schemas are treated as immutable
+        self._schema: dict[str, Any] | None = None
+        self._fields: dict[str, tuple[Any, Any, Any]] = {}
+
+    def _prepare_schema(self, schema: dict[str, Any]) -> dict[str, tuple[Any, Any, Any]]:
+        if schema is not self._schema:
+            self._fields = {
+                key: (
+                    spec.get("type", "string"),
+                    spec.get("nullable", False),
+                    spec.get("frequency", 1.0),
+                )
+                for key, spec in schema.items()
+            }
+            self._schema = schema
+        return self._fields
+
     def serialize(
         self,
         document: dict[str, Any],
@@ -15,20 +54,19 @@ class DocumentSerializer:
         schema: dict[str, Any] | None = None,
         include_types: bool = True,
     ) -> dict[str, Any]:
-        schema = schema or {}
+        fields = self._prepare_schema(schema) if schema and include_types else {}
 
         result = {}
         for key, value in document.items():
             serialized_value = self._serialize_value(value)
 
-            if include_types and key in schema:
+            typed = fields.get(key)
+            if typed is not None:
+                field_type, nullable, frequency = typed
                 result[key] = {
                     "value": serialized_value,
-                    "type": schema[key].get("type", "string"),
-                    "metadata": {
-                        "nullable": schema[key].get("nullable", False),
-                        "frequency": schema[key].get("frequency", 1.0),
-                    },
+                    "type": field_type,
+                    "metadata": {"nullable": nullable, "frequency": frequency},
                 }
             else:
                 result[key] = serialized_value
@@ -36,6 +74,23 @@ class DocumentSerializer:
         return result
 
     def _serialize_value(self, value: Any) -> Any:
+        kind = type(value)
+        if kind in _PASSTHROUGH:
+            return value
+
+        convert = _DISPATCH.get(kind)
+        if convert is not None:
+            return convert(value)
+        if kind is dict:
+            serialize = self._serialize_value
+            return {k: serialize(v) for k, v in value.items()}
+        if kind is list:
+            serialize = self._serialize_value
+            return [serialize(item) for item in value]
+
+        return self._serialize_subclass(value)
+
+    def _serialize_subclass(self, value: Any) -> Any:
         if isinstance(value, ObjectId):
             return {"$oid": str(value)}
         elif isinstance(value, datetime):
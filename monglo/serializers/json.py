@@ -2,22 +2,90 @@
 from __future__ import annotations
 
 import json
+import math
 from datetime import date, datetime
-from typing import Any
+from typing import Any, Callable
 
 from bson import Binary, DBRef, ObjectId
 
+try:
+    import orjson
+except ImportError:  # Optional: pip install monglo[export]
+    orjson = None
+
+# Exact-type converters; subclasses go through the isinstance chain
+_DISPATCH: dict[type, Callable[[Any], Any]] = {
+    ObjectId: str,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    Binary: Binary.hex,
+    bytes: bytes.hex,
+    DBRef: lambda value: {"$ref": value.collection, "$id": str(value.id), "$db": value.database},
+}
+# Values serialized unchanged
+_PASSTHROUGH = frozenset({str, int, float, bool, type(None)})
+
+def _has_non_finite(value: Any) -> bool:
+    # orjson writes NaN and Infinity as null where the stdlib writes NaN/Infinity
+    kind = type(value)
+    if kind is dict:
+        return any(map(_has_non_finite, value.values()))
+    if kind is list or kind is tuple:
+        return any(map(_has_non_finite, value))
+    return isinstance(value, float) and not math.isfinite(value)
+
 class JSONSerializer:
 
-    def serialize(self, data: Any, *, pretty: bool = False) -> str:
+    __slots__ = ()
+
+    def serialize(self, data: Any, *, pretty: bool = False, compact: bool = False) -> str:
+        # Compact output has no space after separators. Only that format is handed to
+        # orjson, which walks the data once in C and encodes datetimes natively, so
+        # only BSON types reach _default; the stdlib path needs a full pre-pass
+        if compact and orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+            try:
+                encoded = orjson.dumps(data, default=self._default, option=option)
+            except orjson.JSONEncodeError:
+                encoded = None  # Integers wider than 64 bits; the stdlib encodes them
+            # Only scan for NaN/Infinity when the output could hold one
+            if encoded is not None and not (b"null" in encoded and _has_non_finite(data)):
+                return encoded.decode()
+
         serialized = self._serialize_value(data)
         indent = 2 if pretty else None
-        return json.dumps(serialized, indent=indent, ensure_ascii=False)
+        separators = (",", ":") if compact and not pretty else None
+        return json.dumps(serialized, indent=indent, separators=separators, ensure_ascii=False)
 
-    def serialize_many(self, documents: list[dict[str, Any]], *, pretty: bool = False) -> str:
-        return self.serialize(documents, pretty=pretty)
+    def serialize_many(
+        self, documents: list[dict[str, Any]], *, pretty: bool = False, compact: bool = False
+    ) -> str:
+        return self.serialize(documents, pretty=pretty, compact=compact)
+
+    def _default(self, value: Any) -> Any:
+        converted = self._serialize_value(value)
+        if converted is value:
+            raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+        return converted
 
     def _serialize_value(self, value: Any) -> Any:
+        kind = type(value)
+        if kind in _PASSTHROUGH:
+            return value
+
+        convert = _DISPATCH.get(kind)
+        if convert is not None:
+            return convert(value)
+        if kind is dict:
+            serialize = self._serialize_value
+            return {k: serialize(v) for k, v in value.items()}
+        if kind is list or kind is tuple:
+            serialize = self._serialize_value
+            return [serialize(item) for item in value]
+
+        return self._serialize_subclass(value)
+
+    def _serialize_subclass(self, value: Any) -> Any:
         if isinstance(value, ObjectId):
             return str(value)
         elif isinstance(value, (datetime, date)):
@@ -2,26 +2,72 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Any
+from typing import Any, Callable
 
 from bson import ObjectId
 
+def _format_datetime(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+def _format_date(value: Any) -> Any:
+    return value.strftime("%Y-%m-%d") if isinstance(value, (datetime, date)) else value
+
+def _format_objectid(value: Any) -> Any:
+    return str(value) if isinstance(value, ObjectId) else value
+
+def _format_boolean(value: Any) -> Any:
+    return "Yes" if value else "No"
+
+def _format_number(value: Any) -> Any:
+    if isinstance(value, float):
+        return f"{value:,.2f}"
+    return str(value) if isinstance(value, int) else value
+
+# Column formatter name -> converter; each leaves values of other types unchanged
+_FORMATTERS: dict[str, Callable[[Any], Any]] = {
+    "datetime": _format_datetime,
+    "date": _format_date,
+    "objectid": _format_objectid,
+    "boolean": _format_boolean,
+    "number": _format_number,
+}
+
+def _walk(document: dict[str, Any], keys: tuple[str, ...]) -> Any:
+    value: Any = document
+
+    for key in keys:
+        if isinstance(value, dict):
+            value = value.get(key)
+            if value is None:
+                break
+        else:
+            return None
+
+    return value
+
 class TableSerializer:
 
     def __init__(self, columns: list[dict[str, Any]]) -> None:
         self.columns = columns
+        # (field, dotted path split into keys, formatter function) per column, built once
+        self._accessors = [
+            (
+                column["field"],
+                tuple(column["field"].split(".")),
+                _FORMATTERS.get(column.get("formatter") or ""),
+            )
+            for column in columns
+        ]
 
     def serialize_row(self, document: dict[str, Any]) -> dict[str, Any]:
         row = {}
 
-        for column in self.columns:
-            field = column["field"]
-            value = self._get_field_value(document, field)
+        for field, keys, format_value in self._accessors:
+            value = _walk(document, keys)
 
             # Apply formatter if specified
-            formatter = column.get("formatter")
-            if formatter:
-                value = self._apply_formatter(value, formatter)
+            if format_value is not None and value is not None:
+                value = format_value(value)
 
             row[field] = value
 
@@ -31,36 +77,11 @@ class TableSerializer:
         return [self.serialize_row(doc) for doc in documents]
 
     def _get_field_value(self, document: dict[str, Any], field_path: str) -> Any:
-        keys = field_path.split(".")
-        value = document
-
-        for key in keys:
-            if isinstance(value, dict):
-                value = value.get(key)
-                if value is None:
-                    break
-            else:
-                return None
-
-        return value
+        return _walk(document, tuple(field_path.split(".")))
 
     def _apply_formatter(self, value: Any, formatter: str) -> Any:
         if value is None:
             return None
 
-        if formatter == "datetime":
-            if isinstance(value, datetime):
-                return value.isoformat()
-        elif formatter == "date":
-            if isinstance(value, (datetime, date)):
-                return value.strftime("%Y-%m-%d")
-        elif formatter == "objectid":
-            if isinstance(value, ObjectId):
-                return str(value)
-        elif formatter == "boolean":
-            return "Yes" if value else "No"
-        elif formatter == "number":
-            if isinstance(value, (int, float)):
-                return f"{value:,.2f}" if isinstance(value, float) else str(value)
-
-        return value
+        format_value = _FORMATTERS.get(formatter)
+        return format_value(value) if format_value is not None else value
@@ -0,0 +1,42 @@
+
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import TYPE_CHECKING, Any
+
+from ..operations._count_cache import cached_count
+
+if TYPE_CHECKING:
+    from ..core.engine import MongloEngine
+
+# MONGLO_UI_SKIP_COUNTS=1 leaves collection counts off pages unless ?skip_counts=0
+SKIP_COUNTS = os.environ.get("MONGLO_UI_SKIP_COUNTS", "") == "1"
+
+def _skip_counts(param: str | None) -> bool:
+    if param is None:
+        return SKIP_COUNTS
+    return param.lower() in ("1", "true", "yes", "on")
+
+async def _get_all_collections(
+    engine: MongloEngine, *, skip_counts: bool = False
+) -> list[dict[str, Any]]:
+    admins = list(engine.registry._collections.items())
+    if skip_counts:
+        # Rendered as a placeholder by the templates
+        counts = [None] * len(admins)
+    else:
+        # Count every collection concurrently rather than one round trip at a time
+        counts = await asyncio.gather(
+            *(cached_count(admin.collection, {}, estimated=True) for _, admin in admins)
+        )
+
+    return [
+        {
+            "name": name,
+            "display_name": admin.display_name,
+            "count": count,
+            "relationships": len(admin.relationships)
+        }
+        for (name, admin), count in zip(admins, counts)
+    ]
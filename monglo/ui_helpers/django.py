@@ -1,19 +1,28 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 from django.http import JsonResponse
 from django.shortcuts import render, redirect
 from django.urls import path
 from django.views import View
 
+from ..operations.crud import CRUDOperations
+from ..serializers.json import JSONSerializer
+from ..views.document_view import DocumentView
+from ..views.table_view import TableView
+from ._collections import _get_all_collections, _skip_counts
+
 if TYPE_CHECKING:
     from ..core.engine import MongloEngine
 
 UI_DIR = Path(__file__).parent.parent.parent / "monglo_ui"
 TEMPLATES_DIR = UI_DIR / "templates"
+# Stateless, so one instance serves every request
+_SERIALIZER = JSONSerializer()
 
 def create_ui_urlpatterns(
     engine: MongloEngine,
@@ -22,19 +31,11 @@ def create_ui_urlpatterns(
     logo: str | None = None,
     brand_color: str = "#10b981",
 ):
-    
     class AdminHomeView(View):
         async def get(self, request):
-            collections = []
-            
-            for name, admin in engine.registry._collections.items():
-                count = await admin.collection.count_documents({})
-                collections.append({
-                    "name": name,
-                    "display_name": admin.display_name,
-                    "count": count,
-                    "relationships": len(admin.relationships)
-                })
+            collections = await _get_all_collections(
+                engine, skip_counts=_skip_counts(request.GET.get("skip_counts"))
+            )
             
             context = {
                 "title": title,
@@ -48,9 +49,6 @@ def create_ui_urlpatterns(
     
     class TableViewClass(View):
         async def get(self, request, collection):
-            from ..views.table_view import TableView
-            from ..operations.crud import CRUDOperations
-            
             page = int(request.GET.get("page", 1))
             per_page = int(request.GET.get("per_page", 20))
             search = request.GET.get("search", "")
@@ -74,7 +72,9 @@ def create_ui_urlpatterns(
             table_view = TableView(admin)
             config = table_view.render_config()
             
-            collections = await _get_all_collections(engine)
+            collections = await _get_all_collections(
+                engine, skip_counts=_skip_counts(request.GET.get("skip_counts"))
+            )
             
             context = {
                 "title": title,
@@ -91,10 +91,6 @@ def create_ui_urlpatterns(
     
     class DocumentViewClass(View):
         async def get(self, request, collection, id):
-            from ..views.document_view import DocumentView
-            from ..operations.crud import CRUDOperations
-            from ..serializers.json import JSONSerializer
-            
             admin = engine.registry.get(collection)
             
             crud = CRUDOperations(admin)
@@ -104,13 +100,14 @@ def create_ui_urlpatterns(
                 return redirect(f"/{prefix}/{collection}/")
             
             # Serialize
-            serializer = JSONSerializer()
-            serialized_doc = serializer._serialize_value(document)
+            serialized_doc = _SERIALIZER._serialize_value(document)
             
             doc_view = DocumentView(admin)
             config = doc_view.render_config()
             
-            collections = await _get_all_collections(engine)
+            collections = await _get_all_collections(
+                engine, skip_counts=_skip_counts(request.GET.get("skip_counts"))
+            )
             
             context = {
                 "title": title,
@@ -127,10 +124,6 @@ def create_ui_urlpatterns(
             return render(request, str(TEMPLATES_DIR / "document_view.html"), context)
         
         async def put(self, request, collection, id):
-            from ..operations.crud import CRUDOperations
-            from ..serializers.json import JSONSerializer
-            import json
-            
             data = json.loads(request.body)
             
             admin = engine.registry.get(collection)
@@ -138,14 +131,11 @@ def create_ui_urlpatterns(
             
             updated = await crud.update(id, data)
             
-            serializer = JSONSerializer()
-            serialized = serializer._serialize_value(updated)
+            serialized = _SERIALIZER._serialize_value(updated)
             
             return JsonResponse({"success": True, "document": serialized})
         
         async def delete(self, request, collection, id):
-            from ..operations.crud import CRUDOperations
-            
             admin = engine.registry.get(collection)
             crud = CRUDOperations(admin)
             
@@ -154,10 +144,6 @@ def create_ui_urlpatterns(
     
     class CreateDocumentView(View):
         async def post(self, request, collection):
-            from ..operations.crud import CRUDOperations
-            from ..serializers.json import JSONSerializer
-            import json
-            
             data = json.loads(request.body)
             
             admin = engine.registry.get(collection)
@@ -165,8 +151,7 @@ def create_ui_urlpatterns(
             
             created = await crud.create(data)
             
-            serializer = JSONSerializer()
-            serialized = serializer._serialize_value(created)
+            serialized = _SERIALIZER._serialize_value(created)
             
             return JsonResponse({"success": True, "document": serialized})
     
@@ -176,14 +161,3 @@ def create_ui_urlpatterns(
         path(f"{prefix}/<str:collection>/document/<str:id>/", DocumentViewClass.as_view(), name="monglo_document_view"),
         path(f"{prefix}/<str:collection>/create/", CreateDocumentView.as_view(), name="monglo_create_document"),
     ]
-
-async def _get_all_collections(engine: MongloEngine) -> list[dict[str, Any]]:
-    collections = []
-    for name, admin in engine.registry._collections.items():
-        count = await admin.collection.count_documents({})
-        collections.append({
-            "name": name,
-            "display_name": admin.display_name,
-            "count": count
-        })
-    return collections
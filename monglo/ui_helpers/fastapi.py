@@ -1,16 +1,24 @@
 
 from __future__ import annotations
 
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
-from fastapi import APIRouter, Request, Query
+from fastapi import APIRouter, HTTPException, Query, Request, status
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
+from ..operations.crud import CRUDOperations
+from ..serializers.json import JSONSerializer
+from ..views.document_view import DocumentView
+from ..views.table_view import TableView
+from ._collections import SKIP_COUNTS, _get_all_collections
+
 
 if TYPE_CHECKING:
     from ..core.engine import MongloEngine
@@ -18,6 +26,10 @@ if TYPE_CHECKING:
 UI_DIR = Path(__file__).parent.parent.parent / "monglo_ui"
 STATIC_DIR = UI_DIR / "static"
 TEMPLATES_DIR = UI_DIR / "templates"
+# Compiled when the templates are first set up rather than on the first request
+PRELOAD_TEMPLATES = ("base.html", "admin_home.html", "table_view.html", "document_view.html")
+# Stateless, so one instance serves every request
+_SERIALIZER = JSONSerializer()
 
 def setup_ui(
     app,
@@ -93,7 +105,7 @@ def create_ui_router(
     brand_color: str = "#10b981", 
     auth_backend: Any | None = None, 
 ) -> APIRouter:
-    from fastapi import Depends, HTTPException, status
+    from fastapi import Depends
     
     # Exclude admin routes from OpenAPI schema
     router = APIRouter(prefix=prefix, tags=["Monglo Admin UI"], include_in_schema=False)
@@ -145,17 +157,8 @@ def create_ui_router(
     #  UI ROUTES 
     
     @router.get("/", response_class=HTMLResponse, name="admin_home", dependencies=get_dependencies(), include_in_schema=False)
-    async def admin_home(request: Request):
-        collections = []
-        
-        for name, admin in engine.registry._collections.items():
-            count = await admin.collection.count_documents({})
-            collections.append({
-                "name": name,
-                "display_name": admin.display_name,
-                "count": count,
-                "relationships": len(admin.relationships)
-            })
+    async def admin_home(request: Request, skip_counts: bool = Query(SKIP_COUNTS)):
+        collections = await _get_all_collections(engine, skip_counts=skip_counts)
         
         return templates.TemplateResponse("admin_home.html", {
             "request": request,
@@ -168,7 +171,7 @@ def create_ui_router(
         })
     
     @router.get("/relationships", response_class=HTMLResponse, name="relationship_graph", dependencies=get_dependencies(), include_in_schema=False)
-    async def relationship_graph(request: Request):
+    async def relationship_graph(request: Request, skip_counts: bool = Query(SKIP_COUNTS)):
         """Display relationship graph visualization"""
         # Collect all relationships across collections
         all_relationships = []
@@ -181,7 +184,7 @@ def create_ui_router(
                     "type": rel.type.value
                 })
         
-        collections = await _get_all_collections(engine)
+        collections = await _get_all_collections(engine, skip_counts=skip_counts)
         
         return templates.TemplateResponse("relationship_graph.html", {
             "request": request,
@@ -201,11 +204,9 @@ def create_ui_router(
         page: int = Query(1, ge=1),
         per_page: int = Query(20, ge=1, le=100),
         search: Optional[str] = None,
-        sort: Optional[str] = None
+        sort: Optional[str] = None,
+        skip_counts: bool = Query(SKIP_COUNTS)
     ):
-        from ..views.table_view import TableView
-        from ..operations.crud import CRUDOperations
-        
         admin = engine.registry.get(collection)
         
         sort_list = None
@@ -224,7 +225,7 @@ def create_ui_router(
         table_view_obj = TableView(admin)
         config = table_view_obj.render_config()
         
-        collections = await _get_all_collections(engine)
+        collections = await _get_all_collections(engine, skip_counts=skip_counts)
         
         return templates.TemplateResponse("table_view.html", {
             "request": request,
@@ -243,12 +244,9 @@ def create_ui_router(
     async def document_view(
         request: Request,
         collection: str,
-        id: str
+        id: str,
+        skip_counts: bool = Query(SKIP_COUNTS)
     ):
-        from ..views.document_view import DocumentView
-        from ..operations.crud import CRUDOperations
-        from ..serializers.json import JSONSerializer
-        
         admin = engine.registry.get(collection)
         
         crud = CRUDOperations(admin)
@@ -259,13 +257,12 @@ def create_ui_router(
             return RedirectResponse(url=f"{prefix}/{collection}", status_code=302)
         
         # Serialize for template safety
-        serializer = JSONSerializer()
-        serialized_doc = serializer._serialize_value(document)
+        serialized_doc = _SERIALIZER._serialize_value(document)
         
         doc_view = DocumentView(admin)
         config = doc_view.render_config()
         
-        collections = await _get_all_collections(engine)
+        collections = await _get_all_collections(engine, skip_counts=skip_counts)
         
         return templates.TemplateResponse("document_view.html", {
             "request": request,
@@ -286,17 +283,13 @@ def create_ui_router(
     
     @router.get("/{collection}/{id}/json", name="get_document_json", dependencies=get_dependencies(), include_in_schema=False)
     async def get_document_json(collection: str, id: str):
-        from ..operations.crud import CRUDOperations
-        from ..serializers.json import JSONSerializer
-        
         admin = engine.registry.get(collection)
         crud = CRUDOperations(admin)
         
         document = await crud.get(id)
         
         # Serialize for JSON response
-        serializer = JSONSerializer()
-        serialized = serializer._serialize_value(document)
+        serialized = _SERIALIZER._serialize_value(document)
         
         return {" success": True, "document": serialized}
     
@@ -308,9 +301,6 @@ def create_ui_router(
         search: str = "",
         sort: str = ""
     ):
-        from ..operations.crud import CRUDOperations
-        from ..serializers.json import JSONSerializer
-        
         try:
             admin = engine.registry.get(collection)
         except KeyError:
@@ -342,8 +332,7 @@ def create_ui_router(
         )
         
         # Serialize items
-        serializer = JSONSerializer()
-        items = [serializer._serialize_value(item) for item in result["items"]]
+        items = [_SERIALIZER._serialize_value(item) for item in result["items"]]
         
         return {
             "success": True,
@@ -356,8 +345,6 @@ def create_ui_router(
     
     @router.delete("/{collection}/{id}", name="delete_document", dependencies=get_dependencies(), include_in_schema=False)
     async def delete_document(collection: str, id: str):
-        from ..operations.crud import CRUDOperations
-        
         admin = engine.registry.get(collection)
         crud = CRUDOperations(admin)
         
@@ -366,46 +353,41 @@ def create_ui_router(
     
     @router.put("/{collection}/{id}", name="update_document")
     async def update_document(collection: str, id: str, data: dict):
-        from ..operations.crud import CRUDOperations
-        from ..serializers.json import JSONSerializer
-        
         admin = engine.registry.get(collection)
         crud = CRUDOperations(admin)
         
         updated = await crud.update(id, data)
         
         # Serialize for JSON response
-        serializer = JSONSerializer()
-        serialized = serializer._serialize_value(updated)
+        serialized = _SERIALIZER._serialize_value(updated)
         
         return {"success": True, "document": serialized}
     
     @router.post("/{collection}", name="create_document", dependencies=get_dependencies(), include_in_schema=False)
     async def create_document(collection: str, data: dict):
-        from ..operations.crud import CRUDOperations
-        from ..serializers.json import JSONSerializer
-        
         admin = engine.registry.get(collection)
         crud = CRUDOperations(admin)
         
         created = await crud.create(data)
         
         # Serialize for JSON response
-        serializer = JSONSerializer()
-        serialized = serializer._serialize_value(created)
+        serialized = _SERIALIZER._serialize_value(created)
         
         return {"success": True, "document": serialized}
     
     
     return router
 
+@lru_cache(maxsize=1)
 def _setup_templates() -> Jinja2Templates:
+    # Shared by every router; the packaged templates don't change at runtime, so
+    # skip the per-render mtime check
     templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
+    templates.env.auto_reload = False
     
     def format_datetime(value):
         if value is None:
             return ""
-        from datetime import datetime
         if isinstance(value, datetime):
             return value.strftime("%Y-%m-%d %H:%M:%S")
         return str(value)
@@ -433,6 +415,9 @@ def _setup_templates() -> Jinja2Templates:
     templates.env.filters['str'] = str
     templates.env.filters['truncate'] = truncate
     
+    for name in PRELOAD_TEMPLATES:
+        templates.env.get_template(name)
+    
     return templates
 
 
@@ -443,8 +428,6 @@ def create_auth_dependency(auth_backend: Any):
     This dependency will check authentication and raise 401 if not authenticated.
     """
     async def auth_dependency(request: Request):
-        from fastapi import HTTPException, status
-        
         is_authenticated = await auth_backend.authenticate(request)
         if not is_authenticated:
             raise HTTPException(
@@ -455,15 +438,3 @@ def create_auth_dependency(auth_backend: Any):
     
     return auth_dependency
 
-
-async def _get_all_collections(engine: MongloEngine) -> list[dict[str, Any]]:
-    collections = []
-    for name, admin in engine.registry._collections.items():
-        count = await admin.collection.count_documents({})
-        collections.append({
-            "name": name,
-            "display_name": admin.display_name,
-            "count": count,
-            "relationships": len(admin.relationships) 
-        })
-    return collections
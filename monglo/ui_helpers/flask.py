@@ -1,15 +1,24 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 from flask import Blueprint, render_template, request, redirect, url_for, jsonify
 
+from ..operations.crud import CRUDOperations
+from ..serializers.json import JSONSerializer
+from ..views.document_view import DocumentView
+from ..views.table_view import TableView
+from ._collections import _get_all_collections, _skip_counts
+
 if TYPE_CHECKING:
     from ..core.engine import MongloEngine
 
 UI_DIR = Path(__file__).parent.parent.parent / "monglo_ui"
+# Stateless, so one instance serves every request
+_SERIALIZER = JSONSerializer()
 
 def create_ui_blueprint(
     engine: MongloEngine,
@@ -42,16 +51,9 @@ def create_ui_blueprint(
     
     @bp.route("/")
     async def admin_home():
-        collections = []
-        
-        for name, admin in engine.registry._collections.items():
-            count = await admin.collection.count_documents({})
-            collections.append({
-                "name": name,
-                "display_name": admin.display_name,
-                "count": count,
-                "relationships": len(admin.relationships)
-            })
+        collections = await _get_all_collections(
+            engine, skip_counts=_skip_counts(request.args.get("skip_counts"))
+        )
         
         return render_template(
             "admin_home.html",
@@ -61,9 +63,6 @@ def create_ui_blueprint(
     
     @bp.route("/<collection>")
     async def table_view(collection: str):
-        from ..views.table_view import TableView
-        from ..operations.crud import CRUDOperations
-        
         page = int(request.args.get("page", 1))
         per_page = int(request.args.get("per_page", 20))
         search = request.args.get("search", "")
@@ -87,7 +86,9 @@ def create_ui_blueprint(
         table_view_obj = TableView(admin)
         config = table_view_obj.render_config()
         
-        collections = await _get_all_collections(engine)
+        collections = await _get_all_collections(
+            engine, skip_counts=_skip_counts(request.args.get("skip_counts"))
+        )
         
         return render_template(
             "table_view.html",
@@ -100,10 +101,6 @@ def create_ui_blueprint(
     
     @bp.route("/<collection>/document/<id>")
     async def document_view(collection: str, id: str):
-        from ..views.document_view import DocumentView
-        from ..operations.crud import CRUDOperations
-        from ..serializers.json import JSONSerializer
-        
         admin = engine.registry.get(collection)
         
         crud = CRUDOperations(admin)
@@ -113,13 +110,14 @@ def create_ui_blueprint(
             return redirect(url_for(f"{name}.table_view", collection=collection))
         
         # Serialize for template safety
-        serializer = JSONSerializer()
-        serialized_doc = serializer._serialize_value(document)
+        serialized_doc = _SERIALIZER._serialize_value(document)
         
         doc_view = DocumentView(admin)
         config = doc_view.render_config()
         
-        collections = await _get_all_collections(engine)
+        collections = await _get_all_collections(
+            engine, skip_counts=_skip_counts(request.args.get("skip_counts"))
+        )
         
         return render_template(
             "document_view.html",
@@ -135,8 +133,6 @@ def create_ui_blueprint(
     
     @bp.route("/<collection>/<id>", methods=["DELETE"])
     async def delete_document(collection: str, id: str):
-        from ..operations.crud import CRUDOperations
-        
         admin = engine.registry.get(collection)
         crud = CRUDOperations(admin)
         
@@ -145,9 +141,6 @@ def create_ui_blueprint(
     
     @bp.route("/<collection>/<id>", methods=["PUT"])
     async def update_document(collection: str, id: str):
-        from ..operations.crud import CRUDOperations
-        from ..serializers.json import JSONSerializer
-        
         data = request.get_json()
         
         admin = engine.registry.get(collection)
@@ -156,16 +149,12 @@ def create_ui_blueprint(
         updated = await crud.update(id, data)
         
         # Serialize for JSON response
-        serializer = JSONSerializer()
-        serialized = serializer._serialize_value(updated)
+        serialized = _SERIALIZER._serialize_value(updated)
         
         return jsonify({"success": True, "document": serialized})
     
     @bp.route("/<collection>", methods=["POST"])
     async def create_document(collection: str):
-        from ..operations.crud import CRUDOperations
-        from ..serializers.json import JSONSerializer
-        
         data = request.get_json()
         
         admin = engine.registry.get(collection)
@@ -174,51 +163,44 @@ def create_ui_blueprint(
         created = await crud.create(data)
         
         # Serialize for JSON response
-        serializer = JSONSerializer()
-        serialized = serializer._serialize_value(created)
+        serialized = _SERIALIZER._serialize_value(created)
         
         return jsonify({"success": True, "document": serialized})
     
     return bp
 
-def _register_filters(bp: Blueprint):
-    
-    @bp.app_template_filter("format_datetime")
-    def format_datetime(value):
-        if value is None:
-            return ""
-        from datetime import datetime
-        if isinstance(value, datetime):
-            return value.strftime("%Y-%m-%d %H:%M:%S")
-        return str(value)
-    
-    @bp.app_template_filter("type_class")
-    def type_class(value):
-        if isinstance(value, str):
-            return "string"
-        elif isinstance(value, (int, float)):
-            return "number"
-        elif isinstance(value, bool):
-            return "boolean"
-        elif isinstance(value, dict):
-            return "object"
-        elif isinstance(value, list):
-            return "array"
+def _format_datetime(value):
+    if value is None:
         return ""
-    
-    @bp.app_template_filter("truncate")
-    def truncate(s, length=50):
-        if not isinstance(s, str):
-            s = str(s)
-        return s[:length] + '...' if len(s) > length else s
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    return str(value)
 
-async def _get_all_collections(engine: MongloEngine) -> list[dict[str, Any]]:
-    collections = []
-    for name, admin in engine.registry._collections.items():
-        count = await admin.collection.count_documents({})
-        collections.append({
-            "name": name,
-            "display_name": admin.display_name,
-            "count": count
-        })
-    return collections
+def _type_class(value):
+    if isinstance(value, str):
+        return "string"
+    elif isinstance(value, (int, float)):
+        return "number"
+    elif isinstance(value, bool):
+        return "boolean"
+    elif isinstance(value, dict):
+        return "object"
+    elif isinstance(value, list):
+        return "array"
+    return ""
+
+def _truncate(s, length=50):
+    if not isinstance(s, str):
+        s = str(s)
+    return s[:length] + '...' if len(s) > length else s
+
+# Defined once at import; every blueprint registers the same functions
+_FILTERS = {
+    "format_datetime": _format_datetime,
+    "type_class": _type_class,
+    "truncate": _truncate,
+}
+
+def _register_filters(bp: Blueprint):
+    for name, fn in _FILTERS.items():
+        bp.add_app_template_filter(fn, name)
@@ -6,6 +6,11 @@ from datetime import datetime, date
 from typing import Any
 from bson import ObjectId
 
+from .. import _regex_cache
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$')
+
 class Validator:
     
     @staticmethod
@@ -13,16 +18,14 @@ class Validator:
         if not isinstance(value, str):
             return False
         
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, value))
+        return bool(_EMAIL_RE.match(value))
     
     @staticmethod
     def is_valid_url(value: str) -> bool:
         if not isinstance(value, str):
             return False
         
-        pattern = r'^https?://[^\s/$.?#].[^\s]*$'
-        return bool(re.match(pattern, value))
+        return bool(_URL_RE.match(value))
     
     @staticmethod
     def is_valid_objectid(value: str | ObjectId) -> bool:
@@ -98,7 +101,7 @@ class Validator:
     def matches_pattern(value: str, pattern: str) -> bool:
         if not isinstance(value, str):
             return False
-        return bool(re.match(pattern, value))
+        return _regex_cache.get(pattern).match(value) is not None
     
     @staticmethod
     def is_not_empty(value: Any) -> bool:
@@ -1,8 +1,11 @@
 
+import re
 from typing import Any
 
 from .base import BaseWidget
 
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
 class TextInput(BaseWidget):
 
     def render_config(self) -> dict[str, Any]:
@@ -47,10 +50,7 @@ class EmailInput(BaseWidget):
     def validate(self, value: Any) -> bool:
         if not isinstance(value, str):
             return False
-        import re
-
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        return bool(re.match(pattern, value))
+        return bool(_EMAIL_RE.match(value))
 
 class PasswordInput(BaseWidget):
 
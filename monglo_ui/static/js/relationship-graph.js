@@ -212,7 +212,7 @@ class MongloRelationshipGraph {
         fieldCountText.setAttribute('text-anchor', 'middle');
         fieldCountText.setAttribute('fill', this.isDarkMode ? '#9ca3af' : '#6b7280');
         fieldCountText.setAttribute('font-size', '12');
-        fieldCountText.textContent = `Documents: ${collection.count || 0}`;
+        fieldCountText.textContent = `Documents: ${collection.count ?? '—'}`;
 
         // Relationship count
         const relCountText = document.createElementNS('http://www.w3.org/2000/svg', 'text');
@@ -0,0 +1,188 @@
+
+import pytest
+from bson import Regex
+from monglo.operations.aggregations import AggregationOperations
+
+@pytest.fixture
+def collection(mocker):
+    collection = mocker.MagicMock()
+    collection.name = "orders"
+    collection.database.name = "shop"
+    cursor = mocker.MagicMock()
+    cursor.to_list = mocker.AsyncMock(
+        side_effect=lambda length: [{"_id": None, "min": 1, "max": 9, "avg": 5, "sum": 15, "count": 3}]
+    )
+    collection.aggregate.return_value = cursor
+    return collection
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    AggregationOperations.invalidate_cache()
+    yield
+    AggregationOperations.invalidate_cache()
+
+class TestAggregationCache:
+
+    async def test_repeated_calls_hit_cache(self, collection):
+        agg_ops = AggregationOperations(collection)
+
+        first = await agg_ops.get_field_stats("total", query={"status": "paid"})
+        second = await agg_ops.get_field_stats("total", query={"status": "paid"})
+
+        assert first == second
+        assert collection.aggregate.call_count == 1
+
+    async def test_different_queries_are_cached_separately(self, collection):
+        agg_ops = AggregationOperations(collection)
+
+        await agg_ops.get_field_stats("total", query={"status": "paid"})
+        await agg_ops.get_field_stats("total", query={"status": "open"})
+
+        assert collection.aggregate.call_count == 2
+
+    async def test_results_are_copies(self, collection):
+        agg_ops = AggregationOperations(collection)
+
+        first = await agg_ops.get_field_stats("total")
+        first["min"] = -1
+        second = await agg_ops.get_field_stats("total")
+
+        assert second["min"] == 1
+        assert collection.aggregate.call_count == 1
+
+    async def test_bool_and_int_filters_are_cached_separately(self, collection):
+        agg_ops = AggregationOperations(collection)
+
+        await agg_ops.get_field_stats("total", query={"paid": True})
+        await agg_ops.get_field_stats("total", query={"paid": 1})
+
+        assert collection.aggregate.call_count == 2
+
+    async def test_regex_filters_are_cached(self, collection):
+        agg_ops = AggregationOperations(collection)
+
+        await agg_ops.get_field_stats("total", query={"name": Regex("^a")})
+        await agg_ops.group_by("status", query={"name": Regex("^a")})
+        await agg_ops.get_field_stats("total", query={"name": Regex("^a")})
+
+        assert collection.aggregate.call_count == 2
+
+    async def test_unencodable_filters_skip_cache(self, collection):
+        agg_ops = AggregationOperations(collection)
+
+        await agg_ops.get_field_stats("total", query={"n": 2**70})
+        await agg_ops.get_field_stats("total", query={"n": 2**70})
+
+        assert collection.aggregate.call_count == 2
+
+    async def test_clients_are_cached_separately(self, collection, mocker):
+        other = mocker.MagicMock()
+        other.name = "orders"
+        other.database.name = "shop"
+        other.aggregate.return_value = collection.aggregate.return_value
+
+        await AggregationOperations(collection).get_field_stats("total")
+        await AggregationOperations(other).get_field_stats("total")
+
+        other.aggregate.assert_called_once()
+
+    async def test_invalidate_collection(self, collection):
+        agg_ops = AggregationOperations(collection)
+
+        await agg_ops.get_field_stats("total")
+        AggregationOperations.invalidate_cache("orders")
+        await agg_ops.get_field_stats("total")
+
+        assert collection.aggregate.call_count == 2
+
+    async def test_cache_disabled(self, collection):
+        agg_ops = AggregationOperations(collection, cache_ttl=0)
+
+        await agg_ops.get_field_stats("total")
+        await agg_ops.get_field_stats("total")
+
+        assert collection.aggregate.call_count == 2
+
+class TestDistinctCounts:
+
+    async def test_single_facet_pipeline(self, collection):
+        collection.aggregate.return_value.to_list.side_effect = lambda length: [
+            {
+                "distinct": [{"n": 2}],
+                "sample": [{"_id": "paid"}, {"_id": "open"}],
+                "total": [{"n": 4}],
+            }
+        ]
+        agg_ops = AggregationOperations(collection)
+
+        result = await agg_ops.get_distinct_counts("status")
+
+        assert collection.aggregate.call_count == 1
+        assert "$facet" in collection.aggregate.call_args[0][0][1]
+        assert result == {
+            "field": "status",
+            "distinct_count": 2,
+            "total_documents": 4,
+            "cardinality_ratio": 0.5,
+            "sample_values": ["paid", "open"],
+        }
+
+    async def test_empty_collection(self, collection):
+        collection.aggregate.return_value.to_list.side_effect = lambda length: [
+            {"distinct": [], "sample": [], "total": []}
+        ]
+        agg_ops = AggregationOperations(collection)
+
+        result = await agg_ops.get_distinct_counts("status")
+
+        assert result["distinct_count"] == 0
+        assert result["cardinality_ratio"] == 0
+
+class TestAggregateIter:
+
+    async def test_streams_with_batch_size(self, collection):
+        async def docs():
+            for i in range(3):
+                yield {"_id": i}
+
+        collection.aggregate.return_value = docs()
+        agg_ops = AggregationOperations(collection)
+
+        results = [doc async for doc in agg_ops.aggregate_iter([{"$match": {}}], batch_size=2)]
+
+        assert results == [{"_id": 0}, {"_id": 1}, {"_id": 2}]
+        collection.aggregate.assert_called_once_with([{"$match": {}}], batchSize=2)
+
+    async def test_disk_use_is_opt_in(self, collection):
+        async def docs():
+            yield {"_id": 0}
+
+        collection.aggregate.return_value = docs()
+        agg_ops = AggregationOperations(collection)
+
+        [doc async for doc in agg_ops.aggregate_iter([], batch_size=2, allow_disk_use=True)]
+
+        collection.aggregate.assert_called_once_with([], batchSize=2, allowDiskUse=True)
+
+class TestGroupBy:
+
+    async def test_count_only_uses_sort_by_count(self, collection):
+        collection.aggregate.return_value.to_list.side_effect = lambda length: [
+            {"_id": "paid", "count": 3}
+        ]
+        agg_ops = AggregationOperations(collection)
+
+        results = await agg_ops.get_top_values("status", limit=5)
+
+        pipeline = collection.aggregate.call_args[0][0]
+        assert pipeline == [{"$sortByCount": "$status"}, {"$limit": 5}]
+        assert results == [{"count": 3, "status": "paid"}]
+
+    async def test_sum_keeps_group_stage(self, collection):
+        agg_ops = AggregationOperations(collection)
+
+        await agg_ops.group_by("status", sum_field="total")
+
+        pipeline = collection.aggregate.call_args[0][0]
+        assert "$group" in pipeline[0]
+        assert pipeline[1] == {"$sort": {"count": -1}}
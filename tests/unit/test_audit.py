@@ -0,0 +1,159 @@
+
+import pytest
+from monglo.operations.audit import AuditLogger
+
+@pytest.fixture
+def audit_logger(mocker):
+    collection = mocker.MagicMock()
+    collection.insert_many = mocker.AsyncMock()
+    collection.with_options.return_value.insert_many = mocker.AsyncMock()
+    collection.create_indexes = mocker.AsyncMock()
+    cursor = collection.find.return_value.sort.return_value.limit.return_value
+    cursor.to_list = mocker.AsyncMock(return_value=[])
+    database = mocker.MagicMock()
+    database.__getitem__.return_value = collection
+    mocker.patch.object(AuditLogger, "_indexed_dbs", set())
+    return AuditLogger(database, flush_interval=0)
+
+class TestAuditLogger:
+
+    async def test_log_calls_are_batched(self, audit_logger):
+        for i in range(5):
+            await audit_logger.log_create("users", {"_id": i})
+
+        await audit_logger.flush()
+
+        audit_logger.collection.insert_many.assert_called_once()
+        batch = audit_logger.collection.insert_many.call_args[0][0]
+        assert [entry["document_id"] for entry in batch] == ["0", "1", "2", "3", "4"]
+
+        await audit_logger.close()
+
+    async def test_batches_respect_batch_size(self, audit_logger):
+        audit_logger.batch_size = 2
+
+        for i in range(5):
+            await audit_logger.log_create("users", {"_id": i})
+
+        await audit_logger.flush()
+
+        sizes = [len(call[0][0]) for call in audit_logger.collection.insert_many.call_args_list]
+        assert sizes == [2, 2, 1]
+
+        await audit_logger.close()
+
+    async def test_flush_raises_write_error(self, audit_logger):
+        audit_logger.collection.insert_many.side_effect = RuntimeError("write failed")
+
+        await audit_logger.log_delete("users", "1", {"_id": 1})
+
+        with pytest.raises(RuntimeError):
+            await audit_logger.flush()
+
+        await audit_logger.close()
+
+    async def test_background_writes_are_unacknowledged(self, audit_logger):
+        import asyncio
+
+        await audit_logger.log_create("users", {"_id": 1})
+        await asyncio.sleep(0.01)
+
+        audit_logger._unacknowledged.insert_many.assert_called_once()
+        audit_logger.collection.insert_many.assert_not_called()
+
+        await audit_logger.close()
+
+    async def test_flush_acknowledges_queued_entries(self, audit_logger):
+        await audit_logger.log_create("users", {"_id": 1})
+        await audit_logger.flush()
+
+        audit_logger.collection.insert_many.assert_called_once()
+        audit_logger._unacknowledged.insert_many.assert_not_called()
+
+        await audit_logger.close()
+
+    async def test_history_reads_do_not_raise_background_errors(self, audit_logger):
+        audit_logger.collection.insert_many.side_effect = RuntimeError("write failed")
+
+        await audit_logger.log_delete("users", "1", {"_id": 1})
+        await audit_logger.get_document_history("users", "1")
+
+        with pytest.raises(RuntimeError):
+            await audit_logger.close()
+
+    def test_writer_follows_event_loop(self, audit_logger):
+        import asyncio
+
+        # The first loop closes before its writer runs; the entry is written on the next
+        asyncio.run(audit_logger.log_create("users", {"_id": 1}))
+        asyncio.run(audit_logger.close())
+
+        batch = audit_logger.collection.insert_many.call_args[0][0]
+        assert [entry["document_id"] for entry in batch] == ["1"]
+        assert audit_logger._flush_task is None
+
+    async def test_engine_close_stops_writers(self, audit_logger):
+        from monglo.core.engine import MongloEngine
+
+        await audit_logger.log_create("users", {"_id": 1})
+        await MongloEngine(audit_logger.db).close()
+
+        audit_logger.collection.insert_many.assert_called_once()
+        assert audit_logger._flush_task is None
+        assert audit_logger not in AuditLogger._writers
+
+    async def test_strict_mode_acknowledges_writes(self, audit_logger):
+        audit_logger.strict_mode = True
+
+        await audit_logger.log_create("users", {"_id": 1})
+
+        audit_logger.collection.insert_many.assert_called_once()
+        assert "bypass_document_validation" not in audit_logger.collection.insert_many.call_args[1]
+        assert audit_logger._flush_task is None
+
+    async def test_strict_mode_raises_write_error(self, audit_logger):
+        audit_logger.strict_mode = True
+        audit_logger.collection.insert_many.side_effect = RuntimeError("write failed")
+
+        with pytest.raises(RuntimeError):
+            await audit_logger.log_update("users", "1", {"a": 1}, {"a": 2})
+
+    async def test_history_omits_payload_by_default(self, audit_logger):
+        await audit_logger.get_document_history("users", "1")
+        await audit_logger.get_user_activity("admin", include_payload=True)
+
+        summary_call, payload_call = audit_logger.collection.find.call_args_list
+        assert summary_call[0][1] == {"before": 0, "after": 0, "data": 0}
+        assert payload_call[0][1] is None
+        audit_logger.collection.create_indexes.assert_called_once()
+
+    async def test_indexes_created_once_per_collection(self, audit_logger):
+        other = AuditLogger(audit_logger.db)
+
+        await audit_logger.get_user_activity("admin")
+        await other.get_user_activity("admin")
+
+        audit_logger.collection.create_indexes.assert_called_once()
+
+    async def test_indexes_created_per_client(self, audit_logger, mocker):
+        other_db = mocker.MagicMock()
+        other_db.name = audit_logger.db.name
+        other_db.__getitem__.return_value = audit_logger.collection
+        other = AuditLogger(other_db)
+
+        await audit_logger.get_user_activity("admin")
+        await other.get_user_activity("admin")
+
+        assert audit_logger.collection.create_indexes.call_count == 2
+
+    def test_calculate_changes(self, audit_logger):
+        changes = audit_logger._calculate_changes(
+            {"a": 1, "b": 2, "c": 3},
+            {"a": 1, "b": 5, "d": 4}
+        )
+
+        assert changes == {
+            "b": {"old": 2, "new": 5},
+            "c": {"old": 3, "new": None},
+            "d": {"old": None, "new": 4}
+        }
@@ -0,0 +1,70 @@
+
+import asyncio
+
+import pytest
+from monglo.operations._count_cache import cached_count, invalidate_counts
+
+@pytest.fixture
+def collection(mocker):
+    async def count_documents(query):
+        await asyncio.sleep(0)
+        return 42
+
+    collection = mocker.MagicMock()
+    collection.full_name = "shop.orders"
+    collection.count_documents = mocker.AsyncMock(side_effect=count_documents)
+    invalidate_counts()
+    yield collection
+    invalidate_counts()
+
+class TestCachedCount:
+
+    async def test_repeated_counts_hit_cache(self, collection):
+        assert await cached_count(collection, {"status": "paid"}) == 42
+        assert await cached_count(collection, {"status": "paid"}) == 42
+
+        assert collection.count_documents.call_count == 1
+
+    async def test_concurrent_counts_coalesce(self, collection):
+        results = await asyncio.gather(*(cached_count(collection, {"a": 1, "b": 2}) for _ in range(5)))
+
+        assert results == [42] * 5
+        assert collection.count_documents.call_count == 1
+
+    async def test_key_ignores_top_level_order(self, collection):
+        await cached_count(collection, {"a": 1, "b": 2})
+        await cached_count(collection, {"b": 2, "a": 1})
+
+        assert collection.count_documents.call_count == 1
+
+    async def test_invalidate_forces_recount(self, collection):
+        await cached_count(collection, {})
+        invalidate_counts(collection)
+        await cached_count(collection, {})
+
+        assert collection.count_documents.call_count == 2
+
+    async def test_count_started_before_invalidation_is_not_cached(self, collection):
+        pending = asyncio.ensure_future(cached_count(collection, {}))
+        while not collection.count_documents.called:
+            await asyncio.sleep(0)
+        invalidate_counts(collection)
+        await pending
+
+        await cached_count(collection, {})
+
+        assert collection.count_documents.call_count == 2
+
+    async def test_estimated_count_cached_separately(self, collection, mocker):
+        collection.estimated_document_count = mocker.AsyncMock(return_value=40)
+
+        assert await cached_count(collection, {}, estimated=True) == 40
+        assert await cached_count(collection, {}, estimated=True) == 40
+        assert await cached_count(collection, {}) == 42
+
+        assert collection.estimated_document_count.call_count == 1
+        assert collection.count_documents.call_count == 1
+
+    async def test_estimated_count_rejects_query(self, collection):
+        with pytest.raises(ValueError):
+            await cached_count(collection, {"a": 1}, estimated=True)
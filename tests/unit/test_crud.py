@@ -1,7 +1,8 @@
 
 import pytest
 from bson import ObjectId
-from monglo.operations.crud import CRUDOperations
+from pymongo import DeleteOne, InsertOne, UpdateOne
+from monglo.operations.crud import CRUDOperations, _search_query
 from monglo.core.registry import CollectionAdmin
 from monglo.core.config import CollectionConfig
 
@@ -33,6 +34,11 @@ class TestCRUDCreate:
         assert result["name"] == "John Doe"
         assert result["email"] == "john@example.com"
     
+    async def test_create_refetch(self, crud_ops, sample_doc):
+        result = await crud_ops.create(dict(sample_doc), refetch=True)
+        
+        assert result == await crud_ops.get(str(result["_id"]))
+    
     async def test_create_empty_fails(self, crud_ops):
         with pytest.raises(ValueError):
             await crud_ops.create({})
@@ -78,6 +84,17 @@ class TestCRUDRead:
         assert result["has_next"] is True
         assert result["has_prev"] is False
     
+    async def test_list_fused(self, crud_ops):
+        docs = [{"name": f"User {i}"} for i in range(25)]
+        await crud_ops.bulk_create(docs)
+        
+        result = await crud_ops.list(page=3, per_page=10, fuse=True)
+        
+        assert result["total"] == 25
+        assert len(result["items"]) == 5
+        assert result["has_next"] is False
+        assert result["has_prev"] is True
+    
     async def test_list_with_search(self, crud_ops):
         docs = [
             {"name": "Alice", "email": "alice@example.com"},
@@ -107,6 +124,7 @@ class TestCRUDRead:
         
         assert await crud_ops.exists(doc_id) is True
         assert await crud_ops.exists(str(ObjectId())) is False
+        assert await crud_ops.exists("not-an-id") is False
 
 class TestCRUDUpdate:
     
@@ -149,6 +167,20 @@ class TestCRUDUpdate:
         
         assert result["matched"] == 5
         assert result["modified"] == 5
+    
+    async def test_bulk_write(self, crud_ops):
+        created = await crud_ops.bulk_create([{"n": i} for i in range(3)], chunk=2)
+        
+        result = await crud_ops.bulk_write([
+            InsertOne({"n": 3}),
+            UpdateOne({"_id": created[0]["_id"]}, {"$set": {"n": 10}}),
+            DeleteOne({"_id": created[1]["_id"]})
+        ])
+        
+        assert result["inserted"] == 1
+        assert result["modified"] == 1
+        assert result["deleted"] == 1
+        assert await crud_ops.count() == 3
 
 class TestCRUDDelete:
     
@@ -192,3 +224,56 @@ class TestCRUDEdgeCases:
     async def test_empty_bulk_delete(self, crud_ops):
         result = await crud_ops.bulk_delete([])
         assert result == 0
+    
+    async def test_bulk_delete_rejects_invalid_ids(self, crud_ops):
+        created = await crud_ops.bulk_create([{"name": "A"}, {"name": "B"}])
+        
+        with pytest.raises(ValueError, match="invalid-id"):
+            await crud_ops.bulk_delete([str(created[0]["_id"]), "invalid-id"])
+        
+        assert await crud_ops.count() == 2
+
+class TestSearchQuery:
+    
+    def test_cached_query_is_not_shared(self):
+        first = _search_query("alice", ("name", "email"))
+        first["$or"].append({"status": "x"})
+        
+        second = _search_query("alice", ("name", "email"))
+        
+        assert second is not first
+        assert {"status": "x"} not in second["$or"]
+
+class TestExistsCache:
+    
+    @pytest.fixture
+    def admin(self, mocker):
+        admin = mocker.MagicMock()
+        admin.config = CollectionConfig()
+        admin.collection.full_name = f"shop.orders_{ObjectId()}"
+        admin.collection.find_one = mocker.AsyncMock(return_value={"_id": 1})
+        admin.collection.delete_one = mocker.AsyncMock(return_value=mocker.Mock(deleted_count=1))
+        return admin
+    
+    async def test_shared_between_instances(self, admin):
+        oid = ObjectId()
+        
+        assert await CRUDOperations(admin).exists(oid) is True
+        assert await CRUDOperations(admin).exists(oid) is True
+        
+        admin.collection.find_one.assert_awaited_once()
+    
+    @pytest.mark.parametrize("id", [42, "order-42", "zz" * 12])
+    async def test_non_object_ids_queried_as_given(self, admin, id):
+        assert await CRUDOperations(admin).exists(id) is True
+        
+        admin.collection.find_one.assert_awaited_once_with({"_id": id}, {"_id": 1})
+    
+    async def test_cleared_by_writes(self, admin):
+        oid = ObjectId()
+        
+        await CRUDOperations(admin).exists(oid)
+        await CRUDOperations(admin).delete(oid)
+        admin.collection.find_one.return_value = None
+        
+        assert await CRUDOperations(admin).exists(oid) is False
@@ -0,0 +1,150 @@
+
+import json
+from datetime import date, datetime
+
+import pytest
+from bson import ObjectId
+from monglo.operations.export import ExportOperations, export_collection, stream_export
+
+class TestExportSerialization:
+
+    def test_fast_path_matches_recursive(self):
+        exporter = ExportOperations()
+        doc = {
+            "_id": ObjectId(),
+            "tags": ["a", {"at": datetime(2024, 1, 1), "days": [date(2024, 1, 2), b"\x01"]}],
+            "nested": {"ref": ObjectId(), "empty": []},
+            "none": None,
+        }
+
+        assert exporter._serialize_fast(doc) == exporter._serialize_document(doc)
+
+    def test_to_ndjson(self):
+        exporter = ExportOperations()
+        oid = ObjectId()
+
+        output = exporter.to_ndjson([{"_id": oid, "n": 1}, {"_id": oid, "n": 2}])
+
+        assert [json.loads(line) for line in output.split("\n")] == [
+            {"_id": str(oid), "n": 1},
+            {"_id": str(oid), "n": 2},
+        ]
+
+    def test_to_json_encoders_agree(self, mocker):
+        exporter = ExportOperations()
+        docs = [
+            {"_id": ObjectId(), "at": datetime(2024, 1, 1, 12, 30), "raw": b"\xff", "tags": ("a",)}
+        ]
+
+        fast = exporter.to_json(docs, pretty=True, compact=True)
+        mocker.patch("monglo.operations.export.orjson", None)
+        stdlib = exporter.to_json(docs, pretty=True, compact=True)
+
+        assert json.loads(fast) == json.loads(stdlib)
+
+    @pytest.mark.parametrize("backend", ["orjson", "stdlib"])
+    def test_default_output_independent_of_backend(self, mocker, backend):
+        if backend == "stdlib":
+            mocker.patch("monglo.operations.export.orjson", None)
+        docs = [{"name": "café", "n": 1}]
+
+        assert ExportOperations().to_json(docs) == '[{"name": "café", "n": 1}]'
+        assert ExportOperations().to_ndjson(docs) == '{"name": "caf\\u00e9", "n": 1}'
+
+    @pytest.mark.parametrize("backend", ["orjson", "stdlib"])
+    def test_compact_output_independent_of_backend(self, mocker, backend):
+        if backend == "stdlib":
+            mocker.patch("monglo.operations.export.orjson", None)
+        docs = [{"_id": ObjectId("65a000000000000000000001"), "name": "café", "n": 1}]
+
+        assert ExportOperations().to_json(docs, compact=True) == (
+            '[{"_id":"65a000000000000000000001","name":"café","n":1}]'
+        )
+        assert ExportOperations().to_ndjson(docs * 2, compact=True) == "\n".join(
+            ['{"_id":"65a000000000000000000001","name":"café","n":1}'] * 2
+        )
+
+    @pytest.mark.parametrize(
+        "doc",
+        [
+            {"n": float("nan"), "inf": [float("-inf")]},
+            {"big": 2**70},
+            {"by_id": {1: "a", 2.5: None}},
+        ],
+    )
+    def test_compact_fallbacks_match_stdlib(self, mocker, doc):
+        exporter = ExportOperations()
+
+        def encode():
+            return (
+                exporter.to_json([doc], compact=True),
+                exporter.to_ndjson([doc] * 2, compact=True),
+            )
+
+        fast = encode()
+        mocker.patch("monglo.operations.export.orjson", None)
+
+        assert fast == encode()
+
+    def test_csv_fast_mode_matches_writer(self):
+        exporter = ExportOperations()
+        docs = [
+            {"_id": ObjectId(), "name": 'Say "hi", then\nleave', "score": 1.5, "ok": True},
+            {"_id": ObjectId(), "name": "", "score": None, "extra": "x"},
+            {"_id": ObjectId(), "name": " padded\r", "score": 0, "ok": False},
+        ]
+        fields = ["_id", "name", "score", "ok", "missing"]
+
+        fast = exporter.to_csv(docs, fields=fields)
+        slow = exporter.to_csv(docs, fields=fields, fast_mode=False)
+
+        assert fast == slow
+
+class TestStreamExport:
+
+    @pytest.fixture
+    def collection(self, mocker):
+        docs = [{"_id": i, "name": f"n{i}"} for i in range(5)]
+        batches = [docs[:2], docs[2:4], docs[4:], []]
+        collection = mocker.MagicMock()
+        cursor = collection.find.return_value.batch_size.return_value
+        cursor.to_list = mocker.AsyncMock(side_effect=batches)
+        return collection
+
+    async def test_json_chunks_form_one_document(self, collection):
+        chunks = [c async for c in stream_export(collection, format="json", batch_size=2)]
+
+        assert len(chunks) == 5
+        assert json.loads("".join(chunks)) == [{"_id": i, "name": f"n{i}"} for i in range(5)]
+
+    async def test_csv_header_written_once(self, collection):
+        output = await export_collection(collection, format="csv")
+
+        assert output.splitlines() == ["_id,name"] + [f"{i},n{i}" for i in range(5)]
+
+    async def test_ndjson_matches_single_shot(self, collection):
+        output = await export_collection(collection, format="ndjson")
+
+        expected = ExportOperations().to_ndjson([{"_id": i, "name": f"n{i}"} for i in range(5)])
+        assert output == expected
+
+    async def test_writer_options_passed_through(self, collection, mocker):
+        to_csv = mocker.spy(ExportOperations, "to_csv")
+
+        await export_collection(collection, format="csv", fast_mode=False)
+
+        assert all(call.kwargs["fast_mode"] is False for call in to_csv.call_args_list)
+
+    async def test_unknown_options_rejected_by_writer(self, collection):
+        with pytest.raises(TypeError):
+            await export_collection(collection, format="json", sort_keys=True)
+
+    async def test_ndjson_warns_on_ignored_options(self, collection):
+        with pytest.warns(DeprecationWarning):
+            output = await export_collection(collection, format="ndjson", indent=2)
+
+        assert output.count("\n") == 4
+
+    async def test_unsupported_format(self, collection):
+        with pytest.raises(ValueError):
+            await export_collection(collection, format="xml")
@@ -0,0 +1,188 @@
+
+import pytest
+from bson import DBRef, ObjectId
+from monglo.fields.custom import CustomField, EnumField
+from monglo.fields.embedded import ArrayField, EmbeddedField
+from monglo.fields.files import FileField, GridFSHelper, ImageField
+from monglo.fields.references import DBRefField, ObjectIdField
+
+class TestEmbeddedField:
+
+    def test_validate_nested_schema(self):
+        field = EmbeddedField(
+            schema={
+                "address": EmbeddedField(schema={"country": EnumField(["us", "uk"])}),
+                "tags": ArrayField(item_type=EnumField(["a", "b"]), max_items=2),
+            }
+        )
+
+        assert field.validate({"address": {"country": "us"}, "tags": ["a"]})
+        assert field.validate({})  # Missing fields are not checked
+        assert not field.validate({"address": {"country": "fr"}})
+        assert not field.validate({"tags": ["a", "b", "a"]})
+        assert not field.validate([])
+
+    def test_schema_reassignment_recompiles(self):
+        field = EmbeddedField()
+        assert field.validate({"status": "x"})
+
+        field.schema = {"status": EnumField(["active"])}
+        assert not field.validate({"status": "x"})
+
+    def test_schema_mutated_in_place_recompiles(self):
+        field = EmbeddedField(schema={"status": EnumField(["active"])})
+        assert not field.validate({"status": "x", "kind": "y"})
+        validator = field._validate_fast
+
+        field.schema["status"] = EnumField(["x"])
+        field.schema.update(kind=EnumField(["z"]))
+        assert not field.validate({"status": "x", "kind": "y"})
+        assert field.validate({"status": "x", "kind": "z"})
+        assert field._validate_fast is not validator
+
+    def test_unchanged_schema_keeps_validator(self):
+        field = EmbeddedField(schema={"status": EnumField(["active"])})
+        field.validate({"status": "active"})
+        validator = field._validate_fast
+
+        field.get_widget_config()
+        field.validate({"status": "x"})
+
+        assert field._validate_fast is validator
+
+    def test_self_referencing_schema(self):
+        node = EmbeddedField()
+        node.schema = {"name": EnumField(["a", "b"]), "child": node}
+
+        assert node.validate({"name": "a", "child": {"name": "b", "child": {}}})
+        assert not node.validate({"name": "a", "child": {"name": "c"}})
+
+    def test_widget_config_is_read_only(self):
+        field = EmbeddedField(
+            schema={
+                "status": EnumField(["active"]),
+                "scan": FileField(allowed_extensions=[".pdf"]),
+                "tags": ArrayField(item_type=EnumField(["a"])),
+            }
+        )
+
+        config = field.get_widget_config()
+
+        assert field.get_widget_config() is config
+        assert config["schema"]["status"]["choices"][0] == {"value": "active", "label": "Active"}
+        with pytest.raises(TypeError):
+            config["type"] = "text"
+        with pytest.raises(TypeError):
+            config["schema"]["status"]["choices"][0]["label"] = "x"
+        with pytest.raises(AttributeError):
+            config["schema"]["scan"]["allowed_extensions"].append(".exe")
+        with pytest.raises(TypeError):
+            config["schema"]["tags"]["item_type"]["type"] = "text"
+
+class TestArrayField:
+
+    def test_validate_bounds_and_items(self):
+        field = ArrayField(
+            item_type=EmbeddedField(schema={"kind": EnumField(["x"])}), min_items=1
+        )
+
+        assert field.validate([{"kind": "x"}])
+        assert not field.validate([])
+        assert not field.validate([{"kind": "y"}])
+        assert not field.validate("x")
+
+    def test_nested_bounds_change_reaches_parent(self):
+        tags = ArrayField(item_type=EnumField(["a"]), max_items=2)
+        field = EmbeddedField(schema={"tags": tags})
+        assert field.validate({"tags": ["a", "a"]})
+
+        tags.max_items = 1
+        assert not field.validate({"tags": ["a", "a"]})
+
+    def test_identical_schemas_share_validator(self):
+        country = EnumField(["us", "uk"])
+        first = ArrayField(item_type=EmbeddedField(schema={"country": country}))
+        second = ArrayField(item_type=EmbeddedField(schema={"country": country}))
+
+        assert first.validate([{"country": "us"}])
+        assert second.validate([{"country": "uk"}])
+        assert first._validate_fast.__code__ is second._validate_fast.__code__
+
+class TestObjectIdField:
+
+    def test_validate_hex_strings(self):
+        field = ObjectIdField()
+        oid = ObjectId()
+
+        assert field.validate(str(oid)) == oid
+        assert field.validate(oid) is oid
+        for bad in ("", "xyz", str(oid)[:-1], str(oid) + "\n", "g" * 24):
+            with pytest.raises(ValueError):
+                field.validate(bad)
+
+    def test_dbref_from_string(self):
+        field = DBRefField(collection="users")
+        oid = ObjectId()
+
+        assert field.validate(str(oid)) == DBRef("users", oid)
+        with pytest.raises(ValueError):
+            field.validate("not-an-id")
+
+class TestGridFSHelper:
+
+    async def test_stream_and_download(self, mocker):
+        grid_out = mocker.MagicMock()
+        grid_out.read = mocker.AsyncMock(side_effect=[b"ab", b"cd", b""] * 2)
+        bucket = mocker.patch("monglo.fields.files.AsyncIOMotorGridFSBucket").return_value
+        bucket.open_download_stream = mocker.AsyncMock(return_value=grid_out)
+        helper = GridFSHelper(mocker.MagicMock())
+        file_id = str(ObjectId())
+
+        chunks = [chunk async for chunk in helper.stream_file(file_id, chunk_size=2)]
+
+        assert chunks == [b"ab", b"cd"]
+        grid_out.read.assert_called_with(2)
+        assert await helper.download_file(file_id) == b"abcd"
+
+class TestEmbeddedSerialize:
+
+    def test_serialize_known_and_unknown_fields(self):
+        field = EmbeddedField(
+            schema={"name": CustomField(serializer=str.upper), "ref": ObjectIdField()}
+        )
+        oid = ObjectId()
+
+        assert field.serialize({"name": "ada", "ref": oid, "extra": 1}) == {
+            "name": "ADA",
+            "ref": oid,
+            "extra": 1,
+        }
+
+        field.schema = {}
+        assert field.serialize({"name": "ada"}) == {"name": "ada"}
+
+    async def test_upload_metadata_and_chunk_size(self, mocker):
+        bucket = mocker.patch("monglo.fields.files.AsyncIOMotorGridFSBucket").return_value
+        bucket.upload_from_stream = mocker.AsyncMock(return_value=ObjectId())
+        helper = GridFSHelper(mocker.MagicMock())
+
+        await helper.upload_file(
+            b"data", "a.txt", "text/plain", {"content_type": "text/csv"}, chunk_size_bytes=1024
+        )
+
+        args, kwargs = bucket.upload_from_stream.call_args
+        assert args == ("a.txt", b"data")
+        assert kwargs == {"metadata": {"content_type": "text/csv"}, "chunk_size_bytes": 1024}
+
+class TestFileField:
+
+    def test_extension_check(self):
+        field = ImageField()
+
+        assert field.validate({"filename": "photo.JPG", "file_id": "1"})
+        assert not field.validate({"filename": "notes.txt", "file_id": "1"})
+        assert not field.validate({"filename": "photo.jpg.exe", "file_id": "1"})
+
+        field.allowed_extensions = ["txt"]
+        assert field.validate({"filename": "notes.txt", "file_id": "1"})
+        assert FileField().validate({"filename": "anything.bin", "file_id": "1"})
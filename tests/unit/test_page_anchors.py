@@ -0,0 +1,131 @@
+
+import pytest
+from bson import ObjectId
+from monglo.operations.pagination import PaginationHandler
+
+@pytest.fixture
+def collection(mocker):
+    collection = mocker.MagicMock()
+    collection.count_documents = mocker.AsyncMock(return_value=1000)
+    collection.estimated_document_count = mocker.AsyncMock(return_value=990)
+    cursor = collection.find.return_value
+    cursor.sort.return_value = cursor
+    cursor.skip.return_value = cursor
+    cursor.limit.return_value = cursor
+    cursor.to_list = mocker.AsyncMock()
+    return collection
+
+class TestPageAnchors:
+
+    async def test_deep_page_seeks_from_anchor(self, collection):
+        cursor = collection.find.return_value
+        cursor.to_list.side_effect = [
+            [{"_id": i} for i in range(180, 200)],
+            [{"_id": i} for i in range(220, 241)],
+        ]
+        pag = PaginationHandler(collection)
+
+        await pag.paginate_offset({"status": "paid"}, page=10, per_page=20, sort=[("_id", 1)])
+        result = await pag.paginate_offset({"status": "paid"}, page=12, per_page=20, sort=[("_id", 1)])
+
+        assert collection.find.call_args[0][0] == {"$and": [{"status": "paid"}, {"_id": {"$gt": 199}}]}
+        cursor.skip.assert_called_with(20)
+        cursor.limit.assert_called_with(21)
+        assert [doc["_id"] for doc in result["items"]] == list(range(220, 240))
+        assert result["pagination"]["has_next"] is True
+
+    async def test_non_id_sort_uses_skip(self, collection):
+        cursor = collection.find.return_value
+        cursor.to_list.return_value = [{"_id": i} for i in range(20)]
+        pag = PaginationHandler(collection)
+
+        await pag.paginate_offset({}, page=10, per_page=20, sort=[("name", 1)])
+        await pag.paginate_offset({}, page=11, per_page=20, sort=[("name", 1)])
+
+        assert cursor.skip.call_count == 2
+        cursor.skip.assert_called_with(200)
+
+class TestPageCounts:
+
+    async def test_first_page_counts_exactly(self, collection):
+        collection.find.return_value.to_list.return_value = [{"_id": i} for i in range(21)]
+        pag = PaginationHandler(collection)
+
+        result = await pag.paginate_offset({"status": "new"}, page=1, per_page=20)
+
+        assert collection.count_documents.call_args[1] == {"maxTimeMS": 5000}
+        assert len(result["items"]) == 20
+        assert result["pagination"]["total"] == 1000
+        assert result["pagination"]["total_exact"] is True
+
+    async def test_later_page_without_filter_uses_estimate(self, collection):
+        collection.find.return_value.to_list.return_value = [{"_id": i} for i in range(20)]
+        pag = PaginationHandler(collection)
+
+        result = await pag.paginate_offset({}, page=3, per_page=20)
+
+        collection.count_documents.assert_not_called()
+        assert result["pagination"]["total"] == 990
+        assert result["pagination"]["total_exact"] is False
+
+    async def test_later_filtered_page_skips_count(self, collection):
+        collection.find.return_value.to_list.return_value = [{"_id": i} for i in range(21)]
+        pag = PaginationHandler(collection)
+
+        result = await pag.paginate_offset({"status": "late"}, page=3, per_page=20)
+
+        collection.count_documents.assert_not_called()
+        assert result["pagination"]["total"] is None
+        assert result["pagination"]["total_pages"] is None
+        assert result["pagination"]["has_next"] is True
+
+class TestCursorPagination:
+
+    async def test_hex_cursor_parsed_as_object_id(self, collection):
+        collection.find.return_value.to_list.return_value = []
+        oid = ObjectId()
+        pag = PaginationHandler(collection)
+
+        await pag.paginate_cursor({}, cursor=str(oid))
+        await pag.paginate_cursor({}, cursor=oid)
+
+        assert [c[0][0] for c in collection.find.call_args_list] == [{"_id": {"$gt": oid}}] * 2
+
+    async def test_opaque_cursor_kept_as_string(self, collection):
+        collection.find.return_value.to_list.return_value = []
+        pag = PaginationHandler(collection)
+
+        await pag.paginate_cursor({}, cursor="zz" * 12, sort_field="name", sort_direction=-1)
+
+        assert collection.find.call_args[0][0] == {"name": {"$lt": "zz" * 12}}
+        collection.find.return_value.sort.assert_called_with([("name", -1)])
+
+class TestStructResponse:
+
+    async def test_offset_meta_matches_dict(self, collection):
+        collection.find.return_value.to_list.return_value = [{"_id": i} for i in range(21)]
+        pag = PaginationHandler(collection)
+
+        plain = await pag.paginate_offset({}, page=1, per_page=20)
+        struct = await pag.paginate_offset({}, page=1, per_page=20, struct_response=True)
+
+        assert struct["pagination"].total_pages == 50
+        assert struct["pagination"]._asdict() == plain["pagination"]
+
+    async def test_cursor_meta_matches_dict(self, collection):
+        collection.find.return_value.to_list.return_value = [{"_id": i} for i in range(3)]
+        pag = PaginationHandler(collection)
+
+        plain = await pag.paginate_cursor({}, per_page=2)
+        struct = await pag.paginate_cursor({}, per_page=2, struct_response=True)
+
+        assert struct["pagination"].next_cursor == 1
+        assert struct["pagination"]._asdict() == plain["pagination"]
+
+class TestPageInfo:
+
+    async def test_unfiltered_uses_estimate(self, collection):
+        info = await PaginationHandler(collection).get_page_info({}, per_page=100)
+
+        collection.count_documents.assert_not_called()
+        assert info == {"total": 990, "per_page": 100, "total_pages": 10}
@@ -0,0 +1,13 @@
+
+from monglo.core.query_builder import QueryBuilder
+
+class TestBuildSort:
+
+    def test_default_sort_is_shared_and_immutable(self):
+        default = QueryBuilder.build_sort()
+
+        assert default == (("_id", 1),)
+        assert QueryBuilder.build_sort() is default
+
+    def test_explicit_sort_is_kept(self):
+        assert QueryBuilder.build_sort([("name", -1)]) == [("name", -1)]
@@ -222,6 +222,77 @@ class TestRelationshipDetector:
         # Manual relationship should be included
         assert manual_rel in relationships
 
+    @pytest.mark.asyncio
+    async def test_collection_names_shared_across_detectors(self, mock_db, mocker):
+        mock_collection = mocker.AsyncMock()
+        mock_collection.find = mocker.MagicMock()
+        mock_collection.find.return_value.limit.return_value.to_list = mocker.AsyncMock(
+            return_value=[]
+        )
+        mock_db.__getitem__ = mocker.MagicMock(return_value=mock_collection)
+
+        config = CollectionConfig()
+        await RelationshipDetector(mock_db).detect("orders", config)
+        await RelationshipDetector(mock_db).detect("orders", config)
+
+        assert mock_db.list_collection_names.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_detect_lists_collections_once(self, mock_db, mocker):
+        import asyncio
+
+        mock_collection = mocker.AsyncMock()
+        mock_collection.find = mocker.MagicMock()
+        mock_collection.find.return_value.limit.return_value.to_list = mocker.AsyncMock(
+            return_value=[]
+        )
+        mock_db.__getitem__ = mocker.MagicMock(return_value=mock_collection)
+
+        async def list_collection_names():
+            await asyncio.sleep(0)  # Yield so the detectors overlap
+            return ["users", "orders"]
+
+        mock_db.list_collection_names = mocker.AsyncMock(side_effect=list_collection_names)
+
+        config = CollectionConfig()
+        await asyncio.gather(
+            *(RelationshipDetector(mock_db).detect(name, config) for name in ("a", "b", "c"))
+        )
+
+        assert mock_db.list_collection_names.await_count == 1
+
+    async def test_collection_cache_released_with_database(self, mocker):
+        import gc
+        import weakref
+
+        from monglo.core import relationships
+
+        db = mocker.AsyncMock()
+        db.list_collection_names = mocker.AsyncMock(return_value=["users"])
+
+        await RelationshipDetector(db)._get_collection_names()
+        assert db in relationships._COLLECTION_CACHE
+
+        ref = weakref.ref(db)
+        del db
+        gc.collect()
+
+        assert ref() is None
+
+    def test_pending_fetch_not_shared_across_loops(self, mock_db):
+        import asyncio
+
+        from monglo.core import relationships
+
+        other_loop = asyncio.new_event_loop()
+        relationships._PENDING_COLLECTION_NAMES[mock_db] = other_loop.create_future()
+        other_loop.close()
+
+        names = asyncio.run(RelationshipDetector(mock_db)._get_collection_names())
+
+        assert names == {"users", "orders", "products", "categories"}
+        assert mock_db not in relationships._PENDING_COLLECTION_NAMES
+
     def test_guess_collection_from_field(self, detector):
         assert detector._guess_collection_from_field("user_id") == "users"
         assert detector._guess_collection_from_field("author_id") == "authors"
@@ -298,6 +369,32 @@ class TestRelationshipResolver:
         assert len(result["_relationships"]["product_ids"]) == 2
         assert result["_relationships"]["product_ids"][0]["name"] == "Product A"
 
+    @pytest.mark.asyncio
+    async def test_resolve_one_to_many_limited_by_max_related(self, resolver, mock_db, mocker):
+        mock_collection = mocker.MagicMock()
+        mock_collection.find.return_value.to_list = mocker.AsyncMock(return_value=[])
+        mock_db.__getitem__ = mocker.MagicMock(return_value=mock_collection)
+
+        document = {"_id": ObjectId(), "tags": ["a", "b"]}
+        relationship = Relationship(
+            source_collection="posts",
+            source_field="tags",
+            target_collection="labels",
+            target_field="tag",
+            type=RelationshipType.ONE_TO_MANY,
+        )
+
+        await resolver.resolve(document, [relationship], max_related=10)
+
+        # Several labels may share a tag, so the reference count is no bound
+        assert mock_collection.find.call_args.kwargs["limit"] == 10
+        mock_collection.find.return_value.to_list.assert_awaited_once_with(10)
+
+    @pytest.mark.asyncio
+    async def test_resolve_rejects_zero_max_related(self, resolver):
+        with pytest.raises(ValueError):
+            await resolver.resolve({"_id": 1}, [], max_related=0)
+
     @pytest.mark.asyncio
     async def test_resolve_missing_field(self, resolver, mock_db):
         document = {"_id": ObjectId(), "total": 100}
@@ -352,3 +449,228 @@ class TestRelationshipResolver:
     async def test_resolve_batch_empty(self, resolver, mock_db):
         results = await resolver.resolve_batch([], [])
         assert results == []
+
+    @pytest.mark.asyncio
+    async def test_resolve_batch_multiple_relationships(self, resolver, mock_db, mocker):
+        user_id = ObjectId()
+        product_id = ObjectId()
+        collections = {
+            "users": [{"_id": user_id, "name": "Alice"}],
+            "products": [{"_id": product_id, "name": "Widget"}],
+        }
+
+        def get_collection(name):
+            collection = mocker.MagicMock()
+            collection.find.return_value.to_list = mocker.AsyncMock(
+                return_value=collections[name]
+            )
+            return collection
+
+        mock_db.__getitem__ = mocker.MagicMock(side_effect=get_collection)
+
+        documents = [{"_id": ObjectId(), "user_id": user_id, "product_id": product_id}]
+        relationships = [
+            Relationship(
+                source_collection="orders", source_field="user_id", target_collection="users"
+            ),
+            Relationship(
+                source_collection="orders",
+                source_field="product_id",
+                target_collection="products",
+            ),
+        ]
+
+        results = await resolver.resolve_batch(documents, relationships)
+
+        assert results[0]["_relationships"]["user_id"]["name"] == "Alice"
+        assert results[0]["_relationships"]["product_id"]["name"] == "Widget"
+
+    @pytest.mark.asyncio
+    async def test_resolve_batch_chunks_large_in_queries(self, resolver, mock_db, mocker):
+        user_ids = [ObjectId() for _ in range(1200)]
+
+        mock_collection = mocker.MagicMock()
+        mock_collection.find.return_value.to_list = mocker.AsyncMock(return_value=[])
+        mock_db.__getitem__ = mocker.MagicMock(return_value=mock_collection)
+
+        documents = [{"_id": ObjectId(), "user_id": user_id} for user_id in user_ids]
+        relationship = Relationship(
+            source_collection="orders", source_field="user_id", target_collection="users"
+        )
+
+        await resolver.resolve_batch(documents, [relationship])
+
+        assert mock_collection.find.call_count == 3
+        chunk_sizes = [len(c.args[0]["_id"]["$in"]) for c in mock_collection.find.call_args_list]
+        assert chunk_sizes == [500, 500, 200]
+
+    @pytest.mark.asyncio
+    async def test_resolve_batch_deduplicates_ref_values(self, resolver, mock_db, mocker):
+        user_id = ObjectId()
+
+        mock_collection = mocker.MagicMock()
+        mock_collection.find.return_value.to_list = mocker.AsyncMock(
+            return_value=[{"_id": user_id, "name": "Alice"}]
+        )
+        mock_db.__getitem__ = mocker.MagicMock(return_value=mock_collection)
+
+        documents = [{"_id": ObjectId(), "user_id": user_id} for _ in range(5)]
+        relationship = Relationship(
+            source_collection="orders", source_field="user_id", target_collection="users"
+        )
+
+        results = await resolver.resolve_batch(documents, [relationship])
+
+        query = mock_collection.find.call_args.args[0]
+        assert query == {"_id": {"$in": [user_id]}}
+        assert all(r["_relationships"]["user_id"]["name"] == "Alice" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_resolve_batch_embedded_reference_values(self, resolver, mock_db, mocker):
+        address = {"city": "Oslo", "zip": "0150"}
+
+        mock_collection = mocker.MagicMock()
+        mock_collection.find.return_value.to_list = mocker.AsyncMock(
+            return_value=[{"_id": 1, "address": dict(address)}]
+        )
+        mock_db.__getitem__ = mocker.MagicMock(return_value=mock_collection)
+
+        documents = [
+            {"_id": ObjectId(), "address": dict(address)},
+            {"_id": ObjectId(), "address": [dict(address), ["x"]]},
+        ]
+        relationship = Relationship(
+            source_collection="orders",
+            source_field="address",
+            target_collection="offices",
+            target_field="address",
+            type=RelationshipType.EMBEDDED,
+        )
+
+        results = await resolver.resolve_batch(documents, [relationship])
+
+        query = mock_collection.find.call_args.args[0]
+        assert query == {"address": {"$in": [address, ["x"]]}}
+        assert results[0]["_relationships"]["address"]["_id"] == 1
+        assert [doc["_id"] for doc in results[1]["_relationships"]["address"]] == [1]
+
+    @pytest.mark.asyncio
+    async def test_resolve_batch_shares_query_for_same_target(self, resolver, mock_db, mocker):
+        creator_id = ObjectId()
+        editor_id = ObjectId()
+
+        mock_collection = mocker.MagicMock()
+        mock_collection.find.return_value.to_list = mocker.AsyncMock(
+            return_value=[{"_id": creator_id, "name": "Alice"}, {"_id": editor_id, "name": "Bob"}]
+        )
+        mock_db.__getitem__ = mocker.MagicMock(return_value=mock_collection)
+
+        documents = [{"_id": ObjectId(), "created_by": creator_id, "updated_by": editor_id}]
+        relationships = [
+            Relationship(
+                source_collection="posts", source_field="created_by", target_collection="users"
+            ),
+            Relationship(
+                source_collection="posts", source_field="updated_by", target_collection="users"
+            ),
+        ]
+
+        results = await resolver.resolve_batch(documents, relationships)
+
+        assert mock_collection.find.call_count == 1
+        assert results[0]["_relationships"]["created_by"]["name"] == "Alice"
+        assert results[0]["_relationships"]["updated_by"]["name"] == "Bob"
+
+    @pytest.mark.asyncio
+    async def test_resolve_batch_keeps_excluded_target_field(self, resolver, mock_db, mocker):
+        user_id = ObjectId()
+
+        mock_collection = mocker.MagicMock()
+        mock_collection.find.return_value.to_list = mocker.AsyncMock(
+            return_value=[{"_id": user_id, "name": "Alice"}]
+        )
+        mock_db.__getitem__ = mocker.MagicMock(return_value=mock_collection)
+
+        documents = [{"_id": ObjectId(), "user_id": user_id}]
+        relationship = Relationship(
+            source_collection="orders",
+            source_field="user_id",
+            target_collection="users",
+            projection={"name": 1, "_id": 0},
+        )
+
+        results = await resolver.resolve_batch(documents, [relationship])
+
+        assert mock_collection.find.call_args.kwargs["projection"] == {"name": 1, "_id": 1}
+        assert results[0]["_relationships"]["user_id"]["name"] == "Alice"
+
+    @pytest.mark.asyncio
+    async def test_resolve_batch_shared_query_trims_projection(self, resolver, mock_db, mocker):
+        creator_id = ObjectId()
+
+        mock_collection = mocker.MagicMock()
+        mock_collection.find.return_value.to_list = mocker.AsyncMock(
+            return_value=[
+                {
+                    "_id": creator_id,
+                    "name": "Alice",
+                    "email": "a@example.com",
+                    "address": {"city": "Oslo", "zip": "0150"},
+                }
+            ]
+        )
+        mock_db.__getitem__ = mocker.MagicMock(return_value=mock_collection)
+
+        documents = [{"_id": ObjectId(), "created_by": creator_id, "updated_by": creator_id}]
+        relationships = [
+            Relationship(
+                source_collection="posts",
+                source_field="created_by",
+                target_collection="users",
+                projection={"name": 1, "address.city": 1},
+            ),
+            Relationship(
+                source_collection="posts",
+                source_field="updated_by",
+                target_collection="users",
+                projection={"email": 1, "_id": 0},
+            ),
+        ]
+
+        results = await resolver.resolve_batch(documents, relationships)
+
+        assert mock_collection.find.call_count == 1
+        related = results[0]["_relationships"]
+        assert related["created_by"] == {
+            "_id": creator_id, "name": "Alice", "address": {"city": "Oslo"}
+        }
+        assert related["updated_by"] == {"_id": creator_id, "email": "a@example.com"}
+
+    def test_projection_keeps_target_field(self):
+        def projection(target_field, fields):
+            return RelationshipResolver._projection(
+                Relationship("orders", "user_ref", "users", target_field, projection=fields)
+            )
+
+        assert projection("email", {"name": 1}) == {"name": 1, "email": 1}
+        assert projection("email", {"password": 0, "email": 0}) == {"password": 0}
+        assert projection("email", {"email": 0}) is None
+        assert projection("_id", {"password": 0, "_id": 0}) == {"password": 0, "_id": 1}
+
+    @pytest.mark.asyncio
+    async def test_resolve_inplace(self, resolver, mock_db, mocker):
+        user_id = ObjectId()
+
+        mock_collection = mocker.AsyncMock()
+        mock_collection.find_one = mocker.AsyncMock(return_value={"_id": user_id, "name": "Alice"})
+        mock_db.__getitem__ = mocker.MagicMock(return_value=mock_collection)
+
+        document = {"_id": ObjectId(), "user_id": user_id}
+        relationship = Relationship(
+            source_collection="orders", source_field="user_id", target_collection="users"
+        )
+
+        result = await resolver.resolve(document, [relationship], inplace=True)
+
+        assert result is document
+        assert document["_relationships"]["user_id"]["name"] == "Alice"
@@ -0,0 +1,117 @@
+
+from collections import OrderedDict
+from datetime import date, datetime
+
+from bson import Binary, DBRef, ObjectId
+from monglo.serializers import DocumentSerializer, JSONSerializer, TableSerializer
+
+DOC = {
+    "_id": ObjectId(),
+    "at": datetime(2024, 1, 1, 12, 30),
+    "day": date(2024, 1, 2),
+    "ref": DBRef("users", ObjectId(), "shop"),
+    "raw": b"\x01\x02",
+    "bin": Binary(b"\xff"),
+    "nested": {"tags": ["a", 1, 2.5, True, None], "pair": ("x", ObjectId())},
+    "ordered": OrderedDict(b=1),
+}
+
+class TestSerializerDispatch:
+
+    def test_document_fast_path_matches_isinstance_chain(self):
+        serializer = DocumentSerializer()
+
+        assert serializer._serialize_value(DOC) == serializer._serialize_subclass(DOC)
+
+    def test_json_fast_path_matches_isinstance_chain(self):
+        serializer = JSONSerializer()
+
+        assert serializer._serialize_value(DOC) == serializer._serialize_subclass(DOC)
+
+    def test_json_converts_bson_types(self):
+        result = JSONSerializer()._serialize_value(DOC)
+
+        assert result["_id"] == str(DOC["_id"])
+        assert result["bin"] == "ff"
+        assert result["ref"] == {"$ref": "users", "$id": str(DOC["ref"].id), "$db": "shop"}
+        assert result["nested"]["pair"] == ["x", str(DOC["nested"]["pair"][1])]
+
+    def test_json_encoders_agree(self, mocker):
+        serializer = JSONSerializer()
+        data = {k: v for k, v in DOC.items() if k != "ordered"}
+
+        fast = serializer.serialize(data, pretty=True, compact=True)
+        mocker.patch("monglo.serializers.json.orjson", None)
+        stdlib = serializer.serialize(data, pretty=True, compact=True)
+
+        assert fast == stdlib
+
+    def test_orjson_falls_back_for_unsupported_values(self, mocker):
+        serializer = JSONSerializer()
+        data = {"nan": float("nan"), "inf": [float("-inf")], "big": 2**70, "none": None}
+
+        fast = serializer.serialize(data, compact=True)
+        mocker.patch("monglo.serializers.json.orjson", None)
+        stdlib = serializer.serialize(data, compact=True)
+
+        assert fast == stdlib
+        assert fast == '{"nan":NaN,"inf":[-Infinity],"big":1180591620717411303424,"none":null}'
+
+    def test_default_output_uses_stdlib_separators(self):
+        assert JSONSerializer().serialize({"a": [1, "é"]}) == '{"a": [1, "é"]}'
+
+    def test_document_schema_annotations(self):
+        serializer = DocumentSerializer()
+        schema = {"age": {"type": "integer", "nullable": True}, "name": {}}
+
+        first = serializer.serialize({"age": 3, "name": "a", "x": 1}, schema=schema)
+        second = serializer.serialize({"age": 4}, schema=schema)
+        untyped = serializer.serialize({"age": 5}, schema=schema, include_types=False)
+
+        assert first["age"] == {
+            "value": 3,
+            "type": "integer",
+            "metadata": {"nullable": True, "frequency": 1.0},
+        }
+        assert first["name"]["type"] == "string"
+        assert first["x"] == 1
+        assert second["age"]["value"] == 4
+        assert untyped == {"age": 5}
+
+class TestTableSerializer:
+
+    def test_rows_follow_paths_and_formatters(self):
+        oid = ObjectId()
+        serializer = TableSerializer(
+            [
+                {"field": "_id", "formatter": "objectid"},
+                {"field": "owner.name"},
+                {"field": "owner.address.city"},
+                {"field": "total", "formatter": "number"},
+                {"field": "paid", "formatter": "boolean"},
+                {"field": "placed", "formatter": "date"},
+            ]
+        )
+
+        rows = serializer.serialize_rows(
+            [
+                {
+                    "_id": oid,
+                    "owner": {"name": "Ada", "address": "n/a"},
+                    "total": 1234.5,
+                    "paid": 0,
+                    "placed": datetime(2024, 3, 4, 5, 6),
+                },
+                {},
+            ]
+        )
+
+        assert rows[0] == {
+            "_id": str(oid),
+            "owner.name": "Ada",
+            "owner.address.city": None,
+            "total": "1,234.50",
+            "paid": "No",
+            "placed": "2024-03-04",
+        }
+        assert rows[1] == dict.fromkeys(rows[0])
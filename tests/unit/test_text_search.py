@@ -0,0 +1,130 @@
+
+import pytest
+from bson.regex import Regex
+from monglo.operations.search import SearchOperations
+
+@pytest.fixture
+def collection(mocker):
+    collection = mocker.MagicMock()
+    collection.full_name = "shop.articles"
+    collection.count_documents = mocker.AsyncMock(return_value=3)
+    collection.create_index = mocker.AsyncMock(return_value="title_text_body_text")
+    collection.index_information = mocker.AsyncMock(
+        return_value={
+            "_id_": {"key": [("_id", 1)]},
+            "title_text": {"key": [("_fts", "text"), ("_ftsx", 1)]},
+        }
+    )
+    cursor = collection.find.return_value
+    cursor.sort.return_value = cursor
+    cursor.skip.return_value = cursor
+    cursor.limit.return_value = cursor
+    cursor.batch_size.return_value = cursor
+    cursor.to_list = mocker.AsyncMock(return_value=[])
+    return collection
+
+class TestTextSearch:
+
+    async def test_regex_by_default(self, collection):
+        search = SearchOperations(collection, ["title"])
+
+        await search.search("py")
+
+        assert collection.find.call_args[0] == ({"$or": [{"title": Regex("py", "i")}]}, None)
+        collection.index_information.assert_not_called()
+
+    async def test_detected_text_index_uses_text_query(self, collection):
+        search = SearchOperations(collection, ["title", "body"], use_text_index=None)
+
+        await search.search("python")
+        await search.search_count("python")
+
+        text_filter = {"$text": {"$search": "python", "$caseSensitive": False}}
+        assert collection.find.call_args[0] == (text_filter, {"score": {"$meta": "textScore"}})
+        collection.find.return_value.sort.assert_called_with([("score", {"$meta": "textScore"})])
+        collection.count_documents.assert_called_with(text_filter)
+        collection.index_information.assert_called_once()
+
+    async def test_regex_fallback_without_text_index(self, collection):
+        collection.index_information.return_value = {"_id_": {"key": [("_id", 1)]}}
+        search = SearchOperations(collection, ["title"], use_text_index=None)
+
+        await search.search("py")
+
+        assert collection.find.call_args[0] == ({"$or": [{"title": Regex("py", "i")}]}, None)
+
+    async def test_refresh_picks_up_dropped_index(self, collection):
+        search = SearchOperations(collection, ["title"], use_text_index=None)
+        await search.search_count("py")
+
+        collection.index_information.return_value = {"_id_": {"key": [("_id", 1)]}}
+        assert await search.refresh_text_index() is False
+        await search.search_count("py")
+
+        collection.count_documents.assert_called_with({"$or": [{"title": Regex("py", "i")}]})
+
+    async def test_create_text_index(self, collection):
+        collection.index_information.return_value = {}
+        search = SearchOperations(collection, ["title", "body"], use_text_index=None)
+
+        await search.create_text_index({"title": 10})
+        await search.search("py")
+
+        collection.create_index.assert_called_once_with(
+            [("title", "text"), ("body", "text")], weights={"title": 10}
+        )
+        collection.index_information.assert_not_called()
+
+    async def test_prefix_only_anchors_and_escapes(self, collection):
+        search = SearchOperations(collection, ["sku"], use_text_index=False, prefix_only=True)
+
+        await search.search_count("A.1", case_sensitive=True)
+
+        collection.count_documents.assert_called_with({"$or": [{"sku": Regex("^A\\.1")}]})
+
+    async def test_highlight_runs_on_server(self, collection, mocker):
+        collection.aggregate.return_value.to_list = mocker.AsyncMock(return_value=[])
+        search = SearchOperations(collection, ["title", "body"], use_text_index=False)
+
+        await search.search_with_highlight("c++", limit=10, skip=20)
+
+        pipeline = collection.aggregate.call_args[0][0]
+        assert [next(iter(stage)) for stage in pipeline] == ["$match", "$skip", "$limit", "$addFields"]
+        flagged = pipeline[-1]["$addFields"]["_matched_fields"]["$filter"]["input"]
+        assert [cond["$cond"][1] for cond in flagged] == ["title", "body"]
+        assert flagged[0]["$cond"][0]["$regexMatch"]["regex"] == "c\\+\\+"
+        collection.find.assert_not_called()
+
+    async def test_paginated_runs_page_and_count(self, collection):
+        collection.find.return_value.to_list.return_value = [{"_id": 1}]
+        search = SearchOperations(collection, ["title"], use_text_index=None)
+
+        result = await search.search_paginated("py", page=3, per_page=20)
+
+        collection.find.return_value.skip.assert_called_once_with(40)
+        collection.index_information.assert_awaited_once()
+        collection.aggregate.assert_not_called()
+        assert result == {"items": [{"_id": 1}], "total": 3, "page": 3, "per_page": 20, "pages": 1}
+
+    async def test_fused_paginated_uses_single_facet(self, collection, mocker):
+        collection.aggregate.return_value.to_list = mocker.AsyncMock(
+            return_value=[{"items": [{"_id": 1}], "total": [{"n": 41}]}]
+        )
+        search = SearchOperations(collection, ["title"], use_text_index=False)
+
+        result = await search.search_paginated("py", page=3, per_page=20, fuse=True)
+
+        facet = collection.aggregate.call_args[0][0][-1]["$facet"]
+        assert facet["items"] == [{"$skip": 40}, {"$limit": 20}]
+        assert result == {"items": [{"_id": 1}], "total": 41, "page": 3, "per_page": 20, "pages": 3}
+        collection.count_documents.assert_not_called()
+
+    async def test_search_page_in_one_batch_with_projection(self, collection):
+        search = SearchOperations(
+            collection, ["title"], use_text_index=True, projection={"title": 1}
+        )
+
+        await search.search("py", limit=250)
+
+        assert collection.find.call_args[0][1] == {"title": 1, "score": {"$meta": "textScore"}}
+        collection.find.return_value.batch_size.assert_called_once_with(250)
@@ -0,0 +1,39 @@
+
+import pytest
+from monglo.operations.validation import DataValidator, _holds_value
+
+class TestHoldsValue:
+
+    def test_paths_through_arrays_of_subdocuments(self):
+        document = {"items": [{"sku": "a"}, {"sku": "b", "tags": ["x"]}], "meta": {"code": 1}}
+
+        assert _holds_value(document, "items.sku", "b")
+        assert _holds_value(document, "items.tags", "x")
+        assert _holds_value(document, "items.1.sku", "b")
+        assert not _holds_value(document, "items.0.sku", "b")
+        assert _holds_value(document, "meta.code", 1)
+        assert not _holds_value(document, "items.sku", "z")
+
+class TestUniqueConstraints:
+
+    @pytest.fixture
+    def admin(self, mocker):
+        admin = mocker.MagicMock()
+        admin.config = mocker.Mock(
+            required_fields=None, fields=None, unique_fields=["email", "lines.code"]
+        )
+        return admin
+
+    async def test_duplicates_of_one_field_do_not_hide_another(self, admin, mocker):
+        existing = [{"email": "a@x.io"}, {"email": "a@x.io"}, {"lines": [{"code": "c1"}]}]
+
+        async def cursor():
+            for document in existing:
+                yield document
+
+        # A bare async iterator has no limit(), so the query must run unlimited
+        admin.collection.find.return_value = cursor()
+
+        errors = await DataValidator(admin).validate({"email": "a@x.io", "lines.code": "c1"})
+
+        assert [error["field"] for error in errors] == ["email", "lines.code"]